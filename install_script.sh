@@ -137,7 +137,7 @@ for package in "${packages[@]}"; do
 done
 
 echo_step "Installing PyAutoGUI and dependencies in specific order"
-$VENV_PYTHON -m pip uninstall -y pyautogui mouseinfo pygetwindow pymsgbox pyperclip pyscreeze pytweening python3-xlib python-xlib pyclick
+$VENV_PYTHON -m pip uninstall -y pyautogui mouseinfo pygetwindow pymsgbox pyperclip pyscreeze pytweening python3-xlib python-xlib
 
 packages=(
     "python-xlib==0.33"
@@ -150,7 +150,6 @@ packages=(
     "pyscreeze==0.1.28"
     "pynput==1.7.6"
     "PyAutoGUI==0.9.53"
-    "pyclick==0.0.2"
 )
 
 # Install dependencies in order
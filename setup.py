@@ -5,6 +5,7 @@ setup(
     version="0.1",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={"utilities.api": ["item_db.bin"]},
     install_requires=[
         'numpy',
         'opencv-python',
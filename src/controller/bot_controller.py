@@ -23,7 +23,7 @@ class BotController(object):
             # Get the module name from the model's class
             module_name = self.model.__class__.__module__
             # Stop the current bot if running
-            if self.model.status == BotStatus.RUNNING:
+            if self.model.status in (BotStatus.RUNNING, BotStatus.PAUSED):
                 self.model.stop()
             # Reload the module
             module = sys.modules[module_name]
@@ -44,12 +44,27 @@ class BotController(object):
 
     def play(self):
         """
-        Play/pause btn clicked on view.
+        Play btn clicked on view.
         """
+        if self.model.status == BotStatus.PAUSED:
+            self.model.resume()
+            return
         # Reload the model before playing
         self.reload_model()
         self.model.play()
 
+    def pause(self):
+        """
+        Pause btn clicked on view.
+        """
+        self.model.pause()
+
+    def resume(self):
+        """
+        Resume btn clicked on view.
+        """
+        self.model.resume()
+
     def stop(self):
         """
         Stop btn clicked on view.
@@ -93,6 +108,8 @@ class BotController(object):
         status = self.model.status
         if status == BotStatus.RUNNING:
             self.view.frame_info.update_status_running()
+        elif status == BotStatus.PAUSED:
+            self.view.frame_info.update_status_paused()
         elif status == BotStatus.STOPPED:
             self.view.frame_info.update_status_stopped()
         elif status == BotStatus.CONFIGURING:
@@ -3,24 +3,29 @@ A Bot is a base class for bot script models. It is abstract and cannot be instan
 pre-implemented and can be used by subclasses, or called by the controller. Code in this class should not be modified.
 """
 import ctypes
+import pathlib
 import platform
 import re
 import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
-from enum import Enum
-from typing import List, Union
+from enum import Enum, IntEnum
+from typing import Callable, List, Union
 
 import customtkinter
 import numpy as np
 import pyautogui as pag
-import pytweening
 from deprecated import deprecated
 
+import utilities.cancellation as cancellation
 import utilities.color as clr
+import utilities.context_menu as menu
 import utilities.debug as debug
+import utilities.drop_planner as drop_planner
 import utilities.imagesearch as imsearch
+import utilities.input_backend as input_backend
+import utilities.input_executor as input_executor
 import utilities.ocr as ocr
 import utilities.random_util as rd
 from utilities.geometry import Point, Rectangle
@@ -32,14 +37,18 @@ warnings.filterwarnings("ignore", category=UserWarning)
 
 
 class BotThread(threading.Thread):
-    def __init__(self, target: callable):
+    def __init__(self, target: callable, token: cancellation.CancellationToken = None):
         threading.Thread.__init__(self)
         self.target = target
+        self.token = token or cancellation.CancellationToken()
 
     def run(self):
+        cancellation.bind(self.token)
         try:
             print("Thread started.")
             self.target()
+        except cancellation.Cancelled:
+            pass
         finally:
             print("Thread stopped successfully.")
 
@@ -51,8 +60,22 @@ class BotThread(threading.Thread):
             if thread is self:
                 return id
 
-    def stop(self):
-        """Raises SystemExit exception in the thread. This can be called from the main thread followed by join()."""
+    def stop(self, timeout: float = 2.0):
+        """
+        Asks the thread to stop at its next checkpoint (any framework sleep, wait or mouse action). This can be
+        called from the main thread followed by join(). If the thread has not stopped within the timeout (E.g.,
+        it is inside a long time.sleep()), falls back to raising SystemExit in it. When called from the bot
+        thread itself, raises Cancelled immediately.
+        """
+        self.token.cancel()
+        if threading.current_thread() is self:
+            raise cancellation.Cancelled()
+        self.join(timeout)
+        if self.is_alive():
+            self.__raise_system_exit()
+
+    def __raise_system_exit(self):
+        """Raises SystemExit exception in the thread."""
         thread_id = self.__get_id()
         if platform.system() == "Windows":
             res = ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, ctypes.py_object(SystemExit))
@@ -78,9 +101,22 @@ class BotStatus(Enum):
     CONFIGURED = 5
 
 
+class LogLevel(IntEnum):
+    """
+    LogLevel enum. Messages below a bot's log_level are discarded before they are formatted.
+    """
+
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
 class Bot(ABC):
     mouse = Mouse()
     options_set: bool = False
+    log_level: LogLevel = LogLevel.INFO
+    drop_pattern: str = "snake"  # Order drop_all and drop visit slots in. See drop_planner.drop_order()
     progress: float = 0
     status = BotStatus.STOPPED
     thread: BotThread = None
@@ -101,6 +137,12 @@ class Bot(ABC):
         self.description = description
         self.options_builder = OptionsBuilder(bot_title)
         self.win = window
+        self.mouseover_watchers = {}
+        # Queues mouse/keyboard actions on their own thread so perception can run while the cursor moves. The Mouse is
+        # looked up per action, so replacing self.mouse (E.g., with the replay harness's) also redirects queued input.
+        self.inputs = input_executor.InputExecutor(lambda: self.mouse)
+        # Recent debug frames/masks, written to disk only on save or when dump() is called
+        self.debug_sink = debug.DebugSink(pathlib.Path("debug_screenshots", re.sub(r"\W+", "_", bot_title.lower()).strip("_")))
 
     @abstractmethod
     def main_loop(self):
@@ -154,14 +196,35 @@ class Bot(ABC):
                 return
             self.reset_progress()
             self.set_status(BotStatus.RUNNING)
-            self.thread = BotThread(target=self.main_loop)
+            token = cancellation.CancellationToken(
+                on_pause=lambda: self.set_status(BotStatus.PAUSED),
+                on_resume=lambda: self.set_status(BotStatus.RUNNING),
+            )
+            self.thread = BotThread(target=self.__run_main_loop, token=token)
             self.thread.setDaemon(True)
             self.thread.start()
+        elif self.status == BotStatus.PAUSED:
+            self.resume()
         elif self.status == BotStatus.RUNNING:
             self.log_msg("Bot is already running.")
         elif self.status == BotStatus.CONFIGURING:
             self.log_msg("Please finish configuring the bot before starting.")
 
+    def __run_main_loop(self):
+        """
+        Runs the main loop, dumping the recent debug images if it crashes. The input thread is stopped when the loop
+        ends, and started again by the next run's first action.
+        """
+        try:
+            self.main_loop()
+        except Exception:
+            folder = self.debug_sink.dump("crash")
+            if folder is not None:
+                self.log_msg(f"Bot crashed. Recent debug images saved to {folder}")
+            raise
+        finally:
+            self.inputs.shutdown()
+
     def __initialize_window(self):
         """
         Attempts to focus and initialize the game window by identifying core UI elements.
@@ -170,6 +233,27 @@ class Bot(ABC):
         time.sleep(0.5)
         self.win.initialize()
 
+    def pause(self):
+        """
+        Fired when the user pauses the bot manually. The bot suspends at its next checkpoint, releasing any keys it
+        holds, and its status changes to PAUSED once it has.
+        """
+        if self.status != BotStatus.RUNNING or self.thread is None:
+            self.log_msg("Bot is not running.")
+            return
+        self.log_msg("Pausing script...")
+        self.thread.token.pause()
+
+    def resume(self):
+        """
+        Fired when the user resumes a paused bot.
+        """
+        if self.thread is None or not self.thread.token.paused:
+            self.log_msg("Bot is not paused.")
+            return
+        self.log_msg("Resuming script.")
+        self.thread.token.resume()
+
     def stop(self):
         """
         Fired when the user stops the bot manually.
@@ -216,16 +300,39 @@ class Bot(ABC):
         self.status = status
         self.controller.update_status()
 
-    def log_msg(self, msg: str, overwrite=False):
+    def log_msg(self, msg: Union[str, Callable[[], str]], *args, overwrite=False, level: LogLevel = LogLevel.INFO):
         """
-        Sends a message to the controller to be displayed in the log for the user.
+        Sends a message to the controller to be displayed in the log for the user. Messages below the bot's
+        log_level are dropped before any formatting happens, so pass values as %-style args or the message
+        as a lambda rather than building an f-string that may never be shown.
         Args:
-            msg: str - message to log
+            msg: str - message to log, optionally with %-style placeholders. May also be a function returning the message.
+            args: values for the placeholders in msg.
             overwrite: bool - if True, overwrites the current log message. If False, appends to the log.
-        """
-        msg = f"{debug.current_time()}: {msg}"
+            level: LogLevel - the importance of the message.
+        Example:
+            self.log_msg("Found %d rocks", len(rocks))
+            self.log_msg(lambda: f"Markers: {np.unique(markers)}", level=LogLevel.DEBUG)
+        """
+        if level < self.log_level:
+            return
+        if callable(msg):
+            msg = msg()
+        elif args:
+            msg = msg % args
+        if level == LogLevel.INFO:
+            msg = f"{debug.current_time()}: {msg}"
+        else:
+            msg = f"{debug.current_time()} [{level.name}]: {msg}"
         self.controller.update_log(msg, overwrite)
 
+    def log_debug(self, msg: Union[str, Callable[[], str]], *args):
+        """
+        Logs a message at LogLevel.DEBUG. It is only formatted and shown if the bot's log_level is DEBUG.
+        """
+        if self.log_level <= LogLevel.DEBUG:
+            self.log_msg(msg, *args, level=LogLevel.DEBUG)
+
     def clear_log(self):
         """
         Requests the controller to tell the UI to clear the log.
@@ -247,22 +354,8 @@ class Bot(ABC):
         if skip_rows > 0:
             row_skip = list(range(skip_rows * 4))
             skip_slots = np.unique(row_skip + skip_slots)
-        # Start dropping
-        pag.keyDown("shift")
-        for i, slot in enumerate(self.win.inventory_slots):
-            if i in skip_slots:
-                continue
-            p = slot.random_point()
-            self.mouse.move_to(
-                (p[0], p[1]),
-                mouseSpeed="fast",
-                knotsCount=1,
-                offsetBoundaryY=40,
-                offsetBoundaryX=40,
-                tween=pytweening.easeInOutQuad,
-            )
-            self.mouse.click()
-        pag.keyUp("shift")
+        slots = [i for i in range(len(self.win.inventory_slots)) if i not in skip_slots]
+        self.__drop_slots(slots, speed="fast")
 
     def drop(self, slots: List[int]) -> None:
         """
@@ -271,21 +364,14 @@ class Bot(ABC):
             slots: The indices of slots to drop.
         """
         self.log_msg("Dropping items...")
-        pag.keyDown("shift")
-        for i, slot in enumerate(self.win.inventory_slots):
-            if i not in slots:
-                continue
-            p = slot.random_point()
-            self.mouse.move_to(
-                (p[0], p[1]),
-                mouseSpeed="fastest",
-                knotsCount=1,
-                offsetBoundaryY=40,
-                offsetBoundaryX=40,
-                tween=pytweening.easeInOutQuad,
-            )
-            self.mouse.click()
-        pag.keyUp("shift")
+        self.__drop_slots(slots, speed="fastest")
+
+    def __drop_slots(self, slots: List[int], speed: str) -> None:
+        """
+        Plans the whole drop up front (slot order, click points and cursor paths), then plays it on the input thread.
+        """
+        steps = drop_planner.plan_drops(self.win.inventory_slots, slots, start=input_backend.position(), speed=speed, pattern=self.drop_pattern)
+        self.inputs.submit(drop_planner.play_drops, self.mouse, steps).result()
 
     def friends_nearby(self) -> bool:
         """
@@ -307,7 +393,7 @@ class Bot(ABC):
         self.log_msg("Logging out...")
         self.mouse.move_to(self.win.cp_tabs[10].random_point())
         self.mouse.click()
-        time.sleep(1)
+        cancellation.sleep(1)
         self.mouse.move_rel(0, -53, 5, 5)
         self.mouse.click()
 
@@ -328,7 +414,7 @@ class Bot(ABC):
         length = round(length)
         for i in range(length):
             self.log_msg(f"Taking a break... {int(length) - i} seconds left.", overwrite=True)
-            time.sleep(1)
+            cancellation.sleep(1)
         self.log_msg(f"Done taking {length} second break.", overwrite=True)
 
     # --- Player Status Functions ---
@@ -411,6 +497,33 @@ class Bot(ABC):
             True if exact string is found, False otherwise.
             If args are left blank, returns the text in the mouseover area.
         """
+        watcher = self.__mouseover_watcher(color)
+        if contains is None:
+            return watcher.text()
+        return watcher.contains(contains)
+
+    def wait_for_mouseover(
+        self,
+        contains: Union[str, List[str]],
+        timeout: float = 1.0,
+        color: Union[clr.Color, List[clr.Color]] = None,
+    ) -> bool:
+        """
+        Waits for the mouseover text to contain some text. Returns the moment it appears. Reads in between only
+        run OCR when the mouseover area has changed.
+        Args:
+            contains: The text to search for (single word, phrase, or list of words). Case sensitive.
+            timeout: The maximum number of seconds to wait.
+            color: The color(s) to isolate. If left blank, isolates all expected colors.
+        Returns:
+            True if the text appeared before the timeout, False otherwise.
+        """
+        return self.__mouseover_watcher(color).wait_for(contains, timeout)
+
+    def __mouseover_watcher(self, color: Union[clr.Color, List[clr.Color]] = None) -> ocr.TextWatcher:
+        """
+        Gets the TextWatcher for the mouseover area and the given color(s), creating it if needed.
+        """
         if color is None:
             color = [
                 clr.OFF_CYAN,
@@ -419,9 +532,14 @@ class Bot(ABC):
                 clr.OFF_WHITE,
                 clr.OFF_YELLOW,
             ]
-        if contains is None:
-            return ocr.extract_text(self.win.mouseover, ocr.BOLD_12, color)
-        return bool(ocr.find_text(contains, self.win.mouseover, ocr.BOLD_12, color))
+        colors = color if isinstance(color, list) else [color]
+        key = tuple(id(c) for c in colors)
+        watcher = self.mouseover_watchers.get(key)
+        # Re-initializing the window creates a new mouseover Rectangle, which invalidates the old watchers
+        if watcher is None or watcher.rect is not self.win.mouseover:
+            watcher = ocr.TextWatcher(self.win.mouseover, ocr.BOLD_12, colors)
+            self.mouseover_watchers[key] = watcher
+        return watcher
 
     def chatbox_text(self, contains: str = None) -> Union[bool, str]:
         """
@@ -452,6 +570,37 @@ class Bot(ABC):
             return ocr.extract_text(self.win.chat, ocr.PLAIN_12, clr.BLACK)
         return ocr.find_text(contains, self.win.chat, ocr.PLAIN_12, clr.BLACK)
 
+    def choose_menu_option(self, action: str, target: Union[str, List[str]] = None, mouseSpeed: str = "medium") -> bool:
+        """
+        Selects an entry from the currently open right-click menu. The area around the cursor is captured once and
+        each menu row is read a single time.
+        Args:
+            action: The action to select (E.g., "Take"), or the full entry text if it has no target (E.g., "Look North").
+            target: The target(s) of the action (E.g., "Coins" or ["Coins", "Bones"]). If None, any target matches.
+            mouseSpeed: The speed to move the mouse to the entry at.
+        Returns:
+            True if the entry was found and clicked, False otherwise.
+        """
+        entries = menu.read_menu(self.__menu_search_area())
+        if entry := menu.find_entry(entries, action, target):
+            self.mouse.move_to(entry.rect.random_point(), mouseSpeed=mouseSpeed)
+            self.mouse.click()
+            return True
+        return False
+
+    def __menu_search_area(self) -> Rectangle:
+        """
+        Returns a Rectangle around the cursor that is large enough to contain any right-click menu opened at the
+        cursor's position, clipped to the client window.
+        """
+        x, y = input_backend.position()
+        pad_x, pad_y = 300, menu.HEADER_HEIGHT + menu.ROW_HEIGHT * 20
+        left, top, right, bottom = x - pad_x, y - pad_y, x + pad_x, y + pad_y
+        if client := self.win.rectangle():
+            left, top = max(left, client.left), max(top, client.top)
+            right, bottom = min(right, client.left + client.width), min(bottom, client.top + client.height)
+        return Rectangle.from_points(Point(left, top), Point(right, bottom))
+
     # --- Client Settings ---
     def set_compass_north(self):
         self.log_msg("Setting compass North...")
@@ -459,18 +608,21 @@ class Bot(ABC):
         self.mouse.click()
 
     def set_compass_west(self):
-        self.__compass_right_click("Setting compass West...", 72)
+        self.__compass_right_click("Setting compass West...", "Look West", 72)
 
     def set_compass_east(self):
-        self.__compass_right_click("Setting compass East...", 43)
+        self.__compass_right_click("Setting compass East...", "Look East", 43)
 
     def set_compass_south(self):
-        self.__compass_right_click("Setting compass South...", 57)
+        self.__compass_right_click("Setting compass South...", "Look South", 57)
 
-    def __compass_right_click(self, msg, rel_y):
+    def __compass_right_click(self, msg, option, rel_y):
         self.log_msg(msg)
         self.mouse.move_to(self.win.compass_orb.random_point())
         self.mouse.right_click()
+        if self.choose_menu_option(option, mouseSpeed="fast"):
+            return
+        # Fall back to the known offset of the option if the menu couldn't be read
         self.mouse.move_rel(0, rel_y, 5, 2)
         self.mouse.click()
 
@@ -498,24 +650,13 @@ class Bot(ABC):
         direction_h = "right" if horizontal < 0 else "left"
         direction_v = "down" if vertical < 0 else "up"
 
-        def keypress(direction, duration):
-            pag.keyDown(direction)
-            time.sleep(duration)
-            pag.keyUp(direction)
-
-        thread_h = threading.Thread(target=keypress, args=(direction_h, sleep_h), daemon=True)
-        thread_v = threading.Thread(target=keypress, args=(direction_v, sleep_v), daemon=True)
+        # The shorter rotation starts after a random delay, overlapping the longer one
         delay = rd.fancy_normal_sample(0, max(sleep_h, sleep_v))
         if sleep_h > sleep_v:
-            thread_h.start()
-            time.sleep(delay)
-            thread_v.start()
+            holds = [(direction_h, 0, sleep_h), (direction_v, delay, sleep_v)]
         else:
-            thread_v.start()
-            time.sleep(delay)
-            thread_h.start()
-        thread_h.join()
-        thread_v.join()
+            holds = [(direction_v, 0, sleep_v), (direction_h, delay, sleep_h)]
+        input_executor.hold_keys([hold for hold in holds if hold[2] > 0])
 
     def toggle_auto_retaliate(self, toggle_on: bool):
         """
@@ -98,33 +98,53 @@ class AgilityBot(OSRSBot):
         """
         Casts Camelot teleport spell
         """
-        self.log_msg("Casting Camelot Teleport...")
-        
-        # Use exact coordinates for Camelot teleport
-        teleport_point = Point(1751, 870)
-        self.log_msg(f"Clicking Camelot teleport at: {teleport_point}")
-        self.mouse.move_to(teleport_point)
-        self.mouse.click()
-        
-        time.sleep(4)  # Wait for teleport animation
-        self.stuck_counter = 0
-        self.no_obstacle_count = 0
+        self.cast_teleport("Camelot Teleport")
 
     def cast_varrock_teleport(self):
         """
-        Casts Camelot teleport spell
+        Casts Varrock teleport spell
         """
-        self.log_msg("Casting Camelot Teleport...")
-        
-        # Use exact coordinates for Camelot teleport
-        teleport_point = Point(1751, 829)
-        self.log_msg(f"Clicking Camelot teleport at: {teleport_point}")
-        self.mouse.move_to(teleport_point)
+        self.cast_teleport("Varrock Teleport")
+
+    def cast_teleport(self, spell: str) -> bool:
+        """
+        Casts a teleport spell from the normal spellbook. The spell's slot is looked up by name, and the spellbook
+        is checked against its sprites once per session rather than on every cast. If the slot can't be verified,
+        the spell's sprite is searched for in the control panel instead, opening the spellbook first if needed. The
+        cast is skipped rather than clicking a slot that could not be verified (E.g., when the sprites have not been
+        fetched with `python src/utilities/slot_tables.py fetch`).
+        Args:
+            spell: The spell name as shown in game (E.g., "Camelot Teleport").
+        Returns:
+            True if the spell was cast, False if it could not be found.
+        """
+        self.log_msg(f"Casting {spell}...")
+        rect = self.__find_spell(spell)
+        if rect is None:
+            self.log_msg("Opening spellbook...")
+            self.mouse.move_to(self.win.cp_tabs[6].random_point())
+            self.mouse.click()
+            time.sleep(0.5)
+            rect = self.__find_spell(spell)
+        if rect is None:
+            self.log_msg(f"{spell} could not be verified in the spellbook (are its sprites fetched?). Skipping the cast.")
+            return False
+        self.mouse.move_to(rect.random_point())
         self.mouse.click()
-        
+
         time.sleep(4)  # Wait for teleport animation
         self.stuck_counter = 0
         self.no_obstacle_count = 0
+        return True
+
+    def __find_spell(self, spell: str) -> Rectangle:
+        """
+        Returns the Rectangle to click for a spell: its table slot if the spellbook was verified, otherwise wherever
+        its sprite is found in the control panel, or None.
+        """
+        if spell not in self.win.verify_slots("spell"):
+            return self.win.spell(spell)
+        return self.win.locate_slot("spell", spell)
 
     def is_character_moving(self):
         """
@@ -195,7 +215,7 @@ class AgilityBot(OSRSBot):
             if total_blue_area > 1000:
                 debug_img = game_view.copy()
                 cv2.drawContours(debug_img, contours, -1, (255, 0, 0), 2)
-                cv2.imwrite("debug_end_blue.png", debug_img)
+                self.debug_sink.capture("end_blue", debug_img, save=True)
                 
                 self.log_msg("Course end detected (blue tiles found)")
                 self.obstacle_count = 0  # Reset counter
@@ -404,9 +424,9 @@ class AgilityBot(OSRSBot):
                         self.no_obstacle_count += 1
                         if self.no_obstacle_count > 5:
                             self.log_msg("No obstacles found for too long! Stopping bot...")
-                            # Take final debug screenshot
-                            debug_img = self.win.game_view.screenshot()
-                            cv2.imwrite("debug_no_obstacles_final.png", debug_img)
+                            # Save the final view along with the recent searches
+                            self.debug_sink.capture("no_obstacles_final", self.win.game_view.screenshot())
+                            self.debug_sink.dump("no_obstacles")
                             self.status = BotStatus.STOPPED
                             break
                         time.sleep(1.5)
@@ -418,9 +438,9 @@ class AgilityBot(OSRSBot):
                 fails += 1
                 if fails > 5:
                     self.log_msg("Too many errors, stopping bot...")
-                    # Take final debug screenshot
-                    debug_img = self.win.game_view.screenshot()
-                    cv2.imwrite("debug_error_final.png", debug_img)
+                    # Save the final view along with the recent searches
+                    self.debug_sink.capture("error_final", self.win.game_view.screenshot())
+                    self.debug_sink.dump("errors")
                     self.status = BotStatus.STOPPED
                     break
                 time.sleep(1.5)
@@ -435,7 +455,7 @@ class AgilityBot(OSRSBot):
         
         # Isolate green color
         green_mask = clr.isolate_colors(game_view, [self.obstacle_color])
-        cv2.imwrite("debug_obstacle_mask.png", green_mask)
+        self.debug_sink.capture("obstacle_mask", green_mask)
         
         # Find contours in the mask
         contours, _ = cv2.findContours(green_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -529,7 +549,7 @@ class AgilityBot(OSRSBot):
         
         # Create and save color mask
         continue_mask = clr.isolate_colors(game_view, [color])
-        cv2.imwrite(f"debug_continue{continue_num}_mask.png", continue_mask)
+        self.debug_sink.capture(f"continue{continue_num}_mask", continue_mask)
         
         contours, _ = cv2.findContours(continue_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
@@ -539,7 +559,7 @@ class AgilityBot(OSRSBot):
             # Draw all contours on debug image
             debug_img = game_view.copy()
             cv2.drawContours(debug_img, contours, -1, (0, 255, 0), 2)
-            cv2.imwrite(f"debug_continue{continue_num}_contours.png", debug_img)
+            self.debug_sink.capture(f"continue{continue_num}_contours", debug_img)
             
             # Filter and sort contours by area
             valid_contours = []
@@ -563,7 +583,7 @@ class AgilityBot(OSRSBot):
                 
                 # Draw selected contour in different color
                 cv2.drawContours(debug_img, [continue_contour], -1, (0, 0, 255), 3)
-                cv2.imwrite(f"debug_continue{continue_num}_selected.png", debug_img)
+                self.debug_sink.capture(f"continue{continue_num}_selected", debug_img)
                 
                 # Translate coordinates relative to game window
                 game_view_rect = self.win.game_view
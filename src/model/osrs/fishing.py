@@ -169,7 +169,7 @@ class FishingBot(OSRSBot, launcher.Launchable):
 
         except Exception as e:
             self.log_msg(f"Error in main loop: {str(e)}")
-            self.log_msg("Stack trace:", str(e.__traceback__))
+            self.log_msg("Stack trace: %s", str(e.__traceback__))
         finally:
             elapsed_time = (time.time() - start_time) / 60
             self.log_msg(f"Bot stopped after running for {elapsed_time:.1f} minutes")
@@ -243,11 +243,9 @@ class FishingBot(OSRSBot, launcher.Launchable):
         Takes a screenshot and saves it with timestamp and reason
         """
         try:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"debug_{reason}_{timestamp}.png"
-
-            # Save screenshot of game view
-            self.win.game_view.screenshot().save(filename)
-            self.log_msg(f"Debug screenshot saved: {filename}")
+            # Save the game view along with the recent frames kept by the debug sink
+            self.debug_sink.capture(f"debug_{reason}", self.win.game_view.screenshot())
+            folder = self.debug_sink.dump(reason)
+            self.log_msg(f"Debug screenshots saved to: {folder}")
         except Exception as e:
             self.log_msg(f"Error taking debug screenshot: {str(e)}")
@@ -1,6 +1,5 @@
 import time
 from typing import Union, Optional, List, Dict, Any, cast
-import os
 import traceback
 from typing import TYPE_CHECKING
 
@@ -12,9 +11,10 @@ import utilities.color as clr
 import utilities.game_launcher as launcher
 import utilities.imagesearch as imsearch
 import utilities.random_util as rd
+import utilities.runelite_cv as rcv
 from model.osrs.osrs_bot import OSRSBot, validate_types
 from utilities.geometry import Point, Rectangle
-from model.bot import BotStatus
+from model.bot import BotStatus, LogLevel
 from typing_extensions import TypeGuard
 from utilities.type_utils import validate_module_attributes
 
@@ -55,10 +55,10 @@ class OSRSMining(OSRSBot):
         self.attempts_before_drop: int = 22
         self.drop_chance: float = 0.1  # Default 10% chance to drop
         self.debug_mode: bool = False  # Default to False, can be enabled through options
+        self.segmenter = rcv.Segmenter()  # Reuses its buffers between searches
         
-        # Create debug directory if it doesn't exist
-        self.debug_dir: str = "debug_screenshots/mining"
-        os.makedirs(self.debug_dir, exist_ok=True)
+        # Debug images are written in the background by self.debug_sink, which creates this directory on first write
+        self.debug_dir: str = str(self.debug_sink.directory)
 
     def create_options(self) -> None:
         """Set up the bot's options menu."""
@@ -92,6 +92,7 @@ class OSRSMining(OSRSBot):
                 self.drop_chance = float(options[option]) / 100.0  # Convert percentage to decimal
             elif option == "debug_mode":
                 self.debug_mode = options[option] != []
+                self.log_level = LogLevel.DEBUG if self.debug_mode else LogLevel.INFO
             else:
                 self.log_msg(f"Unknown option: {option}")
 
@@ -147,35 +148,33 @@ class OSRSMining(OSRSBot):
                     continue
                 
                 self.log_msg(f"=== Starting rock search cycle ({attempts}/{self.attempts_before_drop} attempts) ===")
-                if self.debug_mode:
-                    self.log_msg("Calling find_nearest_rock...")
-                    
+                self.log_debug("Calling find_nearest_rock...")
                 rock_point = self.find_nearest_rock()
                 
-                if self.debug_mode:
-                    self.log_msg(f"find_nearest_rock returned: {rock_point}")
+                self.log_debug("find_nearest_rock returned: %s", rock_point)
                     
                 if rock_point:
+                    self.failed_searches = 0
                     assert isinstance(rock_point, Point), "find_nearest_rock returned non-Point type"
                     self.log_msg(f"Moving mouse to rock at: {rock_point}")
                     
-                    # Move mouse to rock
-                    self.mouse.move_to(rock_point, mouseSpeed="medium")
-                    time.sleep(0.5)  # Wait after movement
-                    
-                    # Verify we can click
-                    if not self.mouseover_text(contains="Mine"):
+                    # Move to the rock, verify we can click (returns as soon as the mouseover text updates)
+                    # and click, all in one input action
+                    clicked = self.inputs.move_click(
+                        rock_point,
+                        verify=lambda: self.wait_for_mouseover("Mine", timeout=0.5),
+                        mouseSpeed="medium",
+                    )
+                    if not clicked.result():
                         self.log_msg("No mine option found, skipping...")
                         time.sleep(1)
                         continue
                     
-                    # Click and wait for mining
-                    self.mouse.click()
+                    # Wait for mining
                     attempts += 1
                     time.sleep(0.5)  # Wait after click
                     
-                    if self.debug_mode:
-                        self.log_msg("Mouse clicked, waiting for mining...")
+                    self.log_debug("Mouse clicked, waiting for mining...")
                         
                     if self.wait_for_mining_completion():
                         self.ores_mined += 1
@@ -185,12 +184,18 @@ class OSRSMining(OSRSBot):
                         self.take_break()
                 else:
                     self.log_msg("No valid rocks found this cycle")
+                    self.failed_searches += 1
+                    if self.failed_searches >= 5:
+                        folder = self.debug_sink.dump("no_rocks")
+                        if folder is not None:
+                            self.log_msg(f"Saved recent searches to {folder}")
+                        self.failed_searches = 0
                     if self.debug_mode:
                         self.debug_rock_detection()  # Run detection visualization on failures
                     time.sleep(1)
                 
                 progress: float = (time.time() - start_time) / end_time
-                self.log_msg(f"Progress: {progress*100:.1f}%")
+                self.log_debug("Progress: %.1f%%", progress * 100)
                 self.update_progress(progress)
                 
                 if self.should_break():
@@ -271,16 +276,14 @@ class OSRSMining(OSRSBot):
             reason (str): Reason for taking screenshot, used in filename
         """
         try:
-            timestamp: str = time.strftime("%Y%m%d_%H%M%S")
-            filename: str = os.path.join(self.debug_dir, f"debug_{reason}_{timestamp}.png")
             screenshot = self.win.game_view.screenshot()
             if screenshot is not None:
-                cv2.imwrite(filename, screenshot)
-                self.log_msg(f"Debug screenshot saved: {filename}")
+                self.debug_sink.capture(f"debug_{reason}", screenshot, save=True)
+                self.log_msg(f"Debug screenshot queued: {reason}")
         except Exception as e:
             self.log_msg(f"Error taking debug screenshot: {str(e)}")
 
-    def separate_rocks(self, mask: np.ndarray) -> np.ndarray:
+    def separate_rocks(self, mask: np.ndarray) -> List[rcv.Segment]:
         """
         Separate touching rocks using watershed segmentation.
         
@@ -288,61 +291,28 @@ class OSRSMining(OSRSBot):
             mask (np.ndarray): Binary mask of tagged rocks
             
         Returns:
-            np.ndarray: Labeled image where each rock has a unique label
+            List[rcv.Segment]: One segment per rock, with its bounding box and contour area
         """
         try:
-            self.log_msg("Starting watershed segmentation...")
-            
-            # Distance transform
-            self.log_msg("Computing distance transform...")
-            dist = cv2.distanceTransform(mask, cv2.DIST_L2, 5)
-            
-            # Normalize for visualization
-            self.log_msg("Normalizing distance transform...")
-            cv2.normalize(dist, dist, 0, 1.0, cv2.NORM_MINMAX)
-            
-            # Threshold to get markers
-            self.log_msg("Thresholding to get markers...")
-            _, sure_fg = cv2.threshold(dist, 0.5, 1.0, 0)
-            sure_fg = np.uint8(sure_fg)
-            
-            # Find background
-            self.log_msg("Finding background...")
-            sure_bg = cv2.dilate(mask, np.ones((3,3), np.uint8), iterations=3)
-            
-            # Unknown region
-            self.log_msg("Computing unknown region...")
-            unknown = cv2.subtract(sure_bg, sure_fg)
-            
-            # Label markers
-            self.log_msg("Labeling markers...")
-            _, markers = cv2.connectedComponents(sure_fg)
-            markers = markers + 1
-            markers[unknown == 255] = 0
-            
-            # Apply watershed
-            self.log_msg("Applying watershed...")
-            markers = cv2.watershed(cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR), markers)
+            self.log_debug("Starting watershed segmentation...")
+            rocks = self.segmenter.segment(mask)
             
             if self.debug_mode:
                 # Save watershed visualization
+                markers = self.segmenter.full_markers(mask.shape)
                 watershed_vis = np.zeros_like(cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR))
                 watershed_vis[markers > 1] = [0, 255, 0]  # Green for rock regions
                 watershed_vis[markers == -1] = [0, 0, 255]  # Red for boundaries
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                watershed_filename = os.path.join(self.debug_dir, f"watershed_debug_{timestamp}.png")
-                cv2.imwrite(watershed_filename, watershed_vis)
-                self.log_msg(f"Saved watershed visualization to {watershed_filename}")
+                self.debug_sink.capture("watershed_debug", watershed_vis, save=True)
             
-            self.log_msg("Watershed segmentation complete")
-            return markers
+            self.log_debug("Watershed segmentation complete")
+            return rocks
             
         except Exception as e:
             self.log_msg(f"Error in separate_rocks: {str(e)}")
             self.log_msg(f"Error type: {type(e).__name__}")
             self.log_msg(f"Error traceback: {traceback.format_exc()}")
-            # Return original mask as markers in case of error
-            return np.array(mask > 0, dtype=np.int32)
+            return []
 
     @validate_types
     def debug_rock_detection(self) -> None:
@@ -364,9 +334,7 @@ class OSRSMining(OSRSBot):
             pink_mask = cv2.inRange(hsv, lower_pink, upper_pink)
             
             # Save original mask for debugging
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            mask_filename = os.path.join(self.debug_dir, f"debug_mask_{timestamp}.png")
-            cv2.imwrite(mask_filename, pink_mask)
+            self.debug_sink.capture("debug_mask", pink_mask, save=True)
             
             # Clean up mask
             kernel = np.ones((5,5), np.uint8)
@@ -374,28 +342,18 @@ class OSRSMining(OSRSBot):
             pink_mask = cv2.morphologyEx(pink_mask, cv2.MORPH_OPEN, kernel)
             
             # Separate rocks using watershed
-            markers = self.separate_rocks(pink_mask)
-            
-            # Get unique labels (excluding background -1 and 0)
-            unique_labels = np.unique(markers)[2:]  # Skip -1 (watershed boundaries) and 0 (background)
-            self.log_msg(f"Found {len(unique_labels)} potential rocks")
+            rocks = self.separate_rocks(pink_mask)
+            markers = self.segmenter.full_markers(pink_mask.shape)
+            self.log_msg(f"Found {len(rocks)} potential rocks")
             
             # Draw debug visualization
             debug_img = game_view.copy()
             valid_rocks = 0
             
-            for label in unique_labels:
-                # Create mask for this rock
-                rock_mask = np.uint8(markers == label)
-                
-                # Get contour for this rock
-                contours, _ = cv2.findContours(rock_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                if not contours:
-                    continue
-                    
-                # Get bounding rectangle
-                x, y, w, h = cv2.boundingRect(contours[0])
-                area = cv2.contourArea(contours[0])
+            for rock in rocks:
+                label = rock.label
+                x, y, w, h = rock.x, rock.y, rock.w, rock.h
+                area = rock.contour_area
                 width_height_diff = abs(w - h)
                 
                 # Log detailed information about each rock
@@ -446,19 +404,17 @@ class OSRSMining(OSRSBot):
                     1
                 )
             
-            self.log_msg(f"\nFound {valid_rocks} valid rocks out of {len(unique_labels)} potential rocks")
+            self.log_msg(f"\nFound {valid_rocks} valid rocks out of {len(rocks)} potential rocks")
             
             # Save watershed result for debugging
             watershed_vis = np.zeros_like(game_view)
             watershed_vis[markers > 1] = [0, 255, 0]  # Green for rock regions
             watershed_vis[markers == -1] = [0, 0, 255]  # Red for boundaries
-            watershed_filename = os.path.join(self.debug_dir, f"watershed_{timestamp}.png")
-            cv2.imwrite(watershed_filename, watershed_vis)
+            self.debug_sink.capture("watershed", watershed_vis, save=True)
             
             # Save debug visualization
-            debug_filename = os.path.join(self.debug_dir, f"debug_visualization_{timestamp}.png")
-            cv2.imwrite(debug_filename, debug_img)
-            self.log_msg(f"Saved debug visualization to: {debug_filename}")
+            self.debug_sink.capture("debug_visualization", debug_img, save=True)
+            self.log_msg(f"Queued debug visualization in: {self.debug_sink.directory}")
 
         except Exception as e:
             self.log_msg(f"Error in debug_rock_detection: {str(e)}")
@@ -506,10 +462,8 @@ class OSRSMining(OSRSBot):
                 )
                 self.log_msg(f"Rock {i+1} at: {rock}")
             
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename: str = os.path.join(self.debug_dir, f"{prefix}_tagged_rocks_{timestamp}.png")
-            cv2.imwrite(filename, debug_img)
-            self.log_msg(f"Saved tagged rocks visualization to: {filename}")
+            self.debug_sink.capture(f"{prefix}_tagged_rocks", debug_img, save=True)
+            self.log_msg(f"Queued tagged rocks visualization: {prefix}_tagged_rocks")
             
         except Exception as e:
             self.log_msg(f"Error in visualize_tagged_rocks: {str(e)}")
@@ -540,7 +494,7 @@ class OSRSMining(OSRSBot):
             Optional[Point]: Click point for the rock if found, None if no rock found or error occurs
         """
         try:
-            self.log_msg("Taking game view screenshot...")
+            self.log_debug("Taking game view screenshot...")
             # Take screenshot of game view
             game_view = self.win.game_view.screenshot()
             
@@ -548,7 +502,7 @@ class OSRSMining(OSRSBot):
                 self.log_msg("Failed to get game view screenshot")
                 return None
             
-            self.log_msg("Converting to HSV...")
+            self.log_debug("Converting to HSV...")
             # Convert to HSV for better pink detection
             hsv = cv2.cvtColor(game_view, cv2.COLOR_BGR2HSV)
             
@@ -556,7 +510,7 @@ class OSRSMining(OSRSBot):
             lower_pink = np.array([145, 30, 180])
             upper_pink = np.array([175, 255, 255])
             
-            self.log_msg("Creating pink mask...")
+            self.log_debug("Creating pink mask...")
             # Create mask for pink color
             pink_mask = cv2.inRange(hsv, lower_pink, upper_pink)
             
@@ -565,28 +519,21 @@ class OSRSMining(OSRSBot):
             pink_mask = cv2.morphologyEx(pink_mask, cv2.MORPH_CLOSE, kernel)
             pink_mask = cv2.morphologyEx(pink_mask, cv2.MORPH_OPEN, kernel)
             
-            if self.debug_mode:
-                # Save the mask for debugging
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                mask_filename = os.path.join(self.debug_dir, f"find_rock_mask_{timestamp}.png")
-                cv2.imwrite(mask_filename, pink_mask)
-                self.log_msg(f"Saved pink mask to {mask_filename}")
+            # Keep the latest searches in memory for failure dumps; debug mode also saves the mask
+            self.debug_sink.capture("find_rock_view", game_view)
+            self.debug_sink.capture("find_rock_mask", pink_mask, save=self.debug_mode)
             
-            self.log_msg("Separating rocks using watershed...")
+            self.log_debug("Separating rocks using watershed...")
             # Separate rocks using watershed
-            markers = self.separate_rocks(pink_mask)
-            
-            # Get unique labels (excluding background -1 and 0)
-            unique_labels = np.unique(markers)[2:]  # Skip -1 (watershed boundaries) and 0 (background)
+            rocks = self.separate_rocks(pink_mask)
             
-            if self.debug_mode:
-                self.log_msg(f"Found {len(unique_labels)} potential rocks in find_nearest_rock")
+            self.log_debug("Found %d potential rocks in find_nearest_rock", len(rocks))
             
-            if len(unique_labels) == 0:
+            if not rocks:
                 self.log_msg("No rocks found")
                 return None
             
-            self.log_msg("Getting game view center...")
+            self.log_debug("Getting game view center...")
             # Get center point of game view for distance calculation
             center = self.win.game_view.get_center()
             
@@ -594,26 +541,15 @@ class OSRSMining(OSRSBot):
             closest_rock = None
             min_distance = float("inf")
             
-            self.log_msg("Processing rock contours...")
-            for label in unique_labels:
+            self.log_debug("Processing rock contours...")
+            for rock in rocks:
+                label = rock.label
                 try:
-                    # Create mask for this rock
-                    rock_mask = np.uint8(markers == label)
+                    # Bounding box and enclosed area were computed during segmentation
+                    x, y, w, h = rock.x, rock.y, rock.w, rock.h
+                    area = rock.contour_area
                     
-                    # Get contour for this rock
-                    contours, _ = cv2.findContours(rock_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                    if not contours:
-                        continue
-                    
-                    # Get bounding rectangle
-                    x, y, w, h = cv2.boundingRect(contours[0])
-                    area = cv2.contourArea(contours[0])
-                    
-                    if self.debug_mode:
-                        self.log_msg(f"Checking rock {label}:")
-                        self.log_msg(f"  Area: {area}")
-                        self.log_msg(f"  Size: {w}x{h}")
-                        self.log_msg(f"  Position: ({x}, {y})")
+                    self.log_debug("Checking rock %d: area %.1f, size %dx%d, position (%d, %d)", label, area, w, h, x, y)
                     
                     # Check if rock matches criteria - increased area range
                     if 1000 < area < 100000 and abs(w - h) < 100:  # Increased max area to 100000
@@ -622,9 +558,7 @@ class OSRSMining(OSRSBot):
                         cy = y + int(h * 0.6)  # Aim slightly below center
                         distance = ((cx - center.x) ** 2 + (cy - center.y) ** 2) ** 0.5
                         
-                        if self.debug_mode:
-                            self.log_msg(f"  Distance from center: {distance}")
-                            self.log_msg(f"  Valid rock: Yes")
+                        self.log_debug("  Valid rock, distance from center: %.1f", distance)
                         
                         if distance < min_distance:
                             min_distance = distance
@@ -639,12 +573,9 @@ class OSRSMining(OSRSBot):
                             
                             closest_rock = Point(abs_x, abs_y)
                             
-                            if self.debug_mode:
-                                self.log_msg(f"  Game view offset: ({game_view_rect.left}, {game_view_rect.top})")
-                                self.log_msg(f"  Relative coords: ({cx}, {cy})")
-                                self.log_msg(f"  Absolute coords: ({abs_x}, {abs_y})")
-                    elif self.debug_mode:
-                        self.log_msg(f"  Valid rock: No (failed validation checks)")
+                            self.log_debug("  Relative coords: (%d, %d), absolute coords: (%d, %d)", cx, cy, abs_x, abs_y)
+                    else:
+                        self.log_debug("  Valid rock: No (failed validation checks)")
                 except Exception as e:
                     self.log_msg(f"Error processing rock {label}: {str(e)}")
                     continue
@@ -658,9 +589,7 @@ class OSRSMining(OSRSBot):
                     rel_x = closest_rock.x - self.win.game_view.left
                     rel_y = closest_rock.y - self.win.game_view.top
                     cv2.circle(debug_img, (rel_x, rel_y), 5, (0, 255, 0), -1)
-                    timestamp = time.strftime("%Y%m%d_%H%M%S")
-                    debug_filename = os.path.join(self.debug_dir, f"click_target_{timestamp}.png")
-                    cv2.imwrite(debug_filename, debug_img)
+                    self.debug_sink.capture("click_target", debug_img, save=True)
                     self.log_msg("Returning closest rock point")
                 return closest_rock
             
@@ -113,9 +113,8 @@ class OSRSWoodcutter(OSRSBot, launcher.Launchable):
                 
                 # Click tree and verify chop option
                 self.mouse.move_to(tree)
-                time.sleep(0.5)
                 
-                if not self.mouseover_text(contains="Chop"):
+                if not self.wait_for_mouseover("Chop", timeout=0.5):
                     self.log_msg("No chop option, waiting...")
                     time.sleep(1.5)
                     continue
@@ -407,16 +406,11 @@ class OSRSWoodcutter(OSRSBot, launcher.Launchable):
         Takes a screenshot and saves it with timestamp and reason
         """
         try:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"debug_{reason}_{timestamp}.png"
-
-            # Save screenshot of game view
+            # Queue a screenshot of the game view; it is written in the background
             screenshot = self.win.game_view.screenshot()
             if screenshot is not None:
-                import cv2
-
-                cv2.imwrite(filename, screenshot)
-                self.log_msg(f"Debug screenshot saved: {filename}")
+                self.debug_sink.capture(f"debug_{reason}", screenshot, save=True)
+                self.log_msg(f"Debug screenshot queued: {reason}")
         except Exception as e:
             self.log_msg(f"Error taking debug screenshot: {str(e)}")
 
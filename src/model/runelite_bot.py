@@ -17,8 +17,10 @@ from typing import List, Union
 import pyautogui as pag
 from deprecated import deprecated
 
+import utilities.cancellation as cancellation
 import utilities.color as clr
 import utilities.debug as debug
+import utilities.geometry as geometry
 import utilities.imagesearch as imsearch
 import utilities.ocr as ocr
 import utilities.runelite_cv as rcv
@@ -53,6 +55,8 @@ class RuneLiteWindow(Window):
             width=128,
             height=20,
         )
+        for name in ("hp_bar", "prayer_bar", "current_action"):
+            self.ui_elements.add(name, getattr(self, name))
         return True
 
     def __locate_hp_prayer_bars(self) -> None:
@@ -133,7 +137,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         if item_text := ocr.find_text(items, self.win.game_view, ocr.PLAIN_11, clr.PURPLE):
             for item in item_text:
                 item.set_rectangle_reference(self.win.game_view)
-            sorted_by_closest = sorted(item_text, key=Rectangle.distance_from_center)
+            sorted_by_closest = geometry.sort_by_distance(item_text, self.win.game_view.get_center())
             self.mouse.move_to(sorted_by_closest[0].get_center())
             for _ in range(5):
                 if self.mouseover_text(contains=["Take"] + items, color=[clr.OFF_WHITE, clr.OFF_ORANGE]):
@@ -141,18 +145,10 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
                 self.mouse.move_rel(0, 3, 1, mouseSpeed="fastest")
             self.mouse.right_click()
             # search the right-click menu
-            if take_text := ocr.find_text(
-                items,
-                self.win.game_view,
-                ocr.BOLD_12,
-                [clr.WHITE, clr.PURPLE, clr.ORANGE],
-            ):
-                self.mouse.move_to(take_text[0].random_point(), mouseSpeed="medium")
-                self.mouse.click()
+            if self.choose_menu_option("Take", items):
                 return True
-            else:
-                self.log_msg(f"Could not find 'Take {items}' in right-click menu.")
-                return False
+            self.log_msg(f"Could not find 'Take {items}' in right-click menu.")
+            return False
         elif not supress_warning:
             self.log_msg(f"Could not find {items} on the ground.")
             return False
@@ -199,7 +195,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         for obj in objs:
             obj.set_rectangle_reference(self.win.game_view)
         # Sort shapes by distance from player
-        objs = sorted(objs, key=RuneLiteObject.distance_from_rect_center)
+        objs = geometry.sort_by_distance(objs, self.win.game_view.get_center())
         if include_in_combat:
             return objs[0]
         for obj in objs:
@@ -232,7 +228,7 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
             The nearest outline to the character as a RuneLiteObject, or None if none found.
         """
         if shapes := self.get_all_tagged_in_rect(self.win.game_view, color):
-            shapes_sorted = sorted(shapes, key=RuneLiteObject.distance_from_rect_center)
+            shapes_sorted = geometry.sort_by_distance(shapes, self.win.game_view.get_center())
             return shapes_sorted[0]
         else:
             return None
@@ -252,6 +248,6 @@ class RuneLiteBot(Bot, metaclass=ABCMeta):
         if rl_login_icon is not None:
             self.mouse.move_to(rl_login_icon.random_point())
             self.mouse.click()
-            time.sleep(0.2)
+            cancellation.sleep(0.2)
             pag.press("enter")
-            time.sleep(1)
+            cancellation.sleep(1)
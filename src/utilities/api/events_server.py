@@ -3,6 +3,8 @@ import json
 import threading
 from typing import Dict, Any
 
+import utilities.recorder as recorder
+
 class EventsAPIHandler(http.server.BaseHTTPRequestHandler):
     cache: Dict[str, Any] = {}
 
@@ -16,6 +18,7 @@ class EventsAPIHandler(http.server.BaseHTTPRequestHandler):
         
         # Store the data in the cache
         self.__class__.cache[endpoint] = data['data']
+        recorder.record_event("api", f"events/{endpoint}", data['data'])
 
         self.send_response(200)
         self.end_headers()
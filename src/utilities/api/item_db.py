@@ -0,0 +1,337 @@
+"""
+A compact table of item IDs and names, loaded on first use.
+
+The table (item_db.bin) stores every item as an ID and a constant-style name (E.g., 3144 "COOKED_KARAMBWAN"),
+sorted by name and zlib-compressed. Loading it takes a few milliseconds and holds the IDs in arrays, so lookups in
+either direction, prefix searches and noted/unnoted relations are binary searches rather than dictionaries of
+every item. The trigram index behind fuzzy search is only built the first time a search needs it.
+
+item_ids keeps the old interface on top of this module, so `ids.SHARK` and `ids.all_food` still work.
+
+Example:
+    import utilities.api.item_db as item_db
+    item_db.id_of("SHARK")  # 385
+    item_db.name_of(385)  # "SHARK"
+    item_db.search("ring of duel")  # ["RING_OF_DUELING1", "RING_OF_DUELING2", ...]
+    item_db.group("RING_OF_DUELING*")  # IDs of every ring of dueling, noted or not
+    item_db.noted(385)  # 386
+"""
+import array
+import bisect
+import difflib
+import pathlib
+import re
+import struct
+import sys
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+TABLE_PATH = pathlib.Path(__file__).with_name("item_db.bin")
+MAGIC = b"OSBCITEM"
+VERSION = 1
+NOTED_SUFFIX = "_NOTED"
+
+# Hand-picked item groups, by item name. Any other group name is treated as a name prefix (see group()).
+# fmt: off
+GROUPS: Dict[str, Tuple[str, ...]] = {
+    "all_food": (
+        "ANGLERFISH", "APPLE_PIE", "BASS", "BREAD", "COOKED_CHICKEN", "COOKED_MEAT", "CURRY", "DARK_CRAB", "HERRING", "JUG_OF_WINE",
+        "LOBSTER", "MACKEREL", "MANTA_RAY", "MEAT_PIE", "MEAT_PIZZA", "MONKFISH", "PEACH", "PIKE", "POTATO_WITH_BUTTER",
+        "POTATO_WITH_CHEESE", "REDBERRY_PIE", "SALMON", "SARDINE", "SEA_TURTLE", "SHARK", "SHRIMPS", "STEW", "SUMMER_PIE", "SWORDFISH",
+        "TANGLED_TOADS_LEGS", "TROUT", "TUNA_POTATO", "TUNA",
+    ),
+    "axes": (
+        "BRONZE_AXE", "IRON_AXE", "STEEL_AXE", "MITHRIL_AXE", "ADAMANT_AXE", "RUNE_AXE", "DRAGON_AXE", "CRYSTAL_AXE_23862", "CRYSTAL_AXE",
+    ),
+    "coins": ("COINS", "COINS_995", "COINS_6964", "COINS_8890"),
+    "coin_pouches": (
+        "COIN_POUCH", "COIN_POUCH_22522", "COIN_POUCH_22523", "COIN_POUCH_22524", "COIN_POUCH_22525", "COIN_POUCH_22526", "COIN_POUCH_22527",
+        "COIN_POUCH_22528", "COIN_POUCH_22529", "COIN_POUCH_22530", "COIN_POUCH_22531", "COIN_POUCH_22532", "COIN_POUCH_22533",
+        "COIN_POUCH_22534", "COIN_POUCH_22535", "COIN_POUCH_22536", "COIN_POUCH_22537", "COIN_POUCH_22538", "COIN_POUCH_24703",
+    ),
+    "combo_food": (
+        "_12_ANCHOVY_PIZZA", "_12_MEAT_PIZZA", "_12_PINEAPPLE_PIZZA", "_12_PLAIN_PIZZA", "_23_CAKE", "_23_CHOCOLATE_CAKE", "ANCHOVY_PIZZA", "CAKE",
+        "CHOCOLATE_BOMB", "CHOCOLATE_CAKE", "COOKED_KARAMBWAN", "GUTHIX_REST1", "GUTHIX_REST2", "GUTHIX_REST3", "GUTHIX_REST4",
+        "HALF_A_MEAT_PIE", "HALF_A_REDBERRY_PIE", "HALF_A_SUMMER_PIE", "HALF_A_WILD_PIE", "HALF_AN_APPLE_PIE", "PINEAPPLE_PIZZA", "PLAIN_PIZZA",
+        "SARADOMIN_BREW1", "SARADOMIN_BREW2", "SARADOMIN_BREW3", "SARADOMIN_BREW4", "WILD_PIE",
+    ),
+    "logs": (
+        "LOGS", "OAK_LOGS", "WILLOW_LOGS", "MAPLE_LOGS", "TEAK_LOGS", "MAHOGANY_LOGS", "JUNIPER_LOGS", "ARCTIC_PINE_LOGS", "YEW_LOGS",
+        "MAGIC_LOGS", "REDWOOD_LOGS",
+    ),
+    "ores": (
+        "CLAY", "COPPER_ORE", "TIN_ORE", "IRON_ORE", "SILVER_ORE", "COAL", "GOLD_ORE", "MITHRIL_ORE", "ADAMANTITE_ORE", "RUNITE_ORE", "AMETHYST",
+    ),
+    "pickaxes": (
+        "BRONZE_PICKAXE", "IRON_PICKAXE", "STEEL_PICKAXE", "MITHRIL_PICKAXE", "ADAMANT_PICKAXE", "RUNE_PICKAXE", "DRAGON_PICKAXE",
+        "DRAGON_PICKAXE_12797", "DRAGON_PICKAXE_OR", "DRAGON_PICKAXE_OR_25376", "CRYSTAL_PICKAXE", "CRYSTAL_PICKAXE_23863",
+    ),
+    "raw_fish": (
+        "LEAPING_SALMON", "LEAPING_STURGEON", "LEAPING_TROUT", "RAW_ANCHOVIES", "RAW_ANGLERFISH", "RAW_BASS", "RAW_CATFISH", "RAW_CAVE_EEL",
+        "RAW_CAVEFISH", "RAW_COD", "RAW_DARK_CRAB", "RAW_GUPPY", "RAW_HERRING", "RAW_KARAMBWAN", "RAW_KARAMBWANJI", "RAW_LAVA_EEL",
+        "RAW_LOBSTER", "RAW_MACKEREL", "RAW_MANTA_RAY", "RAW_MONKFISH", "RAW_PIKE", "RAW_RAINBOW_FISH", "RAW_SALMON", "RAW_SARDINE",
+        "RAW_SEA_TURTLE", "RAW_SHARK", "RAW_SHRIMPS", "RAW_SLIMY_EEL", "RAW_SWORDFISH", "RAW_TETRA", "RAW_TROUT", "RAW_TUNA",
+    ),
+    "rods": (
+        "RING_OF_DUELING1", "RING_OF_DUELING2", "RING_OF_DUELING3", "RING_OF_DUELING4", "RING_OF_DUELING5", "RING_OF_DUELING6",
+        "RING_OF_DUELING7", "RING_OF_DUELING8",
+    ),
+}
+# fmt: on
+
+
+def to_constant(text: str) -> str:
+    """
+    Converts an item name as shown in game to its constant-style name (E.g., "Ring of dueling(8)" to
+    "RING_OF_DUELING8", "1/2 anchovy pizza" to "_12_ANCHOVY_PIZZA").
+    """
+    name = re.sub(r"[^A-Z0-9_ ]", "", text.upper().replace("-", " ")).strip()
+    name = re.sub(r"\s+", "_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _trigrams(name: str) -> set:
+    padded = f"_{name}_"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ItemTable:
+    def __init__(self, ids: Sequence[int], names: List[str]):
+        """
+        An in-memory item table. Use load() to read one from disk.
+        Args:
+            ids: The item IDs.
+            names: The constant-style name of each item, in the same order, sorted.
+        """
+        self.names = names
+        self.ids = array.array("I", ids)  # The ID of each name
+        order = sorted(range(len(self.ids)), key=self.ids.__getitem__)
+        self.__sorted_ids = array.array("I", [self.ids[i] for i in order])
+        self.__rows = array.array("I", order)  # The row in names of each ID in __sorted_ids
+        self.__trigrams: Dict[str, np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def load(cls, path: Union[str, pathlib.Path] = TABLE_PATH) -> "ItemTable":
+        """
+        Reads an item table written by write().
+        """
+        data = pathlib.Path(path).read_bytes()
+        if data[:8] != MAGIC:
+            raise ValueError(f"{path} is not an item table.")
+        version, count = struct.unpack_from("<II", data, 8)
+        if version != VERSION:
+            raise ValueError(f"{path} is item table version {version}, expected {VERSION}.")
+        payload = zlib.decompress(data[16:])
+        ids = array.array("I", payload[: count * 4])
+        if sys.byteorder != "little":
+            ids.byteswap()
+        return cls(ids, payload[count * 4 :].decode("utf-8").split("\n"))
+
+    def write(self, path: Union[str, pathlib.Path] = TABLE_PATH) -> None:
+        """
+        Writes the table to disk.
+        """
+        ids = array.array("I", self.ids)
+        if sys.byteorder != "little":
+            ids.byteswap()
+        payload = ids.tobytes() + "\n".join(self.names).encode("utf-8")
+        header = MAGIC + struct.pack("<II", VERSION, len(self))
+        pathlib.Path(path).write_bytes(header + zlib.compress(payload, 9))
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[int, str]]) -> "ItemTable":
+        """
+        Creates a table from (ID, name) pairs in any order.
+        """
+        items = sorted(items, key=lambda item: item[1])
+        return cls([item_id for item_id, _ in items], [name for _, name in items])
+
+    def id_of(self, name: str) -> Optional[int]:
+        """
+        Returns the ID of an item by its constant-style name, or None if there is no such item.
+        """
+        i = bisect.bisect_left(self.names, name)
+        if i < len(self.names) and self.names[i] == name:
+            return self.ids[i]
+        return None
+
+    def name_of(self, item_id: int) -> Optional[str]:
+        """
+        Returns the constant-style name of an item ID, or None if there is no such item.
+        """
+        i = bisect.bisect_left(self.__sorted_ids, item_id)
+        if i < len(self.__sorted_ids) and self.__sorted_ids[i] == item_id:
+            return self.names[self.__rows[i]]
+        return None
+
+    def search(self, text: str, limit: int = 10) -> List[str]:
+        """
+        Finds item names matching some text. Names starting with the text come first (shortest first), then close
+        matches for typos and partial names.
+        Args:
+            text: An item name as shown in game or a constant-style name, or the start of one.
+            limit: The maximum number of names to return.
+        Returns:
+            Matching constant-style names.
+        """
+        query = to_constant(text)
+        if not query:
+            return []
+        start, end = self.__prefixed(query)
+        found = sorted(self.names[start:end], key=len)[:limit]
+        if len(found) < limit:
+            found_set = set(found)
+            found += [name for name in self.__close_matches(query, limit) if name not in found_set]
+        return found[:limit]
+
+    def group(self, group: str) -> List[int]:
+        """
+        Returns the IDs of a group of items.
+        Args:
+            group: A name in GROUPS (E.g., "all_food"), or a name prefix, optionally ending with "*" (E.g.,
+                   "RING_OF_DUELING*").
+        """
+        if group in GROUPS:
+            return [item_id for item_id in map(self.id_of, GROUPS[group]) if item_id is not None]
+        start, end = self.__prefixed(group.rstrip("*"))
+        return sorted(self.ids[start:end])
+
+    def noted(self, item_id: int) -> Optional[int]:
+        """
+        Returns the ID of the noted form of an item, or None if the item has no noted form.
+        """
+        name = self.name_of(item_id)
+        return self.id_of(name + NOTED_SUFFIX) if name and not name.endswith(NOTED_SUFFIX) else None
+
+    def unnoted(self, item_id: int) -> Optional[int]:
+        """
+        Returns the ID of the unnoted form of a noted item, or None if the item is not noted.
+        """
+        name = self.name_of(item_id)
+        return self.id_of(name[: -len(NOTED_SUFFIX)]) if name and name.endswith(NOTED_SUFFIX) else None
+
+    def __prefixed(self, prefix: str) -> Tuple[int, int]:
+        # Names are sorted, so names sharing a prefix are one slice of them
+        start = bisect.bisect_left(self.names, prefix)
+        return start, bisect.bisect_left(self.names, prefix + "\x7f", start)
+
+    def __close_matches(self, query: str, limit: int) -> List[str]:
+        # Only score the names sharing the most trigrams with the query, rather than all of them
+        if self.__trigrams is None:
+            grams: Dict[str, List[int]] = {}
+            for i, name in enumerate(self.names):
+                for gram in _trigrams(name):
+                    grams.setdefault(gram, []).append(i)
+            self.__trigrams = {gram: np.array(rows, dtype=np.int32) for gram, rows in grams.items()}
+        rows = [self.__trigrams[gram] for gram in _trigrams(query) if gram in self.__trigrams]
+        if not rows:
+            return []
+        shared = np.bincount(np.concatenate(rows), minlength=len(self.names))
+        count = min(limit * 10, len(shared))
+        candidates = [self.names[i] for i in np.argpartition(-shared, count - 1)[:count] if shared[i]]
+        return difflib.get_close_matches(query, candidates, n=limit, cutoff=0.6)
+
+
+__table: Optional[ItemTable] = None
+__table_lock = threading.Lock()
+
+
+def table() -> ItemTable:
+    """
+    Returns the item table, loading it on first use.
+    """
+    global __table
+    if __table is None:
+        with __table_lock:
+            if __table is None:
+                __table = ItemTable.load()
+    return __table
+
+
+def id_of(name: str) -> Optional[int]:
+    """
+    Returns the ID of an item by its constant-style name (E.g., "SHARK"), or None if there is no such item.
+    """
+    return table().id_of(name)
+
+
+def name_of(item_id: int) -> Optional[str]:
+    """
+    Returns the constant-style name of an item ID, or None if there is no such item.
+    """
+    return table().name_of(item_id)
+
+
+def search(text: str, limit: int = 10) -> List[str]:
+    """
+    Finds item names matching some text. See ItemTable.search().
+    """
+    return table().search(text, limit)
+
+
+def group(name: str) -> List[int]:
+    """
+    Returns the IDs of a group of items. See ItemTable.group().
+    """
+    return table().group(name)
+
+
+def noted(item_id: int) -> Optional[int]:
+    """
+    Returns the ID of the noted form of an item, or None if the item has no noted form.
+    """
+    return table().noted(item_id)
+
+
+def unnoted(item_id: int) -> Optional[int]:
+    """
+    Returns the ID of the unnoted form of a noted item, or None if the item is not noted.
+    """
+    return table().unnoted(item_id)
+
+
+def build(source: Union[str, pathlib.Path], path: Union[str, pathlib.Path] = TABLE_PATH) -> ItemTable:
+    """
+    Builds the item table from a Python module of `NAME = ID` constants, like the one generated from
+    https://www.runelocus.com/tools/osrs-item-id-list/.
+    Args:
+        source: The module to read.
+        path: Where to write the table.
+    """
+    pattern = re.compile(r"^([A-Z_][A-Z0-9_]*) = (\d+)$", re.MULTILINE)
+    items = [(int(item_id), name) for name, item_id in pattern.findall(pathlib.Path(source).read_text())]
+    result = ItemTable.from_items(items)
+    result.write(path)
+    return result
+
+
+if __name__ == "__main__":
+    # Rebuild the table with: python item_db.py --build path/to/item_ids.py
+    import time
+
+    if len(sys.argv) == 3 and sys.argv[1] == "--build":
+        print(f"Wrote {len(build(sys.argv[2]))} items to {TABLE_PATH}")
+        sys.exit()
+
+    start = time.perf_counter()
+    items = table()
+    print(f"Loaded {len(items)} items in {(time.perf_counter() - start) * 1000:.1f} ms")
+    for label, func in [
+        ("id_of", lambda: id_of("SHARK")),
+        ("name_of", lambda: name_of(385)),
+        ("noted", lambda: noted(385)),
+        ("group", lambda: group("RING_OF_DUELING*")),
+        ("search", lambda: search("ring of duel")),
+        ("search (typo)", lambda: search("anglerfsh")),
+    ]:
+        result = func()  # Build any lazy index first
+        start = time.perf_counter()
+        for _ in range(100):
+            func()
+        print(f"{label:>14}: {(time.perf_counter() - start) * 1e4:8.1f} us -> {result}")
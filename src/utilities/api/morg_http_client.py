@@ -23,7 +23,9 @@ class MorgHTTPSocket:
         try:
             response = self.session.post(url, timeout=5)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            recorder.record_event("api", f"morg/{endpoint}", data)
+            return data
         except requests.RequestException as e:
             logger.error(f"Error making request to {url}: {str(e)}")
             raise
@@ -95,6 +97,9 @@ import requests
 from deprecated import deprecated
 from requests.exceptions import ConnectionError
 
+import utilities.cancellation as cancellation
+import utilities.recorder as recorder
+
 
 class SocketError(Exception):
     def __init__(self, error_message: str, endpoint: str):
@@ -140,7 +145,9 @@ class MorgHTTPSocket:
                     endpoint,
                 )
 
-        return response.json()
+        data = response.json()
+        recorder.record_event("api", f"morg/{endpoint}", data)
+        return data
 
     def test_endpoints(self) -> bool:
         """
@@ -282,7 +289,7 @@ class MorgHTTPSocket:
             final_xp = next(int(i["xp"]) for i in data[1:] if i["stat"] == skill)
             if final_xp > starting_xp:
                 return final_xp
-            time.sleep(0.2)
+            cancellation.sleep(0.2)
         return -1
 
     def get_game_tick(self) -> int:
@@ -8,6 +8,8 @@ from typing import List, Union
 
 import simplejson as JSON
 
+import utilities.recorder as recorder
+
 # Global to store the data returned from sockets plugin
 player_data = {}
 
@@ -28,6 +30,7 @@ class RLSTATUS(BaseHTTPRequestHandler):
         self.send_response(200)
         self.end_headers()
         player_data = JSON.loads(self.data_bytes)
+        recorder.record_event("api", "status", player_data)
 
     def log_message(self, format, *args):
         """
@@ -0,0 +1,221 @@
+"""
+Cooperative cancellation and pausing for bot threads.
+
+Each BotThread owns a CancellationToken and binds it to itself when it starts. Framework waits and input
+primitives call the module-level functions below, which act on the token bound to the calling thread:
+    - checkpoint() raises Cancelled if the bot was stopped and blocks while it is paused.
+    - sleep() waits in short slices, so a stop request is noticed within one slice.
+    - hold_key() keeps a key pressed for the duration of a with-block, releasing it when the bot is paused,
+      stopped or fails. press_key() and release_key() do the same for keys held across calls.
+On threads without a token (E.g., scripts run from the main thread), they behave like their plain counterparts.
+"""
+import contextlib
+import threading
+import time
+from typing import Callable, List
+
+import utilities.input_backend as input_backend
+
+
+class Cancelled(BaseException):
+    """
+    Raised at a checkpoint after the bot was stopped. Derives from BaseException so that the `except Exception`
+    blocks in bot main loops do not swallow it.
+    """
+
+    pass
+
+
+class CancellationToken:
+    SLICE = 0.1  # Longest time in seconds between checks while waiting
+
+    def __init__(self, on_pause: Callable[[], None] = None, on_resume: Callable[[], None] = None):
+        """
+        Tracks stop and pause requests for a bot thread.
+        Args:
+            on_pause: Called on the bot thread when it actually suspends at a checkpoint.
+            on_resume: Called on the bot thread right before it continues after a pause.
+        """
+        self.on_pause = on_pause
+        self.on_resume = on_resume
+        self.__cancelled = threading.Event()
+        self.__running = threading.Event()  # Cleared while a pause is requested
+        self.__running.set()
+        self.__held_keys: List[str] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self.__running.is_set()
+
+    def cancel(self) -> None:
+        """
+        Requests that the bot stop at its next checkpoint. Also wakes a paused bot so it can stop.
+        """
+        self.__cancelled.set()
+        self.__running.set()
+
+    def pause(self) -> None:
+        """
+        Requests that the bot suspend at its next checkpoint.
+        """
+        self.__running.clear()
+
+    def resume(self) -> None:
+        self.__running.set()
+
+    def checkpoint(self) -> None:
+        """
+        Raises Cancelled if a stop was requested. If a pause was requested, releases any held keys and blocks
+        until resumed, then presses them again.
+        """
+        if self.__cancelled.is_set():
+            raise Cancelled()
+        if self.__running.is_set():
+            return
+        held = list(self.__held_keys)
+        for key in reversed(held):
+            input_backend.key_up(key)
+        if self.on_pause:
+            self.on_pause()
+        self.__running.wait()
+        if self.__cancelled.is_set():
+            raise Cancelled()
+        if self.on_resume:
+            self.on_resume()
+        for key in held:
+            input_backend.key_down(key)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleeps for the given time, checking for stop and pause requests at least every SLICE seconds. Time spent
+        paused does not count toward the sleep.
+        """
+        self.checkpoint()
+        end = time.monotonic() + seconds
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.SLICE))
+            if self.paused:
+                paused_at = time.monotonic()
+                self.checkpoint()
+                end += time.monotonic() - paused_at
+            else:
+                self.checkpoint()
+
+    def press_key(self, key: str) -> None:
+        """
+        Presses a key until release_key() is called. The key is released while the bot is paused and pressed
+        again when it resumes.
+        """
+        self.checkpoint()
+        input_backend.key_down(key)
+        self.__held_keys.append(key)
+
+    def release_key(self, key: str) -> None:
+        """
+        Releases a key pressed with press_key().
+        """
+        if key in self.__held_keys:
+            self.__held_keys.remove(key)
+        input_backend.key_up(key)
+
+    @contextlib.contextmanager
+    def hold_key(self, key: str):
+        """
+        Presses a key for the duration of a with-block. The key is released when the block exits for any reason
+        (including Cancelled), and while the bot is paused.
+        """
+        self.press_key(key)
+        try:
+            yield
+        finally:
+            self.release_key(key)
+
+
+__local = threading.local()
+
+
+def bind(token: CancellationToken) -> None:
+    """
+    Binds a token to the calling thread. Called by BotThread when it starts.
+    """
+    __local.token = token
+
+
+def current() -> CancellationToken:
+    """
+    Returns the token bound to the calling thread, or None.
+    """
+    return getattr(__local, "token", None)
+
+
+def checkpoint() -> None:
+    """
+    Raises Cancelled if the calling bot thread was stopped, and blocks while it is paused. Does nothing on
+    threads without a token.
+    """
+    token = current()
+    if token is not None:
+        token.checkpoint()
+
+
+def sleep(seconds: float) -> None:
+    """
+    A drop-in replacement for time.sleep() that can be interrupted by stopping or pausing the bot.
+    """
+    token = current()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.sleep(seconds)
+
+
+def press_key(key: str) -> None:
+    """
+    Presses a key until release_key() is called. On a bot thread, the key is released while the bot is paused
+    and pressed again when it resumes. Prefer hold_key() where a with-block fits.
+    """
+    token = current()
+    if token is None:
+        input_backend.key_down(key)
+    else:
+        token.press_key(key)
+
+
+def release_key(key: str) -> None:
+    """
+    Releases a key pressed with press_key().
+    """
+    token = current()
+    if token is None:
+        input_backend.key_up(key)
+    else:
+        token.release_key(key)
+
+
+@contextlib.contextmanager
+def hold_key(key: str):
+    """
+    Presses a key for the duration of a with-block and always releases it afterwards.
+    Example:
+        with cancellation.hold_key("shift"):
+            for slot in slots:
+                mouse.move_to(slot.random_point())
+                mouse.click()
+    """
+    token = current()
+    if token is not None:
+        with token.hold_key(key):
+            yield
+        return
+    input_backend.key_down(key)
+    try:
+        yield
+    finally:
+        input_backend.key_up(key)
@@ -0,0 +1,603 @@
+"""
+Screen capture backends. All screenshots taken by Rectangle.screenshot() go through this module.
+
+Capture libraries like mss hold a connection to the display server that must not be shared between threads,
+so every thread lazily creates its own backend instance. This makes it safe to capture from the bot thread,
+the UI thread, and worker threads at the same time.
+
+Available backends:
+    MSSBackend: The default. Works on every platform mss supports.
+    XShmBackend: Linux/X11 only. Captures through a shared memory segment, avoiding a socket copy per frame.
+    ReplayBackend: Serves previously recorded frames from a FrameSource instead of the screen. Bots and
+                   Window.initialize() run unmodified against it, which allows perception to be benchmarked
+                   and regression tested without a live client.
+
+Use set_backend_factory() to switch backends (E.g., `capture.set_backend_factory(lambda: replay)`).
+"""
+import bisect
+import ctypes
+import ctypes.util
+import pathlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import cv2
+import mss
+import numpy as np
+
+if TYPE_CHECKING:
+    from utilities.geometry import Rectangle
+
+
+class CaptureError(Exception):
+    """
+    Exception raised when a backend is unavailable or fails to capture.
+    """
+
+    pass
+
+
+class CaptureBackend(ABC):
+    """
+    Base class for capture backends. A backend instance is only ever used by the thread that created it.
+    """
+
+    @abstractmethod
+    def grab(self, rect: "Rectangle", out: np.ndarray = None) -> np.ndarray:
+        """
+        Captures an area of the screen.
+        Args:
+            rect: The area to capture.
+            out: An optional preallocated (height, width, 3) uint8 array to write the capture into.
+        Returns:
+            A BGR Numpy array representing the captured image (`out` if it was supplied).
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the backend.
+        """
+        pass
+
+    def find_window(self, title: str):
+        """
+        Gives backends that don't capture the real screen a chance to provide the client window.
+        Args:
+            title: The title of the client window.
+        Returns:
+            An object with left, top, width, height, size attributes and an activate() method, or None to
+            look the window up on the desktop as usual.
+        """
+        return None
+
+
+class MSSBackend(CaptureBackend):
+    def __init__(self):
+        """
+        Captures the screen with mss.
+        """
+        self._sct = mss.mss()
+
+    def grab(self, rect: "Rectangle", out: np.ndarray = None) -> np.ndarray:
+        shot = self._sct.grab({"left": rect.left, "top": rect.top, "width": rect.width, "height": rect.height})
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        # Converting straight into the destination avoids an intermediate copy of the BGRA image
+        if out is None:
+            return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=out)
+
+    def close(self) -> None:
+        self._sct.close()
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+class _XImage(ctypes.Structure):
+    # Only the leading fields of XImage are needed, the struct is always allocated by Xlib
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+    ]
+
+
+class XShmBackend(CaptureBackend):
+    __ZPIXMAP = 2
+    __IPC_PRIVATE = 0
+    __IPC_CREAT = 0o1000
+    __IPC_RMID = 0
+    __ALL_PLANES = 0xFFFFFFFF
+
+    # Xlib's default error handler exits the process, so errors are recorded here and raised as CaptureError. The
+    # handler is process-wide: the first open backend installs it and the last one to close restores the previous one.
+    __error_handler_type = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+    __error_handler = None
+    __previous_error_handler = None
+    __error_handler_users = 0
+    __error_handler_lock = threading.Lock()
+    __last_error = threading.local()
+
+    def __init__(self):
+        """
+        Captures the screen of an X11 display through the MIT-SHM extension. The server writes pixels straight
+        into a shared memory segment that is reused between grabs of the same size.
+        """
+        self._display = None
+        self.__handler_installed = False
+        x11, xext, libc = (ctypes.util.find_library(name) for name in ("X11", "Xext", "c"))
+        if not (x11 and xext and libc):
+            raise CaptureError("XShmBackend requires libX11 and libXext.")
+        self._x11 = ctypes.cdll.LoadLibrary(x11)
+        self._xext = ctypes.cdll.LoadLibrary(xext)
+        self._libc = ctypes.CDLL(libc, use_errno=True)
+        self.__declare_functions()
+        self.__install_error_handler()
+
+        self._display = self._x11.XOpenDisplay(None)
+        if not self._display:
+            self.__uninstall_error_handler()
+            raise CaptureError("XShmBackend could not open the X display.")
+        if not self._xext.XShmQueryExtension(self._display):
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+            self.__uninstall_error_handler()
+            raise CaptureError("The X server does not support the MIT-SHM extension.")
+        screen = self._x11.XDefaultScreen(self._display)
+        self._root = self._x11.XRootWindow(self._display, screen)
+        self._visual = self._x11.XDefaultVisual(self._display, screen)
+        self._depth = self._x11.XDefaultDepth(self._display, screen)
+        self._image = None
+        self._shminfo = _XShmSegmentInfo()
+        self._size = None
+
+    def __declare_functions(self) -> None:
+        x11, xext, libc = self._x11, self._xext, self._libc
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDefaultVisual.restype = ctypes.c_void_p
+        x11.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDestroyImage.argtypes = [ctypes.POINTER(_XImage)]
+        x11.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+        x11.XSetErrorHandler.restype = ctypes.c_void_p
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmCreateImage.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.POINTER(_XShmSegmentInfo),
+            ctypes.c_uint,
+            ctypes.c_uint,
+        ]
+        xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmGetImage.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XImage), ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+    def __install_error_handler(self) -> None:
+        cls = XShmBackend
+        with cls.__error_handler_lock:
+            if cls.__error_handler is None:
+
+                def handler(display, event):
+                    cls.__last_error.failed = True
+                    return 0
+
+                # Keep a reference to the callback, otherwise it's garbage collected while Xlib still holds it
+                cls.__error_handler = cls.__error_handler_type(handler)
+            if cls.__error_handler_users == 0:
+                cls.__previous_error_handler = self._x11.XSetErrorHandler(ctypes.cast(cls.__error_handler, ctypes.c_void_p))
+            cls.__error_handler_users += 1
+        self.__handler_installed = True
+
+    def __uninstall_error_handler(self) -> None:
+        """
+        Restores the error handler that was set before the first backend was opened, once no backend needs ours.
+        """
+        if not self.__handler_installed:
+            return
+        self.__handler_installed = False
+        cls = XShmBackend
+        with cls.__error_handler_lock:
+            cls.__error_handler_users -= 1
+            if cls.__error_handler_users == 0:
+                # None restores Xlib's default handler, if there was no handler before
+                self._x11.XSetErrorHandler(cls.__previous_error_handler)
+                cls.__previous_error_handler = None
+
+    def __allocate(self, width: int, height: int) -> None:
+        """
+        Creates a shared memory image of the given size, replacing the previous one.
+        """
+        self.__release()
+        image = self._xext.XShmCreateImage(self._display, self._visual, self._depth, self.__ZPIXMAP, None, ctypes.byref(self._shminfo), width, height)
+        if not image:
+            raise CaptureError("XShmCreateImage failed.")
+        if image.contents.bits_per_pixel != 32:
+            self._x11.XDestroyImage(image)
+            raise CaptureError(f"XShmBackend only supports 32 bits per pixel displays (got {image.contents.bits_per_pixel}).")
+        size = image.contents.bytes_per_line * height
+        shmid = self._libc.shmget(self.__IPC_PRIVATE, size, self.__IPC_CREAT | 0o600)
+        if shmid < 0:
+            self._x11.XDestroyImage(image)
+            raise CaptureError(f"shmget failed (errno {ctypes.get_errno()}).")
+        addr = self._libc.shmat(shmid, None, 0)
+        if addr in (None, ctypes.c_void_p(-1).value):
+            self._libc.shmctl(shmid, self.__IPC_RMID, None)
+            self._x11.XDestroyImage(image)
+            raise CaptureError(f"shmat failed (errno {ctypes.get_errno()}).")
+        self._shminfo.shmid = shmid
+        self._shminfo.shmaddr = addr
+        self._shminfo.readOnly = 0
+        image.contents.data = addr
+        self._xext.XShmAttach(self._display, ctypes.byref(self._shminfo))
+        self._x11.XSync(self._display, 0)
+        # Once both sides are attached, mark the segment for removal so it can't leak if the process dies
+        self._libc.shmctl(shmid, self.__IPC_RMID, None)
+        self._image = image
+        self._size = (width, height)
+        stride = image.contents.bytes_per_line
+        buffer = (ctypes.c_ubyte * size).from_address(addr)
+        self._pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(height, stride // 4, 4)[:, :width]
+
+    def __release(self) -> None:
+        if self._image is None:
+            return
+        self._xext.XShmDetach(self._display, ctypes.byref(self._shminfo))
+        self._x11.XSync(self._display, 0)
+        # The data belongs to the shared segment, so Xlib must not free it
+        self._image.contents.data = None
+        self._x11.XDestroyImage(self._image)
+        self._libc.shmdt(ctypes.c_void_p(self._shminfo.shmaddr))
+        self._image = None
+        self._pixels = None
+        self._size = None
+
+    def grab(self, rect: "Rectangle", out: np.ndarray = None) -> np.ndarray:
+        if self._size != (rect.width, rect.height):
+            self.__allocate(rect.width, rect.height)
+        XShmBackend.__last_error.failed = False
+        ok = self._xext.XShmGetImage(self._display, self._root, self._image, rect.left, rect.top, self.__ALL_PLANES)
+        if not ok or XShmBackend.__last_error.failed:
+            raise CaptureError(f"XShmGetImage failed for {rect}. Is the area inside the screen?")
+        if out is None:
+            return cv2.cvtColor(self._pixels, cv2.COLOR_BGRA2BGR)
+        return cv2.cvtColor(self._pixels, cv2.COLOR_BGRA2BGR, dst=out)
+
+    def close(self) -> None:
+        if self._display:
+            self.__release()
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+        self.__uninstall_error_handler()
+
+    def __del__(self):
+        # Backends dropped without close() (E.g., by a thread that exited) would otherwise keep their display,
+        # shared memory and the error handler installed. close() does nothing if it already ran.
+        self.close()
+
+
+class FrameSource(ABC):
+    """
+    A timeline of previously captured screen regions. Subclasses describe their regions through regions()
+    and load pixels with image(), this class takes care of finding the right frame for a capture request.
+    """
+
+    @abstractmethod
+    def regions(self) -> List[Tuple[float, int, int, int, int]]:
+        """
+        Returns:
+            A list of (timestamp, left, top, width, height) for every recorded region, sorted by timestamp.
+        """
+        pass
+
+    @abstractmethod
+    def image(self, index: int) -> np.ndarray:
+        """
+        Loads the BGR image of a recorded region.
+        Args:
+            index: The index of the region in regions().
+        """
+        pass
+
+    def window_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Returns:
+            The (left, top, width, height) of the client window during the recording, or None if unknown.
+            Defaults to the largest recorded region.
+        """
+        if not (regions := self.regions()):
+            return None
+        return max((r[1:] for r in regions), key=lambda r: r[2] * r[3])
+
+    def start_time(self) -> float:
+        """
+        Returns:
+            The timestamp of the first recorded region.
+        """
+        return self.regions()[0][0] if self.regions() else 0.0
+
+    def end_time(self) -> float:
+        """
+        Returns:
+            The timestamp of the last recorded region.
+        """
+        return self.regions()[-1][0] if self.regions() else 0.0
+
+    def find(self, rect: "Rectangle", t: float, lookback: int = 512) -> Optional[Tuple[int, int, int]]:
+        """
+        Finds the most recent region recorded at or before `t` that fully contains `rect`.
+        Args:
+            rect: The requested capture area.
+            t: The session timestamp to look up.
+            lookback: The maximum number of earlier regions to consider.
+        Returns:
+            (index, x, y) where x, y is the offset of `rect` within the region, or None if nothing contains it.
+        """
+        regions = self.regions()
+        if not hasattr(self, "_timestamps") or len(self._timestamps) != len(regions):
+            self._timestamps = [r[0] for r in regions]
+        i = bisect.bisect_right(self._timestamps, t) - 1
+        for index in range(i, max(i - lookback, -1), -1):
+            _, left, top, width, height = regions[index]
+            x, y = rect.left - left, rect.top - top
+            if x >= 0 and y >= 0 and x + rect.width <= width and y + rect.height <= height:
+                return index, x, y
+        return None
+
+
+class ImageFolderSource(FrameSource):
+    def __init__(self, folder: pathlib.Path):
+        """
+        Serves frames from a folder of PNG files named "<timestamp>_<left>_<top>.png" (E.g., "12.50_0_0.png").
+        Useful for replaying a handful of hand-picked screenshots.
+        Args:
+            folder: The folder containing the images.
+        """
+        self._paths = []
+        self._regions = []
+        entries = []
+        for path in pathlib.Path(folder).glob("*.png"):
+            try:
+                t, left, top = path.stem.split("_")
+                entries.append((float(t), int(left), int(top), path))
+            except ValueError:
+                print(f"ImageFolderSource: Skipping {path.name}, expected <timestamp>_<left>_<top>.png.")
+        for t, left, top, path in sorted(entries, key=lambda e: e[0]):
+            img = cv2.imread(str(path))
+            self._paths.append(path)
+            self._regions.append((t, left, top, img.shape[1], img.shape[0]))
+        self._cache = {}
+
+    def regions(self) -> List[Tuple[float, int, int, int, int]]:
+        return self._regions
+
+    def image(self, index: int) -> np.ndarray:
+        if index not in self._cache:
+            self._cache[index] = cv2.imread(str(self._paths[index]))
+        return self._cache[index]
+
+
+class ReplayWindow:
+    def __init__(self, left: int, top: int, width: int, height: int):
+        """
+        Stands in for the client window while replaying a session. Has the same properties Window uses from
+        pywinctl windows.
+        """
+        self.left, self.top, self.width, self.height = left, top, width, height
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    @size.setter
+    def size(self, value: Tuple[int, int]) -> None:
+        # The recorded client can't be resized, keep the recorded layout
+        pass
+
+    def activate(self) -> None:
+        pass
+
+
+class ReplayBackend(CaptureBackend):
+    def __init__(self, source: FrameSource, clock: Callable[[], float] = None):
+        """
+        Serves captures from a FrameSource instead of the screen. The backend only reads from the source, so a
+        single instance may be shared by all threads.
+        Args:
+            source: The recorded frames.
+            clock: A callable returning the current session timestamp. Defaults to real time elapsed since
+                   the backend was created, starting at the first recorded frame.
+        """
+        self.source = source
+        if clock is None:
+            offset = source.start_time() - time.perf_counter()
+            clock = lambda: time.perf_counter() + offset  # noqa: E731
+        self.clock = clock
+        self.grabs = 0
+        self.misses = 0  # Requests that no recorded region covered, these are served black
+
+    def grab(self, rect: "Rectangle", out: np.ndarray = None) -> np.ndarray:
+        self.grabs += 1
+        if out is None:
+            out = np.empty((rect.height, rect.width, 3), dtype=np.uint8)
+        if found := self.source.find(rect, self.clock()):
+            index, x, y = found
+            np.copyto(out, self.source.image(index)[y : y + rect.height, x : x + rect.width])
+        else:
+            self.misses += 1
+            out[:] = 0
+        return out
+
+    def find_window(self, title: str) -> Optional[ReplayWindow]:
+        if rect := self.source.window_rect():
+            return ReplayWindow(*rect)
+        return None
+
+
+__local = threading.local()
+__lock = threading.Lock()
+__factory: Callable[[], CaptureBackend] = MSSBackend
+__generation = 0  # Incremented whenever the factory changes so threads rebuild their backend
+__backends: List[Tuple[threading.Thread, CaptureBackend]] = []
+__listeners: List[Callable[["Rectangle", np.ndarray], None]] = []
+
+
+def set_backend_factory(factory: Callable[[], CaptureBackend]) -> None:
+    """
+    Changes the backend used by all threads. Each thread creates a new backend with `factory` the next time it
+    captures. The factory may return a shared instance if the backend is thread safe.
+    Args:
+        factory: A callable that returns a CaptureBackend (E.g., the MSSBackend class).
+    """
+    global __factory, __generation
+    with __lock:
+        __factory = factory
+        __generation += 1
+
+
+def get_backend() -> CaptureBackend:
+    """
+    Returns the capture backend of the calling thread, creating it if needed.
+    """
+    state = __local.__dict__
+    if state.get("generation") != __generation:
+        with __lock:
+            backend = __factory()
+            thread, old = threading.current_thread(), state.get("backend")
+            live = [(t, b) for t, b in __backends if t.is_alive() and t is not thread]
+            # Release the backend this one replaces and those of threads that have since exited (E.g., a stopped
+            # bot's thread), since mss instances and X displays aren't released when they are garbage collected.
+            # Backends the factory shares with a live thread are kept.
+            closed = [backend] + [b for _, b in live]
+            for stale in [b for t, b in __backends if not t.is_alive()] + [old]:
+                if stale is not None and all(stale is not b for b in closed):
+                    stale.close()
+                    closed.append(stale)
+            __backends[:] = live + [(thread, backend)]
+            state["backend"], state["generation"] = backend, __generation
+    return state["backend"]
+
+
+def grab(rect: "Rectangle", out: np.ndarray = None) -> np.ndarray:
+    """
+    Captures an area of the screen using the calling thread's backend.
+    Args:
+        rect: The area to capture.
+        out: An optional preallocated (height, width, 3) uint8 array to write the capture into.
+    Returns:
+        A BGR Numpy array representing the captured image.
+    """
+    image = get_backend().grab(rect, out)
+    for listener in __listeners:
+        listener(rect, image)
+    return image
+
+
+def add_listener(listener: Callable[["Rectangle", np.ndarray], None]) -> None:
+    """
+    Registers a function that is called with (rect, image) after every capture, on the capturing thread.
+    Listeners must be quick and must not modify the image (E.g., the session recorder copies it to a queue).
+    """
+    if listener not in __listeners:
+        __listeners.append(listener)
+
+
+def remove_listener(listener: Callable[["Rectangle", np.ndarray], None]) -> None:
+    """
+    Unregisters a function added with add_listener().
+    """
+    if listener in __listeners:
+        __listeners.remove(listener)
+
+
+def benchmark(rect: "Rectangle", threads: int = 4, seconds: float = 3.0, reuse_buffer: bool = True) -> float:
+    """
+    Measures capture throughput with several threads grabbing the same area concurrently.
+    Args:
+        rect: The area to capture.
+        threads: The number of capturing threads.
+        seconds: How long each thread captures for.
+        reuse_buffer: Whether each thread writes into a preallocated buffer.
+    Returns:
+        The total number of grabs per second across all threads.
+    """
+    counts: List[int] = [0] * threads
+    start = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        buffer: Optional[np.ndarray] = np.empty((rect.height, rect.width, 3), dtype=np.uint8) if reuse_buffer else None
+        start.wait()
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            grab(rect, buffer)
+            counts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(threads)]
+    for t in workers:
+        t.start()
+    start.wait()
+    for t in workers:
+        t.join()
+    return sum(counts) / seconds
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+    from utilities.geometry import Rectangle
+
+    # Pass a folder of "<timestamp>_<left>_<top>.png" frames to benchmark replaying them instead
+    if len(sys.argv) > 1:
+        replay = ReplayBackend(ImageFolderSource(pathlib.Path(sys.argv[1])))
+        backends = {"replay": lambda: replay}
+    else:
+        backends = {"mss": MSSBackend, "xshm": XShmBackend}
+
+    # A region the size of the fixed-mode game view
+    area = Rectangle(0, 0, 517, 337)
+    for name, factory in backends.items():
+        try:
+            set_backend_factory(factory)
+            get_backend()
+        except CaptureError as e:
+            print(f"{name}: unavailable ({e})")
+            continue
+        for n in [1, 2, 4, 8]:
+            for reuse in [False, True]:
+                rate = benchmark(area, threads=n, reuse_buffer=reuse)
+                print(f"{name}, {n} thread(s), {'reused' if reuse else 'new'} buffer: {rate:.0f} grabs/sec")
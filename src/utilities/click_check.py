@@ -0,0 +1,149 @@
+"""
+Checks whether clicks were red (the game accepted an action) in the background.
+
+A red click check needs a screenshot of the cursor shortly after the click and a template match against the red
+click sprites. ClickChecker does both on its own thread and returns a Future, so the bot can keep going and only
+wait for the answer when it needs it. The sprites are loaded and split into colour and mask once per process.
+
+All click sprites are drawn in a single colour, so a frame is first screened for that colour with one pass over
+the image; the sprites are only matched one by one against frames that have it. A yellow click (the same sprites in
+yellow, shown when the click did nothing but walk) ends the check early, as the click can no longer turn out red.
+
+Example:
+    clicked = self.mouse.click_checked()
+    self.wait_for_idle()  # Other work while the check runs
+    if not clicked.result():
+        self.log_msg("Missed the click.")
+"""
+import concurrent.futures
+import functools
+import time
+from typing import List, Sequence, Tuple
+
+import cv2
+import mss
+import numpy as np
+
+import utilities.imagesearch as imsearch
+import utilities.input_backend as input_backend
+from utilities.geometry import Point, Rectangle
+
+# Red click sprites, in the order they are most often caught on screen
+SPRITES = ["red_1.png", "red_3.png", "red_2.png", "red_4.png"]
+CLICK_SPRITE_WIDTH_HALF = 7
+FRAME_DELAYS = (0.0, 0.03)  # Seconds after the click to capture frames at
+# BGR ranges of the sprites' colours. A frame without a pixel in range can't match a sprite of that colour closely
+# enough to pass is_red_click's default confidence.
+RED_RANGE = (np.array([0, 0, 140], np.uint8), np.array([110, 110, 255], np.uint8))
+YELLOW_RANGE = (np.array([0, 140, 140], np.uint8), np.array([110, 255, 255], np.uint8))
+
+
+@functools.lru_cache(maxsize=1)
+def red_click_templates() -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Loads the red click sprites as (BGR image, 3-channel alpha mask) pairs, ready for cv2.matchTemplate.
+    """
+    templates = []
+    for sprite in SPRITES:
+        image = cv2.imread(str(imsearch.BOT_IMAGES.joinpath("mouse_clicks", sprite)), cv2.IMREAD_UNCHANGED)
+        alpha = image[:, :, 3]
+        templates.append((np.ascontiguousarray(image[:, :, :3]), cv2.merge([alpha, alpha, alpha])))
+    return templates
+
+
+@functools.lru_cache(maxsize=1)
+def yellow_click_templates() -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    The red click templates recoloured yellow, as the game draws a click that didn't start an action.
+    """
+    templates = []
+    for base, mask in red_click_templates():
+        yellow = base.copy()
+        yellow[np.all(base == (0, 0, 255), axis=2)] = (0, 255, 255)
+        templates.append((yellow, mask))
+    return templates
+
+
+def _matches(image: np.ndarray, templates: List[Tuple[np.ndarray, np.ndarray]], colour_range: tuple, confidence: float) -> bool:
+    """
+    Checks whether an image contains any of a set of single-colour sprites.
+    """
+    if not cv2.countNonZero(cv2.inRange(image, *colour_range)):
+        return False  # None of the sprites can match without their colour
+    for base, mask in templates:
+        if image.shape[0] < base.shape[0] or image.shape[1] < base.shape[1]:
+            continue
+        correlation = cv2.matchTemplate(image, base, cv2.TM_SQDIFF_NORMED, mask=mask)
+        if cv2.minMaxLoc(correlation)[0] < confidence:
+            return True
+    return False
+
+
+def is_red_click(image: np.ndarray, confidence: float = 0.15) -> bool:
+    """
+    Checks whether an image of the area around the cursor contains a red click sprite.
+    Args:
+        image: A BGR image.
+        confidence: The match threshold in range 0 to 1, where 0 is a perfect match.
+    """
+    return _matches(image, red_click_templates(), RED_RANGE, confidence)
+
+
+def is_yellow_click(image: np.ndarray, confidence: float = 0.15) -> bool:
+    """
+    Checks whether an image of the area around the cursor contains a yellow click sprite. See is_red_click().
+    """
+    return _matches(image, yellow_click_templates(), YELLOW_RANGE, confidence)
+
+
+def click_area(before: Point, after: Point) -> Rectangle:
+    """
+    The area of the screen a red click sprite may appear in, given the cursor position when the mouse button went
+    down and when it came up.
+    """
+    max_x, max_y = input_backend.size()
+    pad = CLICK_SPRITE_WIDTH_HALF
+    top_left = Point(max(min(before[0], after[0]) - pad, 0), max(min(before[1], after[1]) - pad, 0))
+    bottom_right = Point(min(max(before[0], after[0]) + pad, max_x), min(max(before[1], after[1]) + pad, max_y))
+    return Rectangle.from_points(top_left, bottom_right)
+
+
+class ClickChecker:
+    def __init__(self, frame_delays: Sequence[float] = FRAME_DELAYS):
+        """
+        Runs red click checks on a background thread, started on the first check.
+        Args:
+            frame_delays: When to capture frames of the cursor, in seconds after the click. The check passes as soon
+                          as one frame shows a red click, and fails as soon as one shows a yellow click.
+        """
+        self.frame_delays = tuple(frame_delays)
+        self.__pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="ClickChecker")
+
+    def check(self, before: Point, after: Point) -> concurrent.futures.Future:
+        """
+        Starts checking whether a click that just happened was red.
+        Args:
+            before: The cursor position when the mouse button went down.
+            after: The cursor position when the mouse button came up.
+        Returns:
+            A Future that resolves to True if the click was red, False otherwise.
+        """
+        clicked_at = time.monotonic()
+        area = click_area(before, after)
+        return self.__pool.submit(self.__check, area, clicked_at)
+
+    def __check(self, area: Rectangle, clicked_at: float) -> bool:
+        for delay in self.frame_delays:
+            remaining = clicked_at + delay - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            try:
+                frame = area.screenshot()
+            except mss.ScreenShotError:
+                print("Failed to take screenshot of mouse cursor. Please report this error to the developer.")
+                continue
+            if is_red_click(frame):
+                return True
+            if is_yellow_click(frame):
+                return False  # The click was yellow, so later frames won't show a red one
+        return False
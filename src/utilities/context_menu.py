@@ -0,0 +1,163 @@
+"""
+Reads the right-click context menu of 2007-style interfaces.
+
+The menu is drawn as a box filled with a fixed background color, a black "Choose Option" header, and one
+15px row per entry inside a 1px black outline. Each row starts with a white action (E.g., "Take") followed by a colored target (E.g., an
+orange item name). Since the box is opaque, a single capture of the area around the cursor is enough to read
+every entry.
+
+Run this module to check the reader against synthetic menus drawn the way the client draws them.
+"""
+from typing import List, NamedTuple, Optional, Union
+
+import cv2
+import numpy as np
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+import utilities.color as clr
+import utilities.ocr as ocr
+from utilities.geometry import Rectangle
+
+MENU_BG = clr.Color([93, 84, 71])  # Background/border color of the menu box
+HEADER_HEIGHT = 19  # Height of the "Choose Option" header, including the border
+HEADER_BAR = 16  # Height of the black bar behind "Choose Option", starting 1px below the top of the menu
+ROW_HEIGHT = 15  # Height of a single menu entry
+MIN_WIDTH = 50  # Narrowest menu the client will draw (header text width)
+
+ACTION_COLORS = [clr.WHITE]
+TARGET_COLORS = [clr.ORANGE, clr.CYAN, clr.YELLOW, clr.GREEN, clr.PURPLE]
+
+
+class MenuEntry(NamedTuple):
+    """
+    A single row of the context menu.
+    Attributes:
+        action: The white action text without spaces (E.g., "Take", "Chopdown").
+        target: The colored target text without spaces (E.g., "Coins"). Empty for entries without a target.
+        rect: The Rectangle of the row on screen.
+    """
+
+    action: str
+    target: str
+    rect: Rectangle
+
+    def text(self) -> str:
+        """
+        Returns the full text of the entry without spaces (E.g., "TakeCoins").
+        """
+        return self.action + self.target
+
+
+def locate_menu(image: cv2.Mat) -> Optional[List[int]]:
+    """
+    Locates the context menu box within an image.
+    Args:
+        image: A BGR image that may contain an open context menu.
+    Returns:
+        The [x, y, w, h] of the menu relative to the image, or None if no menu is open.
+    """
+    mask = clr.isolate_colors(image, MENU_BG)
+    n, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    # The black outline around the entries splits the background into an outer frame and the entries' interior, and
+    # the header text forms blobs of its own. The outer frame spans the whole menu, so it has the largest bounding box
+    # of the blobs that pass for a menu.
+    sizes = stats[1:, cv2.CC_STAT_WIDTH] * stats[1:, cv2.CC_STAT_HEIGHT]
+    for label in 1 + np.argsort(-sizes, kind="stable"):
+        x, y, w, h = (int(v) for v in stats[label, :4])
+        if w >= MIN_WIDTH and h >= HEADER_HEIGHT + ROW_HEIGHT and _has_header(image, x, y, w):
+            return [x, y, w, h]
+    return None
+
+
+def _has_header(image: cv2.Mat, x: int, y: int, w: int) -> bool:
+    """
+    Checks for the black "Choose Option" bar below the top edge of a candidate menu box. The header text covers
+    less than half of the bar.
+    """
+    bar = image[y + 1 : y + 1 + HEADER_BAR, x + 1 : x + w - 1]
+    return bar.shape[0] == HEADER_BAR and np.count_nonzero(np.all(bar == 0, axis=2)) * 2 > bar.shape[0] * bar.shape[1]
+
+
+def read_menu(rect: Rectangle) -> List[MenuEntry]:
+    """
+    Captures a region once and reads every entry of the context menu inside it.
+    Args:
+        rect: The area to search for the menu in. Keep it small (E.g., around the cursor) for speed.
+    Returns:
+        A list of MenuEntry from top to bottom, or an empty list if no menu is open.
+    """
+    return parse_menu(rect.screenshot(), rect.left, rect.top)
+
+
+def parse_menu(image: cv2.Mat, left: int = 0, top: int = 0) -> List[MenuEntry]:
+    """
+    Reads every entry of the context menu in an image. See read_menu().
+    Args:
+        image: A BGR image that may contain an open context menu.
+        left, top: The screen position of the image, added to the entries' Rectangles.
+    """
+    if not (box := locate_menu(image)):
+        return []
+    x, y, w, h = box
+    entries: List[MenuEntry] = []
+    for i in range((h - HEADER_HEIGHT) // ROW_HEIGHT):
+        row = y + HEADER_HEIGHT + i * ROW_HEIGHT
+        # Glyph templates include a few blank rows below the baseline, so take a little extra height
+        strip = image[row : min(row + ROW_HEIGHT + 3, y + h), x : x + w]
+        action = ocr.extract_text(strip, ocr.BOLD_12, ACTION_COLORS)
+        target = ocr.extract_text(strip, ocr.BOLD_12, TARGET_COLORS)
+        entries.append(MenuEntry(action, target, Rectangle(left + x, top + row, w, ROW_HEIGHT)))
+    return entries
+
+
+def find_entry(entries: List[MenuEntry], action: str, target: Union[str, List[str]] = None) -> Optional[MenuEntry]:
+    """
+    Finds the first menu entry matching an action and optional target. Matching is case sensitive and ignores
+    spaces, in the same way as ocr.find_text().
+    Args:
+        entries: The entries returned by read_menu().
+        action: The action (E.g., "Take"), or the full entry text (E.g., "Look North") if the entry has no target.
+        target: The target(s) to match (E.g., "Coins" or ["Coins", "Bones"]). If None, any target matches.
+    Returns:
+        The matching MenuEntry, or None.
+    """
+    action = action.replace(" ", "")
+    if isinstance(target, str):
+        target = [target]
+    targets = [t.replace(" ", "") for t in target] if target else None
+    for entry in entries:
+        if not entry.text().startswith(action):
+            continue
+        if targets is None or any(entry.target.startswith(t) for t in targets):
+            return entry
+    return None
+
+
+if __name__ == "__main__":
+    import random
+
+    import utilities.synthetic as synthetic
+
+    # Draw menus of 1 to 8 entries over game views, the way the client draws them, and read them back
+    options = [("Take", "Coins", clr.ORANGE), ("Attack", "Goblin", clr.YELLOW), ("Mine", "Iron rocks", clr.CYAN), ("Walk here", "", clr.WHITE)]
+    failures = 0
+    for count in range(1, 9):
+        for seed in range(5):
+            random.seed(seed)
+            image = synthetic.generate_frame(ground_items=10, seed=seed).image
+            drawn = [random.choice(options) for _ in range(count)]
+            height = HEADER_HEIGHT + ROW_HEIGHT * count + 3
+            box = synthetic.draw_context_menu(image, random.randint(0, 300), random.randint(0, image.shape[0] - height), drawn)
+            found = locate_menu(image)
+            read = [(e.action, e.target) for e in parse_menu(image)]
+            expected = [(action.replace(" ", ""), target.replace(" ", "")) for action, target, _ in drawn]
+            if found != list(box) or read != expected:
+                failures += 1
+                print(f"{count} entries at {box}: located {found}, read {read}")
+    print(f"{40 - failures} of 40 synthetic menus read correctly.")
+    sys.exit(1 if failures else 0)
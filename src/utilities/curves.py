@@ -0,0 +1,216 @@
+"""
+Human-like mouse curves, generated with NumPy.
+
+human_curves() draws from the same distribution as pyclick's HumanCurve: a Bezier curve through random knots
+around the start and end points, random vertical distortion, and a tweening function that picks which points
+to visit (and therefore the velocity profile). Rather than evaluating the curve at every pixel and then picking
+points, only the picked points are evaluated, and moves that share a knot count and point count are evaluated
+together.
+
+ShapeCache goes one step further: it keeps a pool of curves normalized to run from (0, 0) to (1, 0) and maps one
+onto the requested start and end points, adding fresh distortion each time.
+"""
+import functools
+from math import comb
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+import pytweening
+
+Points = Union[Sequence[Tuple[float, float]], np.ndarray]
+
+_rng = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=256)
+def _tween_table(tween: Callable[[float], float], target_points: int) -> np.ndarray:
+    """
+    The tweened progress (0-1) of each of the target points.
+    """
+    table = np.array([tween(i / (target_points - 1)) for i in range(target_points)])
+    table.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=8)
+def _binomials(degree: int) -> np.ndarray:
+    return np.array([comb(degree, i) for i in range(degree + 1)], dtype=float)
+
+
+def _bezier(control: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Evaluates Bezier curves at the given parameters.
+    Args:
+        control: (B, n + 1, 2) control points of B curves of degree n.
+        t: (B, T) parameters in [0, 1].
+    Returns:
+        (B, T, 2) points.
+    """
+    degree = control.shape[1] - 1
+    i = np.arange(degree + 1)
+    t = t[..., None]
+    basis = _binomials(degree) * t**i * (1 - t) ** (degree - i)
+    return np.einsum("bti,bic->btc", basis, control)
+
+
+def _distortion(rng: np.random.Generator, idx: np.ndarray, last: np.ndarray, mean: float, stdev: float, frequency: float) -> np.ndarray:
+    """
+    Random vertical offsets for the picked points. Points picked more than once in a row share their offset, and
+    the first and last points of the underlying curve are never distorted.
+    Args:
+        idx: (B, T) indices of the picked points on the underlying curve.
+        last: (B, 1) index of the last point of the underlying curve.
+    """
+    delta = rng.normal(mean, stdev, idx.shape) * (rng.random(idx.shape) < frequency)
+    # Repeated indices reuse the offset of the first pick
+    repeat = np.zeros(idx.shape, dtype=bool)
+    repeat[:, 1:] = idx[:, 1:] == idx[:, :-1]
+    group = np.where(repeat, 0, np.arange(idx.shape[1]))
+    np.maximum.accumulate(group, axis=1, out=group)
+    delta = np.take_along_axis(delta, group, axis=1)
+    delta[(idx == 0) | (idx == last)] = 0
+    return delta
+
+
+def human_curves(
+    starts: Points,
+    ends: Points,
+    knots_count: Union[int, Sequence[int]] = 2,
+    target_points: Union[int, Sequence[int]] = 100,
+    offset_boundary: Tuple[int, int] = (100, 100),
+    distortion: Tuple[float, float, float] = (1.0, 1.0, 0.5),
+    tween: Callable[[float], float] = pytweening.easeOutQuad,
+    rng: np.random.Generator = None,
+) -> List[np.ndarray]:
+    """
+    Generates human-like curves for a batch of mouse movements.
+    Args:
+        starts: (x, y) start point of each movement.
+        ends: (x, y) end point of each movement.
+        knots_count: The number of random knots bending each curve, for all movements or per movement.
+        target_points: The number of points in each curve, for all movements or per movement.
+        offset_boundary: How far (x, y) in pixels the knots may lie outside the box spanned by the start and end.
+        distortion: (mean, standard deviation, frequency) of the random vertical offsets added to points.
+        tween: Tweening function mapping time (0-1) to progress along the curve (0-1).
+        rng: Random generator to use.
+    Returns:
+        A (target_points, 2) float array of points for each movement.
+    """
+    rng = rng or _rng
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    count = len(starts)
+    knots_count = np.broadcast_to(knots_count, count)
+    target_points = np.broadcast_to(target_points, count)
+    # Length of the underlying curve, which pyclick evaluates at every pixel step
+    span = np.maximum(np.abs(ends - starts).max(axis=1), 2).astype(int)[:, None]
+    low = np.floor(np.minimum(starts, ends)) - offset_boundary
+    high = np.floor(np.maximum(starts, ends)) + offset_boundary
+
+    curves: List[np.ndarray] = [None] * count
+    for knots, points in set(zip(knots_count.tolist(), target_points.tolist())):
+        if points < 2:
+            raise ValueError("target_points must be at least 2")
+        batch = np.flatnonzero((knots_count == knots) & (target_points == points))
+        inner = rng.integers(low[batch, None], np.maximum(high[batch, None], low[batch, None] + 1), size=(len(batch), knots, 2))
+        control = np.concatenate((starts[batch, None], inner, ends[batch, None]), axis=1)
+        idx = (_tween_table(tween, points) * (span[batch] - 1)).astype(int)
+        path = _bezier(control, idx / (span[batch] - 1))
+        path[..., 1] += _distortion(rng, idx, span[batch] - 1, *distortion)
+        for i, curve in zip(batch, path):
+            curves[i] = curve
+    return curves
+
+
+def human_curve(start: Tuple[float, float], end: Tuple[float, float], **kwargs) -> np.ndarray:
+    """
+    Generates a human-like curve for a single mouse movement. Takes the same keyword arguments as human_curves().
+    """
+    return human_curves([start], [end], **kwargs)[0]
+
+
+class ShapeCache:
+    # Distance the normalized shapes are generated at for each knot count, matching Mouse's knot heuristic
+    REFERENCE_DISTANCE = {0: 100, 1: 200, 2: 400, 3: 600}
+
+    def __init__(self, size: int = 64, rng: np.random.Generator = None):
+        """
+        A pool of normalized curve shapes per (knots, points, offset boundary, tween) combination. Pools are
+        generated on first use.
+        Args:
+            size: The number of shapes in each pool.
+            rng: Random generator to use.
+        """
+        self.size = size
+        self.rng = rng or _rng
+        self.__pools: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __pool(self, knots: int, points: int, offset_boundary: Tuple[int, int], tween: Callable) -> Tuple[np.ndarray, np.ndarray]:
+        key = (knots, points, tuple(offset_boundary), tween)
+        if key not in self.__pools:
+            distance = self.REFERENCE_DISTANCE.get(knots, 600)
+            shapes = human_curves(
+                np.zeros((self.size, 2)),
+                np.tile([distance, 0], (self.size, 1)),
+                knots_count=knots,
+                target_points=points,
+                offset_boundary=offset_boundary,
+                distortion=(0, 0, 0),
+                tween=tween,
+                rng=self.rng,
+            )
+            idx = (_tween_table(tween, points) * (distance - 1)).astype(int)
+            self.__pools[key] = (np.stack(shapes) / distance, idx[None])
+        return self.__pools[key]
+
+    def curve(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        knots_count: int = 2,
+        target_points: int = 100,
+        offset_boundary: Tuple[int, int] = (100, 100),
+        distortion: Tuple[float, float, float] = (1.0, 1.0, 0.5),
+        tween: Callable[[float], float] = pytweening.easeOutQuad,
+    ) -> np.ndarray:
+        """
+        Maps a random cached shape onto a movement and adds fresh distortion. Takes the same arguments as
+        human_curves() for a single movement.
+        Returns:
+            A (target_points, 2) float array of points.
+        """
+        shapes, idx = self.__pool(knots_count, target_points, offset_boundary, tween)
+        shape = shapes[self.rng.integers(len(shapes))]
+        sx, sy = shape[:, 0], shape[:, 1] * (1 if self.rng.random() < 0.5 else -1)  # Random mirror
+        (x0, y0), (x1, y1) = start, end
+        dx, dy = x1 - x0, y1 - y0
+        # Rotate and scale so that (0, 0) -> start and (1, 0) -> end
+        path = np.column_stack((x0 + sx * dx - sy * dy, y0 + sx * dy + sy * dx))
+        path[:, 1] += _distortion(self.rng, idx, np.array([[idx[0, -1]]]), *distortion)[0]
+        return path
+
+
+if __name__ == "__main__":
+    import time
+
+    speeds = {"fastest": 16, "fast": 38, "medium": 66, "slow": 90, "slowest": 116}  # Points at 125 updates/s
+    cache = ShapeCache()
+    try:
+        from pyclick import HumanCurve
+    except ImportError:
+        HumanCurve = None
+
+    def timed(fn, runs=200) -> float:
+        start = time.perf_counter()
+        for _ in range(runs):
+            fn()
+        return (time.perf_counter() - start) / runs * 1000
+
+    start, end = (120, 640), (870, 210)
+    print(f"{'speed':>8} {'pyclick':>9} {'human_curve':>12} {'ShapeCache':>11} {'batch of 28':>12}")
+    for speed, points in speeds.items():
+        ours = timed(lambda: human_curve(start, end, knots_count=3, target_points=points))
+        cached = timed(lambda: cache.curve(start, end, knots_count=3, target_points=points))
+        batch = timed(lambda: human_curves(np.tile(start, (28, 1)), np.tile(end, (28, 1)), knots_count=1, target_points=points), runs=50)
+        theirs = timed(lambda: HumanCurve(start, end, knotsCount=3, targetPoints=points), runs=20) if HumanCurve else float("nan")
+        print(f"{speed:>8} {theirs:>7.2f}ms {ours:>10.3f}ms {cached:>9.3f}ms {batch:>10.3f}ms")
@@ -0,0 +1,164 @@
+"""
+Plans and plays inventory drops.
+
+Dropping a full inventory one slot at a time in index order means picking a point, generating a curve and sampling
+a speed between every click, and jumping from the end of each row back to the start of the next. A drop plan
+instead orders the slots along a short path, picks every target point and generates every curve up front (in one
+batch), and then plays the movements and clicks back-to-back.
+"""
+import math
+import random
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+import pytweening
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+import utilities.cancellation as cancellation
+import utilities.curves as curves
+import utilities.path_player as path_player
+from utilities.geometry import Point, Rectangle
+from utilities.mouse import Mouse
+
+INVENTORY_COLUMNS = 4
+PATTERNS = ("rows", "snake", "columns", "nearest")
+
+
+class DropStep(NamedTuple):
+    """
+    A single movement and click of a drop plan.
+    Attributes:
+        slot: The inventory slot index.
+        point: The point to click.
+        path: The (N, 2) cursor path from the previous point to this one.
+        duration: The time in seconds the movement should take.
+    """
+
+    slot: int
+    point: Point
+    path: np.ndarray
+    duration: float
+
+
+def drop_order(
+    slots: Sequence[int],
+    pattern: str = "snake",
+    start: Tuple[int, int] = None,
+    rects: List[Rectangle] = None,
+    swap_chance: float = 0.1,
+) -> List[int]:
+    """
+    Orders inventory slots to drop.
+    Args:
+        slots: The slot indices to drop.
+        pattern: How to order the slots:
+                 - "rows": left to right, top to bottom (the in-game index order).
+                 - "snake": along each row, reversing direction every row.
+                 - "columns": down and up the columns in turn.
+                 - "nearest": always the closest remaining slot to the cursor. Requires start and rects.
+        start: The cursor position, for "nearest".
+        rects: The inventory slot Rectangles, for "nearest".
+        swap_chance: The chance of swapping each pair of neighbouring slots in the order, as people do.
+    Returns:
+        The slot indices in the order to drop them.
+    """
+    slots = list(dict.fromkeys(slots))
+    if pattern == "rows":
+        order = sorted(slots)
+    elif pattern == "snake":
+        # Odd rows run right to left
+        order = sorted(slots, key=lambda i: (i // INVENTORY_COLUMNS, -(i % INVENTORY_COLUMNS) if i // INVENTORY_COLUMNS % 2 else i % INVENTORY_COLUMNS))
+    elif pattern == "columns":
+        # Odd columns run bottom to top
+        order = sorted(slots, key=lambda i: (i % INVENTORY_COLUMNS, -(i // INVENTORY_COLUMNS) if i % INVENTORY_COLUMNS % 2 else i // INVENTORY_COLUMNS))
+    elif pattern == "nearest":
+        if start is None or rects is None:
+            raise ValueError("The nearest pattern needs the cursor position and slot rectangles.")
+        order, remaining, (x, y) = [], set(slots), start
+        while remaining:
+            # Break near-ties at random, so equally distant neighbours are not always taken in the same order
+            slot = min(remaining, key=lambda i: math.dist((x, y), rects[i].get_center()) + random.uniform(0, 4))
+            order.append(slot)
+            remaining.remove(slot)
+            x, y = rects[slot].get_center()
+    else:
+        raise ValueError(f"Unknown drop pattern '{pattern}'. Try one of {PATTERNS}.")
+    i = 0
+    while i < len(order) - 1:
+        if random.random() < swap_chance:
+            order[i], order[i + 1] = order[i + 1], order[i]
+            i += 1  # Do not move the same slot twice
+        i += 1
+    return order
+
+
+def plan_drops(
+    rects: List[Rectangle],
+    slots: Sequence[int],
+    start: Tuple[int, int],
+    speed: str = "fast",
+    pattern: str = "snake",
+    swap_chance: float = 0.1,
+) -> List[DropStep]:
+    """
+    Orders the slots and generates every target point and cursor path of a drop.
+    Args:
+        rects: The inventory slot Rectangles.
+        slots: The slot indices to drop. Indices without a slot Rectangle (E.g., negative or past the last slot) are
+               ignored.
+        start: The cursor position the first movement starts from.
+        speed: The mouse speed of each movement. See path_player.SPEEDS.
+        pattern: The order to drop slots in. See drop_order().
+        swap_chance: See drop_order().
+    Returns:
+        A list of DropSteps in the order to play them.
+    """
+    slots = [slot for slot in slots if 0 <= slot < len(rects)]
+    order = drop_order(slots, pattern, start=start, rects=rects, swap_chance=swap_chance)
+    if not order:
+        return []
+    points = [rects[slot].random_point() for slot in order]
+    durations = [path_player.sample_duration(speed) for _ in order]
+    ends = np.array(points, dtype=float)
+    starts = np.vstack(([start], ends[:-1]))
+    paths = curves.human_curves(
+        starts,
+        ends,
+        knots_count=1,
+        target_points=[path_player.target_points(d) for d in durations],
+        offset_boundary=(40, 40),
+        tween=pytweening.easeInOutQuad,
+    )
+    return [DropStep(*step) for step in zip(order, points, paths, durations)]
+
+
+def play_drops(mouse: Mouse, steps: List[DropStep]) -> None:
+    """
+    Plays a drop plan, shift-clicking each slot. Shift is released even if the bot is stopped or fails mid-drop.
+    Args:
+        mouse: The Mouse to move and click with.
+        steps: The plan from plan_drops().
+    """
+    with cancellation.hold_key("shift"):
+        for step in steps:
+            mouse.play_path(step.path, step.duration)
+            mouse.click()
+
+
+if __name__ == "__main__":
+    # Compare the cursor travel and the planning time of each pattern on a full inventory
+    import time
+
+    rects = [Rectangle(left=563 + 42 * (i % 4), top=213 + 36 * (i // 4), width=36, height=32) for i in range(28)]
+    slots = list(range(28))
+    for pattern in PATTERNS:
+        start = time.perf_counter()
+        steps = plan_drops(rects, slots, (700, 180), pattern=pattern, swap_chance=0)
+        planned = time.perf_counter() - start
+        travel = sum(np.linalg.norm(np.diff(step.path, axis=0), axis=1).sum() for step in steps)
+        print(f"{pattern:>8}: {travel:6.0f} px of cursor travel, planned in {planned * 1000:.1f} ms")
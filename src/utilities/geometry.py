@@ -1,17 +1,14 @@
 import math
-from typing import List, NamedTuple
+from typing import Dict, List, NamedTuple, Tuple
 
 import cv2
-import mss
 import numpy as np
 
+import utilities.capture as capture
 import utilities.random_util as rd
 
 Point = NamedTuple("Point", x=int, y=int)
 
-# TODO: Remove this global variable. This is a temporary fix for a bug in mss.
-sct = mss.mss()
-
 
 class Rectangle:
 
@@ -21,8 +18,14 @@ class Rectangle:
     will be subtracted from this Rectangle during screenshotting.
     """
 
-    subtract_list: List[dict] = []
-    reference_rect = None
+    # Slots keep the many Rectangles built per frame small and make typos in attribute names an error
+    __slots__ = ("_left", "_top", "_width", "_height", "_center", "subtract_list", "reference_rect")
+
+    subtract_list: List[dict]
+    reference_rect: "Rectangle"
+
+    # Exclusion slices keyed by (width, height, areas). Layouts rarely change, so this stays tiny.
+    _exclusion_slices: Dict[Tuple[int, int, tuple], List[tuple]] = {}
 
     def __init__(self, left: int, top: int, width: int, height: int):
         """
@@ -36,10 +39,50 @@ class Rectangle:
         Returns:
             A Rectangle object.
         """
-        self.left = left
-        self.top = top
-        self.width = width
-        self.height = height
+        self._left = left
+        self._top = top
+        self._width = width
+        self._height = height
+        self._center = None
+        self.subtract_list = []
+        self.reference_rect = None
+
+    # The center is cached, so changing any coordinate must clear it
+    @property
+    def left(self) -> int:
+        return self._left
+
+    @left.setter
+    def left(self, value: int):
+        self._left = value
+        self._center = None
+
+    @property
+    def top(self) -> int:
+        return self._top
+
+    @top.setter
+    def top(self, value: int):
+        self._top = value
+        self._center = None
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        self._width = value
+        self._center = None
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @height.setter
+    def height(self, value: int):
+        self._height = value
+        self._center = None
 
     def set_rectangle_reference(self, rect):
         """
@@ -68,24 +111,65 @@ class Rectangle:
             end_point.y - start_point.y,
         )
 
-    def screenshot(self) -> cv2.Mat:
+    @classmethod
+    def grid(cls, left: int, top: int, width: int, height: int, columns: int, rows: int, gap_x: int = 0, gap_y: int = 0, count: int = None) -> list:
         """
-        Screenshots the Rectangle.
+        Creates a grid of equally sized Rectangles (E.g., inventory slots), in row-major order.
+        Args:
+            left: The leftmost x coordinate of the first Rectangle.
+            top: The topmost y coordinate of the first Rectangle.
+            width: The width of each Rectangle.
+            height: The height of each Rectangle.
+            columns: The number of Rectangles per row.
+            rows: The number of rows.
+            gap_x: The horizontal gap between Rectangles.
+            gap_y: The vertical gap between Rectangles.
+            count: The number of Rectangles to create, if the last row is not full (default columns * rows).
+        Returns:
+            A list of Rectangles.
+        """
+        count = columns * rows if count is None else count
+        step_x, step_y = width + gap_x, height + gap_y
+        return [cls(left + (i % columns) * step_x, top + (i // columns) * step_y, width, height) for i in range(count)]
+
+    def screenshot(self, out: np.ndarray = None) -> cv2.Mat:
+        """
+        Screenshots the Rectangle. Areas in the subtract_list are blacked out.
+        Args:
+            out: An optional preallocated (height, width, 3) uint8 array to capture into. Useful for
+                 avoiding an allocation per frame when capturing the same area repeatedly.
         Returns:
             A BGR Numpy array representing the captured image.
         """
-        # with mss.mss() as sct:  # TODO: When MSS bug is fixed, reinstate this.
-        global sct  # TODO: When MSS bug is fixed, remove this.
-        monitor = self.to_dict()
-        res = np.array(sct.grab(monitor))[:, :, :3]
+        # Each thread captures with its own backend, so this is safe to call from any thread
+        res = capture.grab(self, out)
         if self.subtract_list:
-            for area in self.subtract_list:
-                res[
-                    area["top"] : area["top"] + area["height"],
-                    area["left"] : area["left"] + area["width"],
-                ] = 0
+            for area in self.__exclusion_slices():
+                res[area] = 0
         return res
 
+    def __exclusion_slices(self) -> List[tuple]:
+        """
+        Gets the array slices covered by the subtract_list, clipped to the Rectangle. They are built once per
+        layout and reused. Zeroing a few slices is much cheaper than applying a full-frame pixel mask.
+        Returns:
+            A list of (rows, cols) slice tuples that index the excluded areas of a screenshot.
+        """
+        areas = tuple((a["left"], a["top"], a["width"], a["height"]) for a in self.subtract_list)
+        key = (self.width, self.height, areas)
+        slices = self._exclusion_slices.get(key)
+        if slices is None:
+            slices = []
+            for left, top, width, height in areas:
+                x0, y0 = max(left, 0), max(top, 0)
+                x1, y1 = min(left + width, self.width), min(top + height, self.height)
+                if x0 < x1 and y0 < y1:
+                    slices.append((slice(y0, y1), slice(x0, x1)))
+            if len(self._exclusion_slices) >= 16:  # Stale layouts from previous window sizes
+                self._exclusion_slices.clear()
+            self._exclusion_slices[key] = slices
+        return slices
+
     def random_point(self, custom_seeds: List[List[int]] = None) -> Point:
         """
         Gets a random point within the Rectangle.
@@ -108,7 +192,9 @@ class Rectangle:
         Returns:
             A Point representing the center of the rectangle.
         """
-        return Point(self.left + self.width // 2, self.top + self.height // 2)
+        if self._center is None:
+            self._center = Point(self._left + self._width // 2, self._top + self._height // 2)
+        return self._center
 
     # TODO: Consider changing to this to accept a Point to check against; `distance_from(point: Point)`
     def distance_from_center(self) -> Point:
@@ -122,7 +208,7 @@ class Rectangle:
             raise ReferenceError("A Rectangle being sorted is missing a reference to the Rectangle it's contained in and therefore cannot be sorted.")
         center: Point = self.get_center()
         rect_center: Point = self.reference_rect.get_center()
-        return math.dist([center.x, center.y], [rect_center.x, rect_center.y])
+        return math.hypot(center.x - rect_center.x, center.y - rect_center.y)
 
     def get_top_left(self) -> Point:
         """
@@ -172,7 +258,7 @@ class Rectangle:
 
 
 class RuneLiteObject:
-    rect = None
+    __slots__ = ("_x_min", "_x_max", "_y_min", "_y_max", "_width", "_height", "_center", "_axis", "rect")
 
     def __init__(self, x_min, x_max, y_min, y_max, width, height, center, axis):
         """
@@ -193,6 +279,7 @@ class RuneLiteObject:
         self._height = height
         self._center = center
         self._axis = axis
+        self.rect: Rectangle = None
 
     def set_rectangle_reference(self, rect: Rectangle):
         """
@@ -224,7 +311,7 @@ class RuneLiteObject:
         """
         center: Point = self.center()
         rect_center: Point = self.rect.get_center()
-        return math.dist([center.x, center.y], [rect_center.x, rect_center.y])
+        return math.hypot(center.x - rect_center.x, center.y - rect_center.y)
 
     def random_point(self, custom_seeds: List[List[int]] = None) -> Point:
         """
@@ -258,3 +345,41 @@ class RuneLiteObject:
             p: The point to check in the format [x, y].
         """
         return (self._axis == np.array(p)).all(axis=1).any()
+
+
+def to_array(rects: List[Rectangle]) -> np.ndarray:
+    """
+    Packs Rectangles into an (N, 4) int array of (left, top, width, height) rows.
+    """
+    return np.array([(r.left, r.top, r.width, r.height) for r in rects], dtype=int).reshape(-1, 4)
+
+
+def center_distances(boxes: np.ndarray, point: Point) -> np.ndarray:
+    """
+    Computes the distance of many rectangles' centers from a point at once.
+    Args:
+        boxes: An (N, 4) array of (left, top, width, height) rows (E.g., from to_array() or cv2.boundingRect).
+        point: The point to measure from.
+    Returns:
+        An array of N distances. np.argsort() of it orders the rectangles nearest first.
+    """
+    boxes = np.asarray(boxes).reshape(-1, 4)
+    centers = boxes[:, :2] + boxes[:, 2:] // 2
+    return np.hypot(centers[:, 0] - point[0], centers[:, 1] - point[1])
+
+
+def sort_by_distance(items: list, point: Point) -> list:
+    """
+    Sorts Rectangles or RuneLiteObjects by the distance of their centers from a point, nearest first. Ties keep
+    their original order.
+    Args:
+        items: Rectangles, or RuneLiteObjects with a rectangle reference.
+        point: The point to measure from (E.g., the center of the game view).
+    Returns:
+        A new sorted list.
+    """
+    x, y = point
+    if items and isinstance(items[0], Rectangle):
+        # Centers are cached, so this is cheaper than packing a handful of Rectangles into an array
+        return sorted(items, key=lambda r: math.hypot(r.get_center()[0] - x, r.get_center()[1] - y))
+    return sorted(items, key=lambda obj: math.hypot(obj.center()[0] - x, obj.center()[1] - y))
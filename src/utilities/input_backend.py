@@ -0,0 +1,416 @@
+"""
+Mouse and keyboard backends. All cursor movement, mouse buttons and held keys go through this module.
+
+Available backends:
+    PyAutoGUIBackend: The default. Works on every platform pyautogui supports.
+    XTestBackend: Linux/X11 only. Sends events straight to the X server through the XTEST extension. Events are
+                  written to the connection without waiting for a reply, and the cursor position is tracked
+                  locally instead of being asked of the server on every read.
+    RecordingBackend: Moves nothing. Logs every event with a timestamp and tracks a virtual cursor, for tests and
+                      for measuring a bot's input without a display.
+
+Use set_backend() to switch backends (E.g., `input_backend.set_backend(input_backend.XTestBackend())`).
+"""
+import ctypes
+import ctypes.util
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, List, Tuple
+
+import pyautogui as pag
+
+
+class InputError(Exception):
+    """
+    Exception raised when a backend is unavailable or fails to send an event.
+    """
+
+    pass
+
+
+class InputBackend(ABC):
+    """
+    Base class for input backends. A backend instance is shared by every thread, so backends must be thread safe.
+    """
+
+    @abstractmethod
+    def position(self) -> Tuple[int, int]:
+        """
+        Returns:
+            The (x, y) position of the cursor.
+        """
+        pass
+
+    @abstractmethod
+    def size(self) -> Tuple[int, int]:
+        """
+        Returns:
+            The (width, height) of the screen.
+        """
+        pass
+
+    @abstractmethod
+    def move_to(self, x: int, y: int) -> None:
+        """
+        Moves the cursor to (x, y) immediately.
+        """
+        pass
+
+    @abstractmethod
+    def mouse_down(self, button: str = "left") -> None:
+        pass
+
+    @abstractmethod
+    def mouse_up(self, button: str = "left") -> None:
+        pass
+
+    @abstractmethod
+    def key_down(self, key: str) -> None:
+        """
+        Presses a key, named as in pyautogui (E.g., "shift", "left", "f2", "a").
+        """
+        pass
+
+    @abstractmethod
+    def key_up(self, key: str) -> None:
+        pass
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the backend.
+        """
+        pass
+
+
+class PyAutoGUIBackend(InputBackend):
+    """
+    Sends input with pyautogui. Button and key events keep pyautogui's PAUSE after every call, cursor movements
+    (which are timed by the PathPlayer) skip it.
+    """
+
+    def position(self) -> Tuple[int, int]:
+        x, y = pag.position()
+        return x, y
+
+    def size(self) -> Tuple[int, int]:
+        width, height = pag.size()
+        return int(str(width)), int(str(height))
+
+    def move_to(self, x: int, y: int) -> None:
+        pag.moveTo(x, y, _pause=False)
+
+    def mouse_down(self, button: str = "left") -> None:
+        pag.mouseDown(button=button)
+
+    def mouse_up(self, button: str = "left") -> None:
+        pag.mouseUp(button=button)
+
+    def key_down(self, key: str) -> None:
+        pag.keyDown(key)
+
+    def key_up(self, key: str) -> None:
+        pag.keyUp(key)
+
+
+class XTestBackend(InputBackend):
+    __BUTTONS = {"left": 1, "middle": 2, "right": 3}
+    # pyautogui key names that differ from X keysym names
+    __KEYSYMS = {
+        "shift": "Shift_L",
+        "shiftleft": "Shift_L",
+        "shiftright": "Shift_R",
+        "ctrl": "Control_L",
+        "ctrlleft": "Control_L",
+        "ctrlright": "Control_R",
+        "alt": "Alt_L",
+        "altleft": "Alt_L",
+        "altright": "Alt_R",
+        "left": "Left",
+        "right": "Right",
+        "up": "Up",
+        "down": "Down",
+        "enter": "Return",
+        "return": "Return",
+        "esc": "Escape",
+        "escape": "Escape",
+        "space": "space",
+        " ": "space",
+        "tab": "Tab",
+        "backspace": "BackSpace",
+        "delete": "Delete",
+        "home": "Home",
+        "end": "End",
+        "pageup": "Prior",
+        "pagedown": "Next",
+        "-": "minus",
+        "=": "equal",
+        ",": "comma",
+        ".": "period",
+        "/": "slash",
+        ";": "semicolon",
+        "'": "apostrophe",
+        "[": "bracketleft",
+        "]": "bracketright",
+        "\\": "backslash",
+        "`": "grave",
+        **{f"f{i}": f"F{i}" for i in range(1, 13)},
+    }
+
+    def __init__(self, trust_position: float = 1.0):
+        """
+        Sends input to an X11 display through the XTEST extension.
+        Args:
+            trust_position: For how many seconds after the backend last moved the cursor its locally tracked
+                            position is returned without asking the server. The user may move the cursor too, so
+                            the position is re-read from the server once the cursor has been idle this long.
+        """
+        x11, xtst = ctypes.util.find_library("X11"), ctypes.util.find_library("Xtst")
+        if not (x11 and xtst):
+            raise InputError("XTestBackend requires libX11 and libXtst.")
+        self._x11 = ctypes.cdll.LoadLibrary(x11)
+        self._xtst = ctypes.cdll.LoadLibrary(xtst)
+        self.__declare_functions()
+        self._display = self._x11.XOpenDisplay(None)
+        if not self._display:
+            raise InputError("XTestBackend could not open the X display.")
+        if not self._xtst.XTestQueryExtension(self._display, *(ctypes.byref(ctypes.c_int()) for _ in range(4))):
+            self._x11.XCloseDisplay(self._display)
+            raise InputError("The X server does not support the XTEST extension.")
+        screen = self._x11.XDefaultScreen(self._display)
+        self._root = self._x11.XRootWindow(self._display, screen)
+        self._size = (self._x11.XDisplayWidth(self._display, screen), self._x11.XDisplayHeight(self._display, screen))
+        self.trust_position = trust_position
+        # Xlib connections are not thread safe, and the bot, input and UI threads all send input
+        self._lock = threading.Lock()
+        self._keycodes = {}
+        self._position = None
+        self._moved_at = 0.0
+
+    def __declare_functions(self) -> None:
+        x11, xtst = self._x11, self._xtst
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XRootWindow.restype = ctypes.c_ulong
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XStringToKeysym.argtypes = [ctypes.c_char_p]
+        x11.XStringToKeysym.restype = ctypes.c_ulong
+        x11.XKeysymToKeycode.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        x11.XKeysymToKeycode.restype = ctypes.c_ubyte
+        x11.XQueryPointer.argtypes = [ctypes.c_void_p, ctypes.c_ulong] + [ctypes.c_void_p] * 7
+        xtst.XTestQueryExtension.argtypes = [ctypes.c_void_p] + [ctypes.c_void_p] * 4
+        xtst.XTestFakeMotionEvent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+        xtst.XTestFakeButtonEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+        xtst.XTestFakeKeyEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+
+    def __keycode(self, key: str) -> int:
+        if key not in self._keycodes:
+            name = self.__KEYSYMS.get(key.lower(), key)
+            keysym = self._x11.XStringToKeysym(name.encode())
+            keycode = self._x11.XKeysymToKeycode(self._display, keysym) if keysym else 0
+            if not keycode:
+                raise InputError(f"XTestBackend has no keycode for key '{key}'.")
+            self._keycodes[key] = keycode
+        return self._keycodes[key]
+
+    def position(self) -> Tuple[int, int]:
+        with self._lock:
+            if self._position is not None and time.monotonic() - self._moved_at < self.trust_position:
+                return self._position
+            root, child = ctypes.c_ulong(), ctypes.c_ulong()
+            x, y, win_x, win_y, mask = ctypes.c_int(), ctypes.c_int(), ctypes.c_int(), ctypes.c_int(), ctypes.c_uint()
+            refs = (root, child, x, y, win_x, win_y, mask)
+            self._x11.XQueryPointer(self._display, self._root, *(ctypes.byref(ref) for ref in refs))
+            self._position = (x.value, y.value)
+            return self._position
+
+    def size(self) -> Tuple[int, int]:
+        return self._size
+
+    def move_to(self, x: int, y: int) -> None:
+        with self._lock:
+            # Motion events are only flushed, never synced: the call returns as soon as the request is written
+            self._xtst.XTestFakeMotionEvent(self._display, -1, int(x), int(y), 0)
+            self._x11.XFlush(self._display)
+            self._position = (int(x), int(y))
+            self._moved_at = time.monotonic()
+
+    def __button(self, button: str, pressed: bool) -> None:
+        if button not in self.__BUTTONS:
+            raise InputError(f"Unknown mouse button '{button}'.")
+        with self._lock:
+            self._xtst.XTestFakeButtonEvent(self._display, self.__BUTTONS[button], pressed, 0)
+            self._x11.XFlush(self._display)
+
+    def mouse_down(self, button: str = "left") -> None:
+        self.__button(button, True)
+
+    def mouse_up(self, button: str = "left") -> None:
+        self.__button(button, False)
+
+    def __key(self, key: str, pressed: bool) -> None:
+        with self._lock:
+            self._xtst.XTestFakeKeyEvent(self._display, self.__keycode(key), pressed, 0)
+            self._x11.XFlush(self._display)
+
+    def key_down(self, key: str) -> None:
+        self.__key(key, True)
+
+    def key_up(self, key: str) -> None:
+        self.__key(key, False)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._display:
+                self._x11.XCloseDisplay(self._display)
+                self._display = None
+
+
+class RecordingBackend(InputBackend):
+    def __init__(self, size: Tuple[int, int] = (1920, 1080), position: Tuple[int, int] = (0, 0), record: bool = True):
+        """
+        Logs input instead of sending it.
+        Args:
+            size: The (width, height) of the virtual screen.
+            position: The starting (x, y) position of the virtual cursor.
+            record: Whether to keep the events. Without it the backend simply discards all input.
+        """
+        self._size = size
+        self._position = tuple(position)
+        self.record = record
+        self.events: List[Tuple[float, str, tuple]] = []  # (time.monotonic(), event, args)
+        self._lock = threading.Lock()
+
+    def __log(self, event: str, *args) -> None:
+        if self.record:
+            with self._lock:
+                self.events.append((time.monotonic(), event, args))
+
+    def position(self) -> Tuple[int, int]:
+        return self._position
+
+    def size(self) -> Tuple[int, int]:
+        return self._size
+
+    def move_to(self, x: int, y: int) -> None:
+        self._position = (int(x), int(y))
+        self.__log("move_to", *self._position)
+
+    def mouse_down(self, button: str = "left") -> None:
+        self.__log("mouse_down", button)
+
+    def mouse_up(self, button: str = "left") -> None:
+        self.__log("mouse_up", button)
+
+    def key_down(self, key: str) -> None:
+        self.__log("key_down", key)
+
+    def key_up(self, key: str) -> None:
+        self.__log("key_up", key)
+
+
+__backend: InputBackend = None
+__lock = threading.Lock()
+
+
+def set_backend(backend: InputBackend) -> None:
+    """
+    Changes the backend used by all threads. The previous backend is closed.
+    """
+    global __backend
+    with __lock:
+        previous, __backend = __backend, backend
+    if previous is not None and previous is not backend:
+        previous.close()
+
+
+def get_backend() -> InputBackend:
+    """
+    Returns the current backend, creating a PyAutoGUIBackend if none was set.
+    """
+    global __backend
+    if __backend is None:
+        with __lock:
+            if __backend is None:
+                __backend = PyAutoGUIBackend()
+    return __backend
+
+
+def position() -> Tuple[int, int]:
+    return get_backend().position()
+
+
+def size() -> Tuple[int, int]:
+    return get_backend().size()
+
+
+def move_to(x: int, y: int) -> None:
+    get_backend().move_to(x, y)
+
+
+def mouse_down(button: str = "left") -> None:
+    get_backend().mouse_down(button)
+
+
+def mouse_up(button: str = "left") -> None:
+    get_backend().mouse_up(button)
+
+
+def key_down(key: str) -> None:
+    get_backend().key_down(key)
+
+
+def key_up(key: str) -> None:
+    get_backend().key_up(key)
+
+
+def benchmark(backend: InputBackend, events: int = 500) -> dict:
+    """
+    Measures the time each kind of call takes on a backend. The cursor is moved back and forth by one pixel.
+    Args:
+        backend: The backend to measure.
+        events: The number of calls of each kind.
+    Returns:
+        A dict of call name to median seconds per call.
+    """
+    x, y = backend.position()
+
+    def measure(call: Callable[[int], None]) -> float:
+        times = []
+        for i in range(events):
+            start = time.perf_counter()
+            call(i)
+            times.append(time.perf_counter() - start)
+        return sorted(times)[len(times) // 2]
+
+    results = {
+        "move_to": measure(lambda i: backend.move_to(x + i % 2, y)),
+        "position": measure(lambda i: backend.position()),
+    }
+    backend.move_to(x, y)
+    return results
+
+
+if __name__ == "__main__":
+    # Compare the per-event cost of each backend available on this machine
+    backends = {"RecordingBackend": RecordingBackend}
+    try:
+        pag.position()
+        backends["PyAutoGUIBackend"] = PyAutoGUIBackend
+    except Exception as e:
+        print(f"PyAutoGUIBackend unavailable: {e}")
+    backends["XTestBackend"] = XTestBackend
+    for name, factory in backends.items():
+        try:
+            backend = factory()
+        except InputError as e:
+            print(f"{name} unavailable: {e}")
+            continue
+        results = benchmark(backend)
+        print(f"{name:>17}: " + ", ".join(f"{call} {seconds * 1e6:.1f} us" for call, seconds in results.items()))
+        backend.close()
@@ -0,0 +1,223 @@
+"""
+Runs mouse and keyboard actions on a dedicated thread so the bot thread can keep working while the cursor moves.
+
+Each action returns a concurrent.futures.Future. Actions run one at a time in the order they were submitted, and
+inherit the cancellation token of the thread that submitted them, so stopping or pausing the bot also stops or
+pauses its queued input.
+
+Example:
+    # Look for the next obstacle while the cursor travels to the current one
+    moving = bot.inputs.move_to(obstacle.random_point(), mouseSpeed="medium")
+    next_obstacle = bot.find_next_obstacle()
+    moving.result()
+
+    # Move, check the mouseover text and click in one queued action
+    clicked = bot.inputs.move_click(rock, verify=lambda: bot.wait_for_mouseover("Mine", timeout=0.5)).result()
+"""
+import concurrent.futures
+import threading
+import time
+from typing import Callable, List, Tuple, Union
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+import utilities.cancellation as cancellation
+import utilities.input_backend as input_backend
+from utilities.mouse import Mouse
+
+
+def hold_keys(holds: List[Tuple[str, float, float]]) -> None:
+    """
+    Holds keys over possibly overlapping intervals on the calling thread, without spawning a thread per key.
+    Every held key is released if the bot is stopped or an error occurs, and while the bot is paused. Time spent
+    paused does not count toward the holds.
+    Args:
+        holds: A list of (key, start, duration) tuples, in seconds relative to the call.
+    Example:
+        hold_keys([("left", 0, 1.2), ("up", 0.4, 0.5)])  # Rotate left while briefly tilting up
+    """
+    events = []
+    for key, start, duration in holds:
+        events.append((start, 1, key))  # Key down
+        events.append((start + duration, 0, key))  # Key up, ordered before a down at the same time
+    events.sort()
+    held = []
+    origin = time.monotonic()
+    try:
+        for at, down, key in events:
+            remaining = origin + at - time.monotonic()
+            if remaining > 0:
+                cancellation.sleep(remaining)
+            if down:
+                cancellation.press_key(key)
+                held.append(key)
+            else:
+                held.remove(key)
+                cancellation.release_key(key)
+    finally:
+        for key in reversed(held):
+            cancellation.release_key(key)
+
+
+class InputExecutor:
+    def __init__(self, mouse: Union[Mouse, Callable[[], Mouse]] = None):
+        """
+        Owns the mouse and keyboard for a bot. The worker thread is started on the first action and stopped by
+        shutdown(); an action queued after a shutdown starts a new one.
+        Args:
+            mouse: The Mouse to move and click with, or a function returning it. Pass a function (E.g.,
+                   `lambda: bot.mouse`) to follow a Mouse that may be replaced, as the replay harness does.
+        """
+        self.__mouse = mouse or Mouse()
+        self.__pool = None
+        self.__lock = threading.Lock()
+
+    @property
+    def mouse(self) -> Mouse:
+        """
+        The Mouse actions are performed with, looked up when each action runs.
+        """
+        return self.__mouse() if callable(self.__mouse) else self.__mouse
+
+    def submit(self, action: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        """
+        Queues a function to run on the input thread.
+        Returns:
+            A Future for the function's return value. If the bot is stopped before or while the action runs, the
+            Future raises Cancelled.
+        """
+        token = cancellation.current()
+
+        def run():
+            cancellation.bind(token)
+            try:
+                cancellation.checkpoint()
+                return action(*args, **kwargs)
+            finally:
+                cancellation.bind(None)
+
+        with self.__lock:
+            if self.__pool is None:
+                self.__pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="InputExecutor")
+            return self.__pool.submit(run)
+
+    def move_to(self, destination: tuple, **kwargs) -> concurrent.futures.Future:
+        """
+        Queues a mouse movement. Takes the same arguments as Mouse.move_to.
+        """
+        return self.submit(self.mouse.move_to, destination, **kwargs)
+
+    def click(self, button: str = "left", force_delay: bool = False, check_red_click: bool = False) -> concurrent.futures.Future:
+        """
+        Queues a click at the cursor's position when the action runs. Takes the same arguments as Mouse.click.
+        """
+        return self.submit(self.mouse.click, button=button, force_delay=force_delay, check_red_click=check_red_click)
+
+    def hold_keys(self, holds: List[Tuple[str, float, float]]) -> concurrent.futures.Future:
+        """
+        Queues key holds. See hold_keys() for the format.
+        """
+        return self.submit(hold_keys, holds)
+
+    def chain(self, *steps: Callable) -> concurrent.futures.Future:
+        """
+        Queues several steps to run back-to-back on the input thread, with no round-trip through the bot thread in
+        between. The chain stops at the first step that returns False.
+        Args:
+            steps: Functions taking no arguments.
+        Returns:
+            A Future that resolves to True if every step ran, False if one returned False.
+        """
+
+        def run_chain():
+            for step in steps:
+                if step() is False:
+                    return False
+            return True
+
+        return self.submit(run_chain)
+
+    def move_click(
+        self,
+        destination: tuple,
+        verify: Callable[[], bool] = None,
+        button: str = "left",
+        check_red_click: bool = False,
+        **kwargs,
+    ) -> concurrent.futures.Future:
+        """
+        Queues a move, an optional check and a click as a single action.
+        Args:
+            destination: The point to move to.
+            verify: Called after the move; the click is skipped if it returns False (E.g., a mouseover text check).
+            button: The button to click.
+            check_red_click: Whether the click must be red to count as successful.
+            kwargs: Passed to Mouse.move_to.
+        Returns:
+            A Future that resolves to True if the click happened (and was red, if check_red_click is set).
+        """
+        steps = [lambda: self.mouse.move_to(destination, **kwargs)]
+        if verify is not None:
+            steps.append(verify)
+        if check_red_click:
+            steps.append(lambda: self.mouse.click(button=button, check_red_click=True))
+        else:
+            steps.append(lambda: self.mouse.click(button=button))
+        return self.chain(*steps)
+
+    def wait_idle(self, timeout: float = None) -> None:
+        """
+        Blocks until every action queued so far has finished.
+        """
+        self.submit(lambda: None).result(timeout)
+
+    def shutdown(self) -> None:
+        """
+        Drops pending actions and stops the worker thread once the current action finishes.
+        """
+        with self.__lock:
+            pool, self.__pool = self.__pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+if __name__ == "__main__":
+    # Measure how much of a mouse movement the calling thread gets back for other work
+    import statistics
+
+    import cv2
+    import numpy as np
+
+    class SlowRecordingBackend(input_backend.RecordingBackend):
+        def move_to(self, x: int, y: int) -> None:
+            time.sleep(0.002)  # Stand-in for the OS cursor so nothing moves
+            super().move_to(x, y)
+
+    input_backend.set_backend(SlowRecordingBackend(record=False))
+    executor = InputExecutor()
+    frame = np.random.default_rng(0).integers(0, 255, size=(900, 1600, 3), dtype=np.uint8)
+
+    def perception():
+        # Stand-in for a detector pass on a large game view (OpenCV releases the GIL, like the real detectors)
+        for _ in range(5):
+            cv2.GaussianBlur(frame, (15, 15), 0)
+
+    blocking, overlapped = [], []
+    for _ in range(10):
+        start = time.perf_counter()
+        executor.mouse.move_to((600, 400), mouseSpeed="medium")
+        perception()
+        blocking.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        moving = executor.move_to((600, 400), mouseSpeed="medium")
+        perception()
+        moving.result()
+        overlapped.append(time.perf_counter() - start)
+    executor.shutdown()
+    print(f"move then detect:    {statistics.median(blocking) * 1000:.1f} ms")
+    print(f"move while detecting: {statistics.median(overlapped) * 1000:.1f} ms")
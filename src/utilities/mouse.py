@@ -1,19 +1,25 @@
+import concurrent.futures
+import math
 import time
 
-import mss
-import numpy as np
-import pyautogui as pag
 import pytweening
-from pyclick import HumanCurve
 
+import utilities.cancellation as cancellation
+import utilities.click_check as click_check
+import utilities.curves as curves
 import utilities.debug as debug
-import utilities.imagesearch as imsearch
-from utilities.geometry import Point, Rectangle
+import utilities.input_backend as input_backend
+import utilities.path_player as path_player
+import utilities.recorder as recorder
+import utilities.ui_index as ui_index
 from utilities.random_util import truncated_normal_sample
 
 
 class Mouse:
     click_delay = True
+    player = path_player.PathPlayer()
+    click_checker = click_check.ClickChecker()
+    last_move: path_player.PlaybackReport = None  # Planned vs. actual timing of the latest movement
 
     def move_to(self, destination: tuple, **kwargs):
         """
@@ -25,37 +31,51 @@ class Mouse:
             knotsCount: number of knots to use in the curve, higher value = more erratic movements
                         (default determined by distance)
             mouseSpeed: speed of the mouse (options: 'slowest', 'slow', 'medium', 'fast', 'fastest')
-                        (default 'fast')
+                        (default 'fast'). See path_player.SPEEDS for the duration of each.
             tween: tweening function to use (default easeOutQuad)
         """
+        cancellation.checkpoint()
+        start = input_backend.position()  # Read once; with some backends every read is a round-trip to the display server
         offsetBoundaryX = kwargs.get("offsetBoundaryX", 100)
         offsetBoundaryY = kwargs.get("offsetBoundaryY", 100)
-        knotsCount = kwargs.get("knotsCount", self.__calculate_knots(destination))
+        knotsCount = kwargs.get("knotsCount")
+        if knotsCount is None:
+            knotsCount = self.__calculate_knots(start, destination)
         distortionMean = kwargs.get("distortionMean", 1)
         distortionStdev = kwargs.get("distortionStdev", 1)
         distortionFrequency = kwargs.get("distortionFrequency", 0.5)
         tween = kwargs.get("tweening", pytweening.easeOutQuad)
         mouseSpeed = kwargs.get("mouseSpeed", "fast")
-        mouseSpeed = self.__get_mouse_speed(mouseSpeed)
+        duration = path_player.sample_duration(mouseSpeed)
 
         dest_x = destination[0]
         dest_y = destination[1]
+        recorder.record_event("input", "move_to", {"x": dest_x, "y": dest_y})
 
-        start_x, start_y = pag.position()
-        for curve_x, curve_y in HumanCurve(
-            (start_x, start_y),
+        points = curves.human_curve(
+            start,
             (dest_x, dest_y),
-            offsetBoundaryX=offsetBoundaryX,
-            offsetBoundaryY=offsetBoundaryY,
-            knotsCount=knotsCount,
-            distortionMean=distortionMean,
-            distortionStdev=distortionStdev,
-            distortionFrequency=distortionFrequency,
+            knots_count=knotsCount,
+            target_points=path_player.target_points(duration),
+            offset_boundary=(offsetBoundaryX, offsetBoundaryY),
+            distortion=(distortionMean, distortionStdev, distortionFrequency),
             tween=tween,
-            targetPoints=mouseSpeed,
-        ).points:
-            pag.moveTo((curve_x, curve_y))
-            start_x, start_y = curve_x, curve_y
+        )
+        # Plays the points on a deadline schedule; every point is a safe place to stop or pause the bot
+        self.last_move = self.player.play(points, duration)
+
+    def play_path(self, points, duration: float):
+        """
+        Moves the cursor along a pre-generated path (E.g., from utilities.curves), for callers that plan several
+        movements ahead of time.
+        Args:
+            points: A sequence or (N, 2) array of (x, y) points ending at the destination.
+            duration: The time in seconds the movement should take.
+        """
+        cancellation.checkpoint()
+        dest_x, dest_y = (round(v) for v in points[-1])
+        recorder.record_event("input", "move_to", {"x": dest_x, "y": dest_y})
+        self.last_move = self.player.play(points, duration)
 
     def move_rel(self, x: int, y: int, x_var: int = 0, y_var: int = 0, **kwargs):
         """
@@ -73,7 +93,8 @@ class Mouse:
             x += round(truncated_normal_sample(-x_var, x_var))
         if y_var != 0:
             y += round(truncated_normal_sample(-y_var, y_var))
-        self.move_to((pag.position()[0] + x, pag.position()[1] + y), **kwargs)
+        start_x, start_y = input_backend.position()
+        self.move_to((start_x + x, start_y + y), **kwargs)
 
     def click(self, button="left", force_delay=False, check_red_click=False) -> tuple:
         """
@@ -82,21 +103,26 @@ class Mouse:
             button: button to click (default left).
             force_delay: whether to force a delay between mouse button presses regardless of the Mouse property.
             check_red_click: whether to check if the click was red (i.e., successful action) (default False).
+                             This waits for the check; use click_checked() to check in the background.
         Returns:
             None, unless check_red_click is True, in which case it returns a boolean indicating
             whether the click was red (i.e., successful action) or not.
         """
-        mouse_pos_before = pag.position()
-        pag.mouseDown(button=button)
-        mouse_pos_after = pag.position()
-        if force_delay or self.click_delay:
-            LOWER_BOUND_CLICK = 0.03  # Milliseconds
-            UPPER_BOUND_CLICK = 0.2  # Milliseconds
-            AVERAGE_CLICK = 0.06  # Milliseconds
-            time.sleep(truncated_normal_sample(LOWER_BOUND_CLICK, UPPER_BOUND_CLICK, AVERAGE_CLICK))
-        pag.mouseUp(button=button)
+        mouse_pos_before, mouse_pos_after = self.__press(button, force_delay)
         if check_red_click:
-            return self.__is_red_click(mouse_pos_before, mouse_pos_after)
+            return self.click_checker.check(mouse_pos_before, mouse_pos_after).result()
+
+    def click_checked(self, button="left", force_delay=False) -> concurrent.futures.Future:
+        """
+        Clicks on the current mouse position and checks in the background whether the click was red.
+        Args:
+            button: button to click (default left).
+            force_delay: whether to force a delay between mouse button presses regardless of the Mouse property.
+        Returns:
+            A Future that resolves to True if the click was red (i.e., successful action), False otherwise.
+        """
+        mouse_pos_before, mouse_pos_after = self.__press(button, force_delay)
+        return self.click_checker.check(mouse_pos_before, mouse_pos_after)
 
     def right_click(self, force_delay=False):
         """
@@ -106,76 +132,40 @@ class Mouse:
         """
         self.click(button="right", force_delay=force_delay)
 
-    def __rect_around_point(self, mouse_pos: Point, pad: int) -> Rectangle:
-        """
-        Returns a rectangle around a Point with some padding.
-        """
-        # Get monitor dimensions
-        max_x, max_y = pag.size()
-        max_x, max_y = int(str(max_x)), int(str(max_y))
-
-        # Get the rectangle around the mouse cursor with some padding, ensure it is within the screen.
-        mouse_x, mouse_y = mouse_pos
-        p1 = Point(max(mouse_x - pad, 0), max(mouse_y - pad, 0))
-        p2 = Point(min(mouse_x + pad, max_x), min(mouse_y + pad, max_y))
-        return Rectangle.from_points(p1, p2)
-
-    def __is_red_click(self, mouse_pos_from: Point, mouse_pos_to: Point) -> bool:
+    def __press(self, button: str, force_delay: bool) -> tuple:
         """
-        Checks if a click was red, indicating a successful action.
-        Args:
-            mouse_pos_from: mouse position before the click.
-            mouse_pos_to: mouse position after the click.
+        Presses and releases a mouse button.
         Returns:
-            True if the click was red, False if the click was yellow.
-        """
-        CLICK_SPRITE_WIDTH_HALF = 7
-        rect1 = self.__rect_around_point(mouse_pos_from, CLICK_SPRITE_WIDTH_HALF)
-        rect2 = self.__rect_around_point(mouse_pos_to, CLICK_SPRITE_WIDTH_HALF)
-
-        # Combine two rects into a bigger rectangle
-        top_left_pos = Point(min(rect1.get_top_left().x, rect2.get_top_left().x), min(rect1.get_top_left().y, rect2.get_top_left().y))
-        bottom_right_pos = Point(max(rect1.get_bottom_right().x, rect2.get_bottom_right().x), max(rect1.get_bottom_right().y, rect2.get_bottom_right().y))
-        cursor_sct = Rectangle.from_points(top_left_pos, bottom_right_pos).screenshot()
-
-        for click_sprite in ["red_1.png", "red_3.png", "red_2.png", "red_4.png"]:
-            try:
-                if imsearch.search_img_in_rect(imsearch.BOT_IMAGES.joinpath("mouse_clicks", click_sprite), cursor_sct):
-                    return True
-            except mss.ScreenShotError:
-                print("Failed to take screenshot of mouse cursor. Please report this error to the developer.")
-                continue
-        return False
+            The cursor position before and after the button went down.
+        """
+        # Not between mouseDown and mouseUp, so a stopped bot never leaves a button held
+        cancellation.checkpoint()
+        mouse_pos_before = input_backend.position()
+        if recorder.active() is not None:
+            targets = ui_index.labels(mouse_pos_before)
+            recorder.record_event("input", "click", {"button": button, "x": mouse_pos_before[0], "y": mouse_pos_before[1], "targets": targets})
+        input_backend.mouse_down(button)
+        mouse_pos_after = input_backend.position()
+        if force_delay or self.click_delay:
+            LOWER_BOUND_CLICK = 0.03  # Milliseconds
+            UPPER_BOUND_CLICK = 0.2  # Milliseconds
+            AVERAGE_CLICK = 0.06  # Milliseconds
+            time.sleep(truncated_normal_sample(LOWER_BOUND_CLICK, UPPER_BOUND_CLICK, AVERAGE_CLICK))
+        input_backend.mouse_up(button)
+        return mouse_pos_before, mouse_pos_after
 
-    def __calculate_knots(self, destination: tuple):
+    def __calculate_knots(self, start: tuple, destination: tuple):
         """
         Calculate the knots to use in the Bezier curve based on distance.
         Args:
+            start: x, y tuple of the start point.
             destination: x, y tuple of the destination point.
         """
         # Calculate the distance between the start and end points
-        distance = np.sqrt((destination[0] - pag.position()[0]) ** 2 + (destination[1] - pag.position()[1]) ** 2)
+        distance = math.hypot(destination[0] - start[0], destination[1] - start[1])
         res = round(distance / 200)
         return min(res, 3)
 
-    def __get_mouse_speed(self, speed: str) -> int:
-        """
-        Converts a text speed to a numeric speed for HumanCurve (targetPoints).
-        """
-        if speed == "slowest":
-            min, max = 85, 100
-        elif speed == "slow":
-            min, max = 65, 80
-        elif speed == "medium":
-            min, max = 45, 60
-        elif speed == "fast":
-            min, max = 20, 40
-        elif speed == "fastest":
-            min, max = 10, 15
-        else:
-            raise ValueError("Invalid mouse speed. Try 'slowest', 'slow', 'medium', 'fast', or 'fastest'.")
-        return round(truncated_normal_sample(min, max))
-
 
 if __name__ == "__main__":
     mouse = Mouse()
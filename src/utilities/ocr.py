@@ -1,6 +1,8 @@
 import pathlib
+import time
+import zlib
 from operator import itemgetter
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 import cv2
 import numpy as np
@@ -11,6 +13,7 @@ if __name__ == "__main__":
 
     sys.path[0] = os.path.dirname(sys.path[0])
 
+import utilities.cancellation as cancellation
 import utilities.color as clr
 import utilities.debug as debug
 from utilities.geometry import Rectangle
@@ -99,11 +102,91 @@ QUILL = __load_font("Quill")  # Large bold quest text
 QUILL_8 = __load_font("Quill8")  # Small quest text
 
 
-def extract_text(rect: Rectangle, font: dict, color: Union[clr.Color, List[clr.Color]], exclude_chars: Union[str, List[str]] = problematic_chars) -> str:
+def __font_template(font: dict, char: str) -> cv2.Mat:
+    """
+    Gets the template used to match a character. The top rows of each glyph are blank and are trimmed off.
+    """
+    return font[char][2:] if font is PLAIN_12 else font[char][1:]
+
+
+__glyph_sizes: Dict[int, Tuple[int, int]] = {}
+
+
+def __glyph_size(font: dict) -> Tuple[int, int]:
+    """
+    Gets the largest (height, width) of any character template in a font. Cached per font.
+    """
+    key = id(font)
+    if key not in __glyph_sizes:
+        shapes = [__font_template(font, char).shape[:2] for char in font]
+        __glyph_sizes[key] = (max(h for h, _ in shapes), max(w for _, w in shapes))
+    return __glyph_sizes[key]
+
+
+def __text_regions(image: cv2.Mat, font: dict) -> List[Tuple[int, int, int, int]]:
+    """
+    Locates the areas of an isolated color mask that could contain text. Each cluster of text-colored pixels
+    is padded by the font's glyph size so that any character touching the cluster fits inside its box, and
+    clusters closer together than a glyph are merged into a single box.
+    Args:
+        image: The isolated color mask.
+        font: The font that will be matched inside the regions.
+    Returns:
+        A list of (x, y, w, h) boxes relative to the image. Empty if the mask has no text-colored pixels.
+    """
+    if not cv2.countNonZero(image):
+        return []
+    img_h, img_w = image.shape[:2]
+    glyph_h, glyph_w = __glyph_size(font)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (glyph_w * 2 + 1, glyph_h * 2 + 1))
+    padded = cv2.dilate(image, kernel)
+    _, _, stats, _ = cv2.connectedComponentsWithStats(padded, connectivity=8)
+    regions = [tuple(int(v) for v in stat[:4]) for stat in stats[1:]]
+    # When text covers most of the image, a single pass over the whole thing is cheaper
+    if sum(w * h for _, _, w, h in regions) >= img_w * img_h * 0.5:
+        return [(0, 0, img_w, img_h)]
+    return regions
+
+
+def __match_chars(image: cv2.Mat, font: dict, chars: str) -> List[list]:
+    """
+    Template matches characters of a font against an isolated color mask. Matching only happens inside the
+    regions that contain text-colored pixels, so the cost scales with the amount of text rather than the
+    size of the image.
+    Args:
+        image: The isolated color mask.
+        font: The font type to search for.
+        chars: The characters to search for.
+    Returns:
+        A list of [char, x, y] matches relative to the image, sorted top-left to bottom-right.
+    """
+    found = set()
+    for x0, y0, w, h in __text_regions(image, font):
+        roi = image[y0 : y0 + h, x0 : x0 + w]
+        for char in chars:
+            template = __font_template(font, char)
+            if template.shape[0] > h or template.shape[1] > w:
+                continue
+            # Template match the character in the region
+            correlation = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+            # Locate the start point for each instance of this character
+            y_mins, x_mins = np.where(correlation >= 0.98)
+            # Regions may overlap, so matches are collected in a set using image-relative positions
+            found.update((char, int(x) + x0, int(y) + y0) for x, y in zip(x_mins, y_mins))
+    # Sort the char list based on which ones appear closest to the top-left of the image
+    return sorted(([char, x, y] for char, x, y in found), key=itemgetter(2, 1))
+
+
+def extract_text(
+    rect: Union[Rectangle, cv2.Mat],
+    font: dict,
+    color: Union[clr.Color, List[clr.Color]],
+    exclude_chars: Union[str, List[str]] = problematic_chars,
+) -> str:
     """
     Extracts text from a Rectangle.
     Args:
-        rect: The rectangle to search within.
+        rect: The rectangle to search within (can be a Rectangle or a BGR matrix that was already captured).
         font: The font type to search for.
         color: The color(s) of the text to search for.
         exclude_chars: A list of characters to exclude from the search. By default, this is a list of characters that
@@ -112,25 +195,97 @@ def extract_text(rect: Rectangle, font: dict, color: Union[clr.Color, List[clr.C
         A single string containing all text found in order, no spaces.
     """
     # Screenshot and isolate colors
-    image = clr.isolate_colors(rect.screenshot(), color)
-    result = ""
-    char_list = []
-    for key in font:
-        if key == " " or key in exclude_chars:
-            continue
-        # Template match the character in the image
-        if font is PLAIN_12:
-            correlation = cv2.matchTemplate(image, font[key][2:], cv2.TM_CCOEFF_NORMED)
-        else:
-            correlation = cv2.matchTemplate(image, font[key][1:], cv2.TM_CCOEFF_NORMED)
-        # Locate the start point for each instance of this character
-        y_mins, x_mins = np.where(correlation >= 0.98)
-        # For each instance of this character, add it to the list
-        char_list.extend([key, x, y] for x, y in zip(x_mins, y_mins))
-    # Sort the char list based on which ones appear closest to the top-left of the image
-    char_list = sorted(char_list, key=itemgetter(2, 1))
+    image = clr.isolate_colors(rect.screenshot() if isinstance(rect, Rectangle) else rect, color)
+    return text_from_mask(image, font, exclude_chars)
+
+
+def text_from_mask(mask: cv2.Mat, font: dict, exclude_chars: Union[str, List[str]] = problematic_chars) -> str:
+    """
+    Extracts text from an image that has already been isolated with clr.isolate_colors().
+    Args:
+        mask: The isolated color mask.
+        font: The font type to search for.
+        exclude_chars: A list of characters to exclude from the search.
+    Returns:
+        A single string containing all text found in order, no spaces.
+    """
+    chars = "".join(key for key in font if key != " " and key not in exclude_chars)
+    char_list = __match_chars(mask, font, chars)
     # Join the charachers into a string
-    return result.join(letter for letter, _, _ in char_list)
+    return "".join(letter for letter, _, _ in char_list)
+
+
+class TextWatcher:
+    def __init__(
+        self,
+        rect: Rectangle,
+        font: dict,
+        color: Union[clr.Color, List[clr.Color]],
+        exclude_chars: Union[str, List[str]] = problematic_chars,
+    ):
+        """
+        Watches a small area of text (E.g., the mouseover text) and only runs OCR when it changes. Each read
+        captures the area and hashes the isolated color mask; if the hash matches the previous read, the previously
+        decoded text is returned without template matching.
+        Args:
+            rect: The rectangle to watch.
+            font: The font type of the text.
+            color: The color(s) of the text.
+            exclude_chars: A list of characters to exclude from the search.
+        """
+        self.rect = rect
+        self.font = font
+        self.color = color
+        self.exclude_chars = exclude_chars
+        self.ocr_count = 0  # Number of reads that required OCR, useful for profiling
+        self._last_hash = None
+        self._last_text = ""
+
+    def text(self) -> str:
+        """
+        Returns the current text in the watched area, no spaces.
+        """
+        mask = clr.isolate_colors(self.rect.screenshot(), self.color)
+        digest = zlib.crc32(np.ascontiguousarray(mask))
+        if digest != self._last_hash:
+            self._last_text = text_from_mask(mask, self.font, self.exclude_chars)
+            self._last_hash = digest
+            self.ocr_count += 1
+        return self._last_text
+
+    def contains(self, text: Union[str, List[str]]) -> bool:
+        """
+        Checks if the watched area contains some text. Case sensitive, spaces are ignored.
+        Args:
+            text: A word, phrase, or list of words/phrases. True if any of them is found.
+        """
+        if isinstance(text, str):
+            text = [text]
+        current = self.text()
+        for phrase in text:
+            # Excluded characters are never decoded, so they can't be part of the comparison either
+            needle = "".join(char for char in phrase if char != " " and char not in self.exclude_chars)
+            if needle and needle in current:
+                return True
+        return False
+
+    def wait_for(self, text: Union[str, List[str]], timeout: float = 1.0, interval: float = 0.02) -> bool:
+        """
+        Polls the watched area until it contains some text.
+        Args:
+            text: A word, phrase, or list of words/phrases. Returns as soon as any of them is found.
+            timeout: The maximum number of seconds to wait.
+            interval: The number of seconds to wait between reads.
+        Returns:
+            True if the text appeared before the timeout, False otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.contains(text):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            cancellation.sleep(interval)
 
 
 def find_text(
@@ -155,20 +310,12 @@ def find_text(
 
     # Extract unique characters from input text
     chars = "".join(set("".join(text))).replace(" ", "")
-    char_list = []
     for char in chars:
-        try:
-            template = font[char][2:] if font is PLAIN_12 else font[char][1:]
-        except KeyError:
+        if char not in font:
             text = text.replace(char, "")  # Remove characters that aren't in the font
             print(f"Font does not contain character: {char}. Omitting from search.")
-            continue
-        correlation = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
-        y_mins, x_mins = np.where(correlation >= 0.98)
-        char_list.extend([char, x, y] for x, y in zip(x_mins, y_mins))
-
-    # Sort the char list based on which ones appear closest to the top-left of the image
-    char_list = sorted(char_list, key=itemgetter(2, 1))
+    chars = "".join(char for char in chars if char in font)
+    char_list = __match_chars(image, font, chars)
 
     haystack = "".join(char[0] for char in char_list)
 
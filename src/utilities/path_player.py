@@ -0,0 +1,174 @@
+"""
+Plays mouse paths on a fixed schedule.
+
+Moving the cursor one pyautogui call at a time makes a movement's duration depend on the number of points, on
+pyautogui's PAUSE after every call and on system load. PathPlayer gives each point a deadline measured from the
+start of the movement on the monotonic clock, sleeps only until the next deadline and skips points that are
+already overdue, so a movement takes as long as it was planned to regardless of how fast the machine is.
+"""
+import bisect
+import time
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+import utilities.cancellation as cancellation
+import utilities.input_backend as input_backend
+from utilities.random_util import truncated_normal_sample
+
+# (min, max) duration in seconds of a movement at each speed
+SPEEDS = {
+    "slowest": (0.85, 1.0),
+    "slow": (0.65, 0.8),
+    "medium": (0.45, 0.6),
+    "fast": (0.2, 0.4),
+    "fastest": (0.1, 0.15),
+}
+EVENT_RATE = 125  # Cursor updates per second
+
+
+def sample_duration(speed: str) -> float:
+    """
+    Draws the duration in seconds of a movement at a text speed.
+    Args:
+        speed: One of 'slowest', 'slow', 'medium', 'fast' or 'fastest'.
+    """
+    if speed not in SPEEDS:
+        raise ValueError("Invalid mouse speed. Try 'slowest', 'slow', 'medium', 'fast', or 'fastest'.")
+    return truncated_normal_sample(*SPEEDS[speed])
+
+
+def target_points(duration: float) -> int:
+    """
+    The number of points a path should have to move the cursor at EVENT_RATE for the duration.
+    """
+    return max(2, round(duration * EVENT_RATE))
+
+
+class PlaybackReport(NamedTuple):
+    """
+    Timing of a played path.
+    Attributes:
+        points: The number of points in the path.
+        emitted: The number of cursor updates sent. Repeated and overdue points are skipped.
+        planned: The planned duration in seconds.
+        actual: The measured duration in seconds, excluding time spent paused.
+        max_lag: The longest time in seconds a cursor update was sent after its deadline.
+    """
+
+    points: int
+    emitted: int
+    planned: float
+    actual: float
+    max_lag: float
+
+    @property
+    def error(self) -> float:
+        return self.actual - self.planned
+
+
+class PathPlayer:
+    def __init__(self, move: Callable[[int, int], None] = None, spin: float = 0.0):
+        """
+        Args:
+            move: Moves the cursor to (x, y). Defaults to the current input backend.
+            spin: How long before a deadline to stop sleeping and busy-wait instead, to make up for coarse sleep
+                  granularity. Off by default: spinning holds the GIL, starving the bot thread while the cursor
+                  moves, and a sleep that overshoots by a millisecond is small next to the 8 ms between points.
+        """
+        self.move = move or input_backend.move_to
+        self.spin = spin
+
+    def play(self, points, duration: float) -> PlaybackReport:
+        """
+        Moves the cursor through a path, spreading the points evenly over the duration. The path's own point
+        spacing (E.g., from a tweening function) determines the velocity profile.
+        Args:
+            points: A sequence or (N, 2) array of (x, y) points.
+            duration: The total time in seconds the movement should take.
+        Returns:
+            A PlaybackReport comparing the planned and actual duration.
+        """
+        duration = float(duration)
+        path = np.rint(np.asarray(points, dtype=float)).astype(int).reshape(-1, 2)
+        n = len(path)
+        if n == 0:
+            return PlaybackReport(0, 0, duration, 0.0, 0.0)
+        deadlines = np.linspace(0.0, duration, n)
+        # A point equal to the one before it would not move the cursor. The last point is always kept so that
+        # the movement ends on schedule (ease-out paths settle on the destination before the end).
+        keep = np.ones(n, dtype=bool)
+        keep[1:-1] = np.any(path[1:-1] != path[:-2], axis=1)
+        deadlines = deadlines[keep].tolist()
+        xs, ys = path[keep, 0].tolist(), path[keep, 1].tolist()
+        last = len(xs) - 1
+
+        clock, sleep = time.perf_counter, time.sleep
+        start = clock()
+        emitted = 0
+        max_lag = 0.0
+        i = 0
+        while i <= last:
+            now = clock() - start
+            # Jump to the latest point that is already due
+            i = max(i, min(bisect.bisect_right(deadlines, now) - 1, last))
+            wait = deadlines[i] - now
+            if wait > 0:
+                if wait > self.spin:
+                    sleep(wait - self.spin)
+                if self.spin:
+                    while clock() - start < deadlines[i]:
+                        pass
+            else:
+                max_lag = max(max_lag, -wait)
+            paused_at = clock()
+            cancellation.checkpoint()
+            start += clock() - paused_at  # Time spent paused shifts the rest of the schedule
+            self.move(xs[i], ys[i])
+            emitted += 1
+            i += 1
+        return PlaybackReport(n, emitted, duration, clock() - start, max_lag)
+
+
+if __name__ == "__main__":
+    # Compare planned and actual durations against one pyautogui call per point with a fixed delay in between
+    import statistics
+
+    import pytweening
+
+    def curve(n: int) -> np.ndarray:
+        t = np.array([pytweening.easeOutQuad(v) for v in np.linspace(0, 1, n)])
+        return np.column_stack((100 + 600 * t, 100 + 300 * t))
+
+    def busy_move(x, y):
+        # Stand-in for the OS cursor call, which costs about this much on a desktop
+        end = time.perf_counter() + 0.0003
+        while time.perf_counter() < end:
+            pass
+
+    player = PathPlayer(move=busy_move)
+    print(f"{'speed':>8} {'planned':>9} {'per-point sleep':>16} {'PathPlayer':>11} {'max lag':>8}")
+    for speed, (low, high) in SPEEDS.items():
+        duration = (low + high) / 2
+        n = max(2, round(duration * EVENT_RATE))
+        path = curve(n)
+        naive, played, lags = [], [], []
+        for _ in range(5):
+            start = time.perf_counter()
+            for x, y in path:
+                busy_move(x, y)
+                time.sleep(duration / (n - 1))
+            naive.append(time.perf_counter() - start)
+            report = player.play(path, duration)
+            played.append(report.actual)
+            lags.append(report.max_lag)
+        print(
+            f"{speed:>8} {duration * 1000:>7.0f}ms {statistics.median(naive) * 1000:>14.0f}ms"
+            f" {statistics.median(played) * 1000:>9.0f}ms {max(lags) * 1000:>6.1f}ms"
+        )
@@ -1,12 +1,19 @@
 import math
 import random
-import secrets
+import statistics
+import threading
 from datetime import datetime
-from typing import List, Union, Tuple, Optional
+from typing import Dict, List, Union, Tuple, Optional
 
 import numpy as np
 
 
+MAX_SEED_PROFILES = 4096  # Distinct mods to keep seed profiles for
+
+__seed_profiles: Dict[int, List[List[float]]] = {}
+__seed_profiles_date = 0
+
+
 def random_seeds(mod: int = 0, start: int = 8, stop: int = 12):
     """
     Generates a set of random seeds.
@@ -18,11 +25,25 @@ def random_seeds(mod: int = 0, start: int = 8, stop: int = 12):
         stop: The maximum number of seeds to generate. Default is 12.
     Returns:
         A list of random seeds.
+    Notes:
+        The seeds for a date and mod are the same all day, so they are generated once with a private Random and
+        cached until the date changes. Only the number of seeds returned varies between calls. The global random
+        module's state is left untouched.
     """
-    sg = secrets.SystemRandom()
-    date = int(datetime.now().strftime("%Y%m%d"))
-    random.seed(date + mod)
-    return [[random.uniform(0.000, 1.000), random.uniform(0.000, 1.000)] for _ in range(sg.randrange(start, stop))]
+    global __seed_profiles_date
+    today = datetime.now()
+    date = today.year * 10000 + today.month * 100 + today.day
+    if date != __seed_profiles_date:
+        __seed_profiles.clear()
+        __seed_profiles_date = date
+    seeds = __seed_profiles.get(mod)
+    if seeds is None or len(seeds) < stop - 1:
+        rng = random.Random(date + mod)
+        seeds = [[rng.uniform(0.000, 1.000), rng.uniform(0.000, 1.000)] for _ in range(max(stop - 1, 0))]
+        if len(__seed_profiles) >= MAX_SEED_PROFILES:
+            __seed_profiles.pop(next(iter(__seed_profiles)))
+        __seed_profiles[mod] = seeds
+    return seeds[: _sampler.integers(start, stop)]
 
 
 def random_point_in(x_min, y_min, width, height, seeds: List[List[int]]) -> List[int]:
@@ -37,74 +58,12 @@ def random_point_in(x_min, y_min, width, height, seeds: List[List[int]]) -> List
     Returns:
         A random [x, y] coordinate within the bounding box.
     """
-    sg = secrets.SystemRandom()
-
-    if sg.randrange(0, 101) > 75:
-        # Generate a random pixel within the full bounding box.
-        return __random_from(x_min, y_min, width, height)
-
-    # Calculate the dimensions and position of an inner bounding box within the full bounding box.
-    offset_percentage = sg.uniform(0.150, 0.350)
-    inner_x_min = round(width * offset_percentage + x_min)
-    inner_y_min = round(height * offset_percentage + y_min)
-    inner_width = round(width * (1.000 - (offset_percentage * 2)))
-    inner_height = round(height * (1.000 - (offset_percentage * 2)))
-
-    # Select a random seed from the list of seeds.
-    random_index = sg.randrange(0, len(seeds))
-    ratio_x = round(inner_width * seeds[random_index][0])
-    ratio_y = round(inner_height * seeds[random_index][1])
-
-    # Calculate the dimensions and position of a bounding box within the inner bounding box.
-    start_x, start_y = inner_x_min + ratio_x, inner_y_min + ratio_y
-    start_fix_width, end_fix_width = start_x - x_min, width - ratio_x
-    start_fix_height, end_fix_height = start_y - y_min, height - ratio_y
-
-    # Determine the dimensions of the bounding box within the inner bounding box.
-    inner_inner_width = start_fix_width if start_fix_width <= end_fix_width else end_fix_width
-    inner_inner_height = start_fix_height if start_fix_height <= end_fix_height else end_fix_height
-
-    # Generate a random pixel within the bounding box within the inner bounding box.
-    return __random_from(start_x, start_y, inner_inner_width, inner_inner_height, centered=False)
-
-
-def __random_from(x_min, y_min, width, height, centered: bool = True) -> List[int]:
-    """
-    Helper function to generate a random pixel within some bounding box. The bounding box can be
-    centered on the x_min and y_min coordinates, or the bounding box can be offset from the x_min
-    and y_min coordinates (i.e., x_min and y_min are the top-left corner of the bounding
-    box).
-    Args:
-        x_min: The left-most coordinate of the bounding box.
-        y_min: The top-most coordinate of the bounding box.
-        width: The width of the bounding box.
-        height: The height of the bounding box.
-        centered: Whether or not the bounding box is centered on the x_min and y_min coordinates.
-    """
-    if centered:
-        # The bounding box to search is to be centered on the x_min and y_min coordinates
-        x_min = x_min + math.ceil(width / 2)
-        y_min = y_min + math.ceil(height / 2)
-
-    # Calculate the minimum and maximum values for x and y within the region
-    x_min_bound = x_min - math.ceil(width / 2)
-    x_max_bound = x_min + math.ceil(width / 2)
-    y_min_bound = y_min - math.ceil(height / 2)
-    y_max_bound = y_min + math.ceil(height / 2)
-
-    # Calculate the standard deviation for x and y based on the region's dimensions
-    sigma_x = (width / 2) * 0.33
-    sigma_y = (height / 2) * 0.33
-
-    # Generate a random x and y value within the region using truncated normal sampling
-    x = int(truncated_normal_sample(x_min_bound, x_max_bound, x_min, sigma_x))
-    y = int(truncated_normal_sample(y_min_bound, y_max_bound, y_min, sigma_y))
-    return [x, y]
+    return _sampler.point_in(x_min, y_min, width, height, seeds)
 
 
 def truncated_normal_sample(lower_bound, upper_bound, mean=None, std=None) -> float:
     """
-    Generate a random sample from a normal distribution using the Box-Muller method.
+    Generate a random sample from a truncated normal distribution.
     Args:
         lower_bound: The lower bound of the truncated normal distribution.
         upper_bound: The upper bound of the truncated normal distribution.
@@ -115,23 +74,7 @@ def truncated_normal_sample(lower_bound, upper_bound, mean=None, std=None) -> fl
     Examples:
         100,000 x `truncated_normal_sample(0, 100)` graphed: https://i.imgur.com/8W12RZX.png
     """
-    if mean is None:
-        mean = (lower_bound + upper_bound) / 2
-    if std is None:
-        std = (upper_bound - lower_bound) / 9
-    # Keep generating samples until we get one that falls within the specified bounds
-    while True:
-        # Generate two independent standard normal samples
-        x1, x2 = np.random.normal(0, 1), np.random.normal(0, 1)
-        z = x1**2 + x2**2
-        if z >= 0 and z <= 1:
-            # Use the Box-Muller transform to generate a sample from the normal distribution
-            sample = mean + std * x1 * np.sqrt(-2 * np.log(z) / z)
-            if sample < lower_bound:
-                continue
-            if sample > upper_bound:
-                continue
-            return sample
+    return _sampler.truncated_normal(lower_bound, upper_bound, mean, std)
 
 
 def fancy_normal_sample(lower_bound, upper_bound) -> float:
@@ -147,15 +90,7 @@ def fancy_normal_sample(lower_bound, upper_bound) -> float:
     Examples:
         100,000 x `truncated_normal_sample(0, 100)` graphed: https://i.imgur.com/XP4Loff.png
     """
-    # Default will be two means, one at 1/3rd and one at 2/3 of the range
-    means = [lower_bound + (upper_bound - lower_bound) * 0.33, lower_bound + (upper_bound - lower_bound) * 0.66]
-    # Generate probabilities for each mean proportional to the index
-    p = [(i + 1) ** 2 / sum((i + 1) ** 2 for i in range(len(means))) for i in range(len(means))][::-1]
-    # Select a mean from the list with a probability proportional to the index
-    index = np.random.choice(range(len(means)), p=p)
-    mean = means[index]
-    # Retrieve a sample from the truncated normal distribution
-    return truncated_normal_sample(lower_bound, upper_bound, mean=mean)
+    return _sampler.fancy_normal(lower_bound, upper_bound)
 
 
 def chisquared_sample(df: int, min: float = 0, max: float = np.inf) -> float:
@@ -195,7 +130,7 @@ def random_chance(probability: float) -> bool:
         raise TypeError("Probability must be a float")
     if probability < 0.000 or probability > 1.000:
         raise ValueError("Probability must be between 0 and 1")
-    return secrets.SystemRandom().random() < probability
+    return _sampler.random() < probability
 
 
 def random_float(min_val: float, max_val: float) -> float:
@@ -210,37 +145,299 @@ def random_point(min_x: int, min_y: int, width: int, height: int) -> Tuple[int,
     return (x, y)
 
 
+# Coefficients of Wichura's AS241 rational approximations of the inverse normal CDF, highest power first
+# fmt: off
+_AS241_CENTRAL = (
+    (2509.0809287301226727, 33430.575583588128105, 67265.770927008700853, 45921.953931549871457,
+     13731.693765509461125, 1971.5909503065514427, 133.14166789178437745, 3.3871328727963666080),
+    (5226.4952788528545610, 28729.085735721942674, 39307.895800092710610, 21213.794301586595867,
+     5394.1960214247511077, 687.18700749205790830, 42.313330701600911252, 1.0),
+)
+_AS241_INTERMEDIATE = (
+    (7.74545014278341407640e-4, 2.27238449892691845833e-2, 2.41780725177450611770e-1, 1.27045825245236838258,
+     3.64784832476320460504, 5.76949722146069140550, 4.63033784615654529590, 1.42343711074968357734),
+    (1.05075007164441684324e-9, 5.47593808499534494600e-4, 1.51986665636164571966e-2, 1.48103976427480074590e-1,
+     6.89767334985100004550e-1, 1.67638483018380384940, 2.05319162663775882187, 1.0),
+)
+_AS241_TAIL = (
+    (2.01033439929228813265e-7, 2.71155556874348757815e-5, 1.24266094738807843860e-3, 2.65321895265761230930e-2,
+     2.96560571828504891230e-1, 1.78482653991729133580, 5.46378491116411436990, 6.65790464350110377720),
+    (2.04426310338993978564e-15, 1.42151175831644588870e-7, 1.84631831751005468180e-5, 7.86869131145613259100e-4,
+     1.48753612908506148525e-2, 1.36929880922735805310e-1, 5.99832206555887937690e-1, 1.0),
+)
+# fmt: on
+
+
+_STANDARD_NORMAL = statistics.NormalDist()
+
+
+def _normal_cdf(x: float) -> float:
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def _normal_inv_cdf(p: np.ndarray) -> np.ndarray:
+    """
+    Vectorized inverse of the standard normal CDF, using the same approximation as statistics.NormalDist.inv_cdf.
+    """
+    p = np.asarray(p, dtype=float)
+    q = p - 0.5
+    x = np.empty_like(q)
+    central = np.abs(q) <= 0.425
+    r = 0.180625 - q[central] ** 2
+    x[central] = q[central] * np.polyval(_AS241_CENTRAL[0], r) / np.polyval(_AS241_CENTRAL[1], r)
+    tail = ~central
+    r = np.sqrt(-np.log(np.where(q[tail] < 0, p[tail], 1.0 - p[tail])))
+    near = r <= 5.0
+    rn, rf = r - 1.6, r - 5.0
+    t = np.where(
+        near,
+        np.polyval(_AS241_INTERMEDIATE[0], rn) / np.polyval(_AS241_INTERMEDIATE[1], rn),
+        np.polyval(_AS241_TAIL[0], rf) / np.polyval(_AS241_TAIL[1], rf),
+    )
+    x[tail] = np.where(q[tail] < 0, -t, t)
+    return x
+
+
+class Sampler:
+    def __init__(self, seed: Optional[int] = None, buffer_size: int = 1024):
+        """
+        Draws the random values used for mouse speeds, click points and delays from a NumPy Generator. Truncated
+        normals are drawn by inverse transform sampling, so they never loop on rejections. Scalar draws take their
+        uniforms from a buffer that is refilled in batches. Safe to share between threads.
+        Args:
+            seed: Seeds the Generator for reproducible runs. By default it is seeded once from the OS.
+            buffer_size: The number of uniforms drawn per refill.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.buffer_size = buffer_size
+        self.__uniforms: list = []
+        self.__lock = threading.Lock()
+
+    def random(self) -> float:
+        """
+        Returns:
+            A uniform float in [0, 1).
+        """
+        with self.__lock:
+            if not self.__uniforms:
+                self.__uniforms = self.rng.random(self.buffer_size).tolist()
+            return self.__uniforms.pop()
+
+    def integers(self, low: int, high: int) -> int:
+        """
+        Returns:
+            A uniform integer in [low, high), like random.randrange(low, high).
+        """
+        return low + min(int(self.random() * (high - low)), high - low - 1)
+
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * self.random()
+
+    def truncated_normal(self, lower_bound, upper_bound, mean=None, std=None, size: int = None) -> Union[float, np.ndarray]:
+        """
+        Draws from a normal distribution truncated to [lower_bound, upper_bound].
+        Args:
+            lower_bound: The lower bound.
+            upper_bound: The upper bound.
+            mean: The mean of the normal distribution (default is mid-point between bounds).
+            std: The standard deviation of the normal distribution (default is a ninth of the range).
+            size: The number of samples to draw at once. If None, a single float is returned.
+        Returns:
+            A float, or an array of `size` floats.
+        """
+        if mean is None:
+            mean = (lower_bound + upper_bound) / 2
+        if std is None:
+            std = (upper_bound - lower_bound) / 9
+        if size is not None:
+            return self.__truncated_normals(lower_bound, upper_bound, mean, std, size)
+        if std <= 0 or upper_bound <= lower_bound:
+            return float(min(max(mean, lower_bound), upper_bound))
+        a, b = (lower_bound - mean) / std, (upper_bound - mean) / std
+        # Sample the side of the distribution closer to its mean, where the CDF has the most precision
+        flip = a > 0
+        if flip:
+            a, b = -b, -a
+        cdf_a, cdf_b = _normal_cdf(a), _normal_cdf(b)
+        p = min(max(cdf_a + (cdf_b - cdf_a) * self.random(), 1e-300), 1 - 1e-16)
+        z = _STANDARD_NORMAL.inv_cdf(p)
+        return min(max(mean + std * (-z if flip else z), lower_bound), upper_bound)
+
+    def __truncated_normals(self, lower_bound, upper_bound, mean, std, size: int) -> np.ndarray:
+        if std <= 0 or upper_bound <= lower_bound:
+            return np.full(size, float(min(max(mean, lower_bound), upper_bound)))
+        a, b = (lower_bound - mean) / std, (upper_bound - mean) / std
+        # Sample the side of the distribution closer to its mean, where the CDF has the most precision
+        flip = a > 0
+        if flip:
+            a, b = -b, -a
+        cdf_a, cdf_b = _normal_cdf(a), _normal_cdf(b)
+        z = _normal_inv_cdf(cdf_a + (cdf_b - cdf_a) * self.rng.random(size))
+        samples = mean + std * (-z if flip else z)
+        # Guard against rounding just outside the bounds
+        return np.clip(samples, lower_bound, upper_bound)
+
+    def fancy_normal(self, lower_bound, upper_bound, size: int = None) -> Union[float, np.ndarray]:
+        """
+        Draws from a mix of two truncated normals with means at 33% (80% of the time) and 66% of the range.
+        See fancy_normal_sample().
+        """
+        span = upper_bound - lower_bound
+        low_mean, high_mean = lower_bound + span * 0.33, lower_bound + span * 0.66
+        if size is None:
+            mean = low_mean if self.random() < 0.8 else high_mean
+            return self.truncated_normal(lower_bound, upper_bound, mean)
+        low = self.rng.random(size) < 0.8
+        return np.where(
+            low,
+            self.truncated_normal(lower_bound, upper_bound, low_mean, size=size),
+            self.truncated_normal(lower_bound, upper_bound, high_mean, size=size),
+        )
+
+    def point_in(self, x_min, y_min, width, height, seeds: List[List[int]]) -> List[int]:
+        """
+        Returns a random pixel within some bounding box based on a list of seeds. See random_point_in().
+        """
+        if self.integers(0, 101) > 75:
+            # Generate a random pixel within the full bounding box.
+            return self.__point_from(x_min, y_min, width, height)
+
+        # Calculate the dimensions and position of an inner bounding box within the full bounding box.
+        offset_percentage = self.uniform(0.150, 0.350)
+        inner_x_min = round(width * offset_percentage + x_min)
+        inner_y_min = round(height * offset_percentage + y_min)
+        inner_width = round(width * (1.000 - (offset_percentage * 2)))
+        inner_height = round(height * (1.000 - (offset_percentage * 2)))
+
+        # Select a random seed from the list of seeds.
+        seed = seeds[self.integers(0, len(seeds))]
+        ratio_x = round(inner_width * seed[0])
+        ratio_y = round(inner_height * seed[1])
+
+        # Calculate the dimensions and position of a bounding box within the inner bounding box.
+        start_x, start_y = inner_x_min + ratio_x, inner_y_min + ratio_y
+        start_fix_width, end_fix_width = start_x - x_min, width - ratio_x
+        start_fix_height, end_fix_height = start_y - y_min, height - ratio_y
+
+        # Determine the dimensions of the bounding box within the inner bounding box.
+        inner_inner_width = min(start_fix_width, end_fix_width)
+        inner_inner_height = min(start_fix_height, end_fix_height)
+
+        # Generate a random pixel within the bounding box within the inner bounding box.
+        return self.__point_from(start_x, start_y, inner_inner_width, inner_inner_height, centered=False)
+
+    def __point_from(self, x_min, y_min, width, height, centered: bool = True) -> List[int]:
+        """
+        Generates a random pixel within some bounding box, either centered on (x_min, y_min) or with (x_min, y_min)
+        as its top-left corner.
+        """
+        if centered:
+            x_min = x_min + math.ceil(width / 2)
+            y_min = y_min + math.ceil(height / 2)
+        half_width, half_height = math.ceil(width / 2), math.ceil(height / 2)
+        x = int(self.truncated_normal(x_min - half_width, x_min + half_width, x_min, (width / 2) * 0.33))
+        y = int(self.truncated_normal(y_min - half_height, y_min + half_height, y_min, (height / 2) * 0.33))
+        return [x, y]
+
+
+_sampler = Sampler()
+
+
+def get_sampler() -> Sampler:
+    """
+    Returns the Sampler behind this module's functions.
+    """
+    return _sampler
+
+
+def seed(value: Optional[int]) -> None:
+    """
+    Replaces the Sampler behind this module's functions with one seeded with `value`, for reproducible runs.
+    """
+    global _sampler
+    _sampler = Sampler(value)
+
+
 if __name__ == "__main__":
-    import matplotlib.pyplot as plt
-
-    # Truncated normal distribution
-    samples = [truncated_normal_sample(lower_bound=0, upper_bound=100) for _ in range(100000)]
-    print("Truncated normal distribution")
-    print(f"Average output = {sum(samples) / len(samples)}")
-    print(f"Maximum output = {max(samples)}")
-    print(f"Minimum output = {min(samples)}")
-    print()
-    plt.hist(samples, bins=600)
-    plt.title("Truncated normal distribution")
-    plt.show()
-
-    # Fancy normal distribution
-    samples = [fancy_normal_sample(lower_bound=0, upper_bound=100) for _ in range(100000)]
-    print("Truncated normal distribution")
-    print(f"Average output = {sum(samples) / len(samples)}")
-    print(f"Maximum output = {max(samples)}")
-    print(f"Minimum output = {min(samples)}")
+    import sys
+    import time
+
+    def polar_sample(lower_bound, upper_bound, mean, std) -> float:
+        # The rejection sampler truncated_normal_sample used before the Sampler, for comparison. It draws x1 and x2
+        # from a normal rather than a uniform distribution, so it is slightly off the truncated normal it aims for.
+        while True:
+            x1, x2 = np.random.normal(0, 1), np.random.normal(0, 1)
+            z = x1**2 + x2**2
+            if 0 < z <= 1:
+                sample = mean + std * x1 * np.sqrt(-2 * np.log(z) / z)
+                if lower_bound <= sample <= upper_bound:
+                    return sample
+
+    def ks_statistic(samples: np.ndarray, lower_bound, upper_bound, mean, std) -> float:
+        # Largest gap between the empirical CDF and the exact truncated normal CDF
+        samples = np.sort(samples)
+        cdf_a, cdf_b = _normal_cdf((lower_bound - mean) / std), _normal_cdf((upper_bound - mean) / std)
+        exact = (np.array([_normal_cdf((x - mean) / std) for x in samples]) - cdf_a) / (cdf_b - cdf_a)
+        n = len(samples)
+        return max(np.max(np.arange(1, n + 1) / n - exact), np.max(exact - np.arange(n) / n))
+
+    def exact_mean(lower_bound, upper_bound, mean, std) -> float:
+        a, b = (lower_bound - mean) / std, (upper_bound - mean) / std
+        pdf = lambda x: math.exp(-x * x / 2) / math.sqrt(2 * math.pi)  # noqa: E731
+        return mean + std * (pdf(a) - pdf(b)) / (_normal_cdf(b) - _normal_cdf(a))
+
+    # Statistical check: the Sampler's draws must follow the exact truncated normal distribution. With 20,000
+    # samples, a KS statistic above 0.0136 rejects the distribution at the 1% level. Where the old sampler's mean
+    # differs from the new one, compare both with the exact mean.
+    # Run only this check with `python random_util.py --check`; it exits with status 1 if the Sampler fails.
+    n = 20000
+    sampler = Sampler(seed=1)
+    cases = [(0, 100, 50, 100 / 9), (0.03, 0.2, 0.06, 0.17 / 9), (0, 10, 2, 3), (-5, 5, 0, 0.5)]
+    failed = []
+    print(f"{'distribution':>28} {'old KS':>8} {'new KS':>8} {'old mean':>9} {'new mean':>9} {'exact mean':>10}")
+    for case in cases:
+        old = np.array([polar_sample(*case) for _ in range(n)])
+        new = np.array([sampler.truncated_normal(*case) for _ in range(n)])
+        old_ks, new_ks = ks_statistic(old, *case), ks_statistic(new, *case)
+        print(f"{str(case):>28} {old_ks:8.4f} {new_ks:8.4f} {old.mean():9.3f} {new.mean():9.3f} {exact_mean(*case):10.3f}")
+        if new_ks >= 0.0136:
+            failed.append(case)
+    if failed:
+        print(f"FAILED: the Sampler deviates from the truncated normal for {failed}")
+        sys.exit(1)
+    if "--check" in sys.argv:
+        print("OK: the Sampler follows the truncated normal distribution.")
+        sys.exit(0)
+
+    # Benchmark
+    def timed(fn, runs: int = 20000) -> float:
+        start = time.perf_counter()
+        for _ in range(runs):
+            fn()
+        return (time.perf_counter() - start) / runs * 1e6
+
+    seeds = [[0.3, 0.6], [0.5, 0.5], [0.7, 0.2]]
     print()
-    plt.hist(samples, bins=600)
-    plt.title("Fancy normal distribution")
-    plt.show()
-
-    # Chi-squared distribution
-    samples = [chisquared_sample(df=25) for _ in range(100000)]
-    print("Chi-squared distribution")
-    print(f"Average output = {sum(samples) / len(samples)}")
-    print(f"Maximum output = {max(samples)}")
-    print(f"Minimum output = {min(samples)}")
-    plt.hist(samples, bins=600)
-    plt.title("Chi-squared distribution")
-    plt.show()
+    print(f"truncated_normal_sample: old {timed(lambda: polar_sample(0, 100, 50, 100 / 9)):.2f} us, new {timed(lambda: truncated_normal_sample(0, 100)):.2f} us")
+    print(f"fancy_normal_sample:     new {timed(lambda: fancy_normal_sample(0, 100)):.2f} us")
+    print(f"random_point_in:         new {timed(lambda: random_point_in(563, 213, 36, 32, seeds)):.2f} us")
+    batch = timed(lambda: sampler.truncated_normal(0, 100, size=1000), runs=200)
+    print(f"truncated normals drawn 1,000 at a time: {batch / 1000:.2f} us each")
+
+    if "--plot" in sys.argv:
+        import matplotlib.pyplot as plt
+
+        for name, sample in [
+            ("Truncated normal distribution", lambda: truncated_normal_sample(lower_bound=0, upper_bound=100)),
+            ("Fancy normal distribution", lambda: fancy_normal_sample(lower_bound=0, upper_bound=100)),
+            ("Chi-squared distribution", lambda: chisquared_sample(df=25)),
+        ]:
+            samples = [sample() for _ in range(100000)]
+            print(name)
+            print(f"Average output = {statistics.mean(samples)}")
+            print(f"Maximum output = {max(samples)}")
+            print(f"Minimum output = {min(samples)}")
+            print()
+            plt.hist(samples, bins=600)
+            plt.title(name)
+            plt.show()
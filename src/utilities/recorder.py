@@ -0,0 +1,392 @@
+"""
+Records what a bot saw and did so that misbehaviour can be inspected (and replayed) after the fact.
+
+A session is a folder containing:
+    frames.bin: Append-only pixel data. Each captured region is stored either as a keyframe (the full BGR
+                image) or as a delta (the BGR crop of the bounding box that changed since the region's keyframe).
+    index.bin: One fixed-size INDEX_DTYPE record per captured region, written in chunks.
+    events.jsonl: API snapshots (MorgHTTPSocket, StatusSocket, EventsAPIHandler) and input actions, one JSON
+                  object per line.
+    meta.json: Session metadata (start time, client window).
+
+Both binary files are read with np.memmap, so any frame can be rebuilt without loading the whole session.
+SessionReader implements capture.FrameSource, so a recording can be fed straight into capture.ReplayBackend.
+
+The capturing thread only copies the frame into a bounded queue; diffing and disk writes happen on a
+background writer thread. If the writer falls behind, frames are dropped (and counted) rather than stalling
+the bot.
+
+Example:
+    with SessionRecorder("sessions/mining_01"):
+        bot.main_loop()
+"""
+import json
+import pathlib
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+import utilities.capture as capture
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("t", "<f8"),  # Seconds since the session started
+        ("left", "<i4"),  # Captured region on screen
+        ("top", "<i4"),
+        ("width", "<i4"),
+        ("height", "<i4"),
+        ("key", "<i4"),  # Index of the keyframe this record is based on (its own index for keyframes)
+        ("x", "<i4"),  # Stored crop, relative to the region. The full region for keyframes.
+        ("y", "<i4"),
+        ("w", "<i4"),
+        ("h", "<i4"),
+        ("offset", "<i8"),  # Byte offset of the crop in frames.bin
+    ]
+)
+
+__active: Optional["SessionRecorder"] = None
+
+
+def active() -> Optional["SessionRecorder"]:
+    """
+    Returns the recorder that is currently running, or None.
+    """
+    return __active
+
+
+def record_event(kind: str, name: str, data: Any = None) -> None:
+    """
+    Logs an event to the running recorder. Does nothing if no recorder is running, so this is cheap enough to
+    call from hot paths.
+    Args:
+        kind: The event category (E.g., "api", "input").
+        name: What produced the event (E.g., "morg/inv", "click").
+        data: Any JSON-serializable payload.
+    """
+    if __active is not None:
+        __active.record_event(kind, name, data)
+
+
+def _set_active(recorder: Optional["SessionRecorder"]) -> None:
+    global __active
+    __active = recorder
+
+
+class SessionRecorder:
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        keyframe_interval: int = 60,
+        max_queue: int = 32,
+        record_keyboard: bool = True,
+    ):
+        """
+        Records every captured region plus API snapshots and input actions to a session folder.
+        Args:
+            path: The folder to write the session to. Created if it doesn't exist; it must not hold a session yet.
+            keyframe_interval: The maximum number of deltas stored for a region before a new keyframe.
+            max_queue: The maximum number of frames waiting to be written before new frames are dropped.
+            record_keyboard: Whether to log pyautogui key presses while recording.
+        """
+        self.path = pathlib.Path(path)
+        self.keyframe_interval = keyframe_interval
+        self.record_keyboard = record_keyboard
+        self.frames = 0
+        self.dropped = 0
+        self.bytes_written = 0
+        self._frame_queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_queue)
+        self._event_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()  # Serialized events
+        self._writer: Optional[threading.Thread] = None
+        self._t0 = 0.0
+        self._keyboard_originals: Dict[str, Any] = {}
+
+    def __enter__(self) -> "SessionRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def elapsed(self) -> float:
+        """
+        Returns the number of seconds since the recording started.
+        """
+        return time.perf_counter() - self._t0
+
+    def start(self, window: Tuple[int, int, int, int] = None) -> None:
+        """
+        Starts recording.
+        Args:
+            window: The (left, top, width, height) of the client window, used when replaying. If None, the
+                    largest recorded region is used.
+        Raises:
+            FileExistsError: If the folder already holds a session. Frames are indexed by their offset in
+                             frames.bin, so a session can't be appended to.
+        """
+        if active() is not None:
+            raise RuntimeError("A session is already being recorded.")
+        self.path.mkdir(parents=True, exist_ok=True)
+        existing = [name for name in ("meta.json", "frames.bin", "index.bin", "events.jsonl") if self.path.joinpath(name).exists()]
+        if existing:
+            raise FileExistsError(f"{self.path} already holds a session ({', '.join(existing)}). Record to a new folder.")
+        with open(self.path.joinpath("meta.json"), "w") as f:
+            json.dump({"version": 1, "started": time.time(), "window": window}, f)
+        self._t0 = time.perf_counter()
+        self._writer = threading.Thread(target=self.__write_loop, name="SessionRecorder", daemon=True)
+        self._writer.start()
+        capture.add_listener(self.record_frame)
+        if self.record_keyboard:
+            self.__hook_keyboard()
+        _set_active(self)
+
+    def stop(self) -> None:
+        """
+        Stops recording and waits for pending frames to be written.
+        """
+        if self._writer is None:
+            return
+        _set_active(None)
+        capture.remove_listener(self.record_frame)
+        self.__unhook_keyboard()
+        self._frame_queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def record_frame(self, rect, image: np.ndarray) -> None:
+        """
+        Queues a captured region to be written. Called on the capturing thread after every capture.
+        Args:
+            rect: The captured Rectangle.
+            image: The BGR image of the region.
+        """
+        item = (self.elapsed(), rect.left, rect.top, image.copy())
+        try:
+            self._frame_queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def record_event(self, kind: str, name: str, data: Any = None) -> None:
+        """
+        Queues an event to be written. See the module-level record_event(). The event is serialized right away, so
+        the caller is free to modify `data` afterwards.
+        """
+        self._event_queue.put(json.dumps({"t": self.elapsed(), "kind": kind, "name": name, "data": data}, default=str))
+
+    def __hook_keyboard(self) -> None:
+        """
+        Wraps pyautogui's keyboard functions so key presses are logged as input events.
+        """
+        try:
+            import pyautogui as pag
+        except Exception:
+            return
+        for name in ("keyDown", "keyUp", "press", "hotkey", "write"):
+            if (original := getattr(pag, name, None)) is None:
+                continue
+            self._keyboard_originals[name] = original
+
+            def wrapper(*args, __original=original, __name=name, **kwargs):
+                record_event("input", __name, {"args": [str(a) for a in args]})
+                return __original(*args, **kwargs)
+
+            setattr(pag, name, wrapper)
+
+    def __unhook_keyboard(self) -> None:
+        if not self._keyboard_originals:
+            return
+        import pyautogui as pag
+
+        for name, original in self._keyboard_originals.items():
+            setattr(pag, name, original)
+        self._keyboard_originals = {}
+
+    def __write_loop(self) -> None:
+        """
+        Diffs and writes queued frames and events until stop() is called.
+        """
+        keyframes: Dict[tuple, Tuple[int, np.ndarray, int]] = {}  # region -> (index, image, deltas since)
+        records: List[tuple] = []
+        offset = 0
+        with open(self.path.joinpath("frames.bin"), "wb") as frames, open(self.path.joinpath("index.bin"), "wb") as index, open(
+            self.path.joinpath("events.jsonl"), "w"
+        ) as events:
+            while True:
+                try:
+                    item = self._frame_queue.get(timeout=0.25)
+                except queue.Empty:
+                    item = ()
+                if item:
+                    t, left, top, image = item
+                    h, w = image.shape[:2]
+                    region = (left, top, w, h)
+                    n = self.frames
+                    key = keyframes.get(region)
+                    crop = self.__changed_area(image, key[1]) if key and key[2] < self.keyframe_interval else None
+                    if crop is None:
+                        keyframes[region] = (n, image, 0)
+                        x, y, cw, ch = 0, 0, w, h
+                        pixels = image
+                    else:
+                        keyframes[region] = (key[0], key[1], key[2] + 1)
+                        x, y, cw, ch = crop
+                        pixels = image[y : y + ch, x : x + cw]
+                    data = np.ascontiguousarray(pixels).tobytes()
+                    frames.write(data)
+                    records.append((t, left, top, w, h, keyframes[region][0], x, y, cw, ch, offset))
+                    offset += len(data)
+                    self.bytes_written += len(data)
+                    self.frames += 1
+                # Flush in chunks to keep the number of small writes down
+                if records and (len(records) >= 32 or not item):
+                    frames.flush()
+                    index.write(np.array(records, dtype=INDEX_DTYPE).tobytes())
+                    index.flush()
+                    records = []
+                while True:
+                    try:
+                        line = self._event_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    events.write(line + "\n")
+                events.flush()
+                if item is None:
+                    break
+
+    def __changed_area(self, image: np.ndarray, keyframe: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Finds the bounding box of the pixels that differ from the keyframe.
+        Returns:
+            (x, y, w, h) of the changed area (all zeros if nothing changed), or None if a new keyframe is cheaper.
+        """
+        h, w = image.shape[:2]
+        diff = cv2.absdiff(image, keyframe)
+        # View the BGR channels side by side so a change in any channel shows up in the bounding box
+        x, y, bw, bh = cv2.boundingRect(diff.reshape(h, w * 3))
+        if bw == 0:
+            return 0, 0, 0, 0
+        x0, x1 = x // 3, -(-(x + bw) // 3)
+        if (x1 - x0) * bh > w * h // 2:
+            return None
+        return x0, y, x1 - x0, bh
+
+
+class SessionReader(capture.FrameSource):
+    def __init__(self, path: Union[str, pathlib.Path]):
+        """
+        Reads a session written by SessionRecorder. Pixel data is memory-mapped, so opening a long session is
+        instant and frames are only read from disk when requested.
+        Args:
+            path: The session folder.
+        """
+        self.path = pathlib.Path(path)
+        with open(self.path.joinpath("meta.json")) as f:
+            self.meta = json.load(f)
+        index_path = self.path.joinpath("index.bin")
+        count = index_path.stat().st_size // INDEX_DTYPE.itemsize
+        self.index = np.memmap(index_path, dtype=INDEX_DTYPE, mode="r", shape=(count,)) if count else np.zeros(0, dtype=INDEX_DTYPE)
+        frames_path = self.path.joinpath("frames.bin")
+        self._pixels = np.memmap(frames_path, dtype=np.uint8, mode="r") if frames_path.stat().st_size else np.zeros(0, dtype=np.uint8)
+        self._regions = [(float(r["t"]), int(r["left"]), int(r["top"]), int(r["width"]), int(r["height"])) for r in self.index]
+        self._last: Tuple[int, Optional[np.ndarray]] = (-1, None)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def regions(self) -> List[Tuple[float, int, int, int, int]]:
+        return self._regions
+
+    def window_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        if window := self.meta.get("window"):
+            return tuple(window)
+        return super().window_rect()
+
+    def __crop(self, i: int) -> np.ndarray:
+        r = self.index[i]
+        size = int(r["w"]) * int(r["h"]) * 3
+        return self._pixels[int(r["offset"]) : int(r["offset"]) + size].reshape(int(r["h"]), int(r["w"]), 3)
+
+    def image(self, index: int) -> np.ndarray:
+        """
+        Rebuilds the BGR image of a recorded region. Keyframes are returned as read-only views of the file.
+        """
+        if self._last[0] == index:
+            return self._last[1]
+        r = self.index[index]
+        key = int(r["key"])
+        if key == index:
+            image = self.__crop(index)
+        else:
+            image = np.array(self.__crop(key))
+            if r["w"]:
+                x, y = int(r["x"]), int(r["y"])
+                image[y : y + int(r["h"]), x : x + int(r["w"])] = self.__crop(index)
+        self._last = (index, image)
+        return image
+
+    def events(self, kind: str = None) -> List[Dict[str, Any]]:
+        """
+        Loads the recorded events.
+        Args:
+            kind: Only return events of this kind (E.g., "input"). If None, all events are returned.
+        Returns:
+            A list of event dicts with "t", "kind", "name" and "data" keys, in recording order.
+        """
+        events_path = self.path.joinpath("events.jsonl")
+        if not events_path.exists():
+            return []
+        with open(events_path) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+        return [e for e in events if kind is None or e["kind"] == kind]
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+    from utilities.geometry import Rectangle
+
+    # Simulates full-rate capture of a resizable game view where a small part of the scene changes each frame
+    class _MovingBox(capture.CaptureBackend):
+        def __init__(self):
+            self.frame = np.random.randint(0, 255, (800, 1200, 3), dtype=np.uint8)
+            self.n = 0
+
+        def grab(self, rect, out=None):
+            self.n += 1
+            x = (self.n * 7) % 1000
+            self.frame[300:380, x : x + 80] = self.n % 255
+            res = self.frame[rect.top : rect.top + rect.height, rect.left : rect.left + rect.width]
+            if out is None:
+                return res.copy()
+            np.copyto(out, res)
+            return out
+
+    source = _MovingBox()
+    capture.set_backend_factory(lambda: source)
+    game_view = Rectangle(0, 0, 1200, 800)
+    folder = tempfile.mkdtemp(prefix="session_")
+    seconds = 5
+    with SessionRecorder(folder) as rec:
+        end = time.perf_counter() + seconds
+        grabs = 0
+        while time.perf_counter() < end:
+            game_view.screenshot()
+            record_event("input", "click", {"x": 1, "y": 2})
+            grabs += 1
+    raw = grabs * 1200 * 800 * 3
+    # The capture loop here is far faster than a real client, so drops show the writer's ceiling
+    print(f"Captured {grabs / seconds:.0f} frames/sec, writer sustained {rec.frames / seconds:.0f} frames/sec, dropped {rec.dropped}.")
+    print(f"Raw size {raw / 1e6:.0f} MB, recorded size {rec.bytes_written / 1e6:.1f} MB.")
+
+    reader = SessionReader(folder)
+    start = time.perf_counter()
+    for i in np.random.randint(0, len(reader), 200):
+        reader.image(int(i))
+    print(f"Random access: {(time.perf_counter() - start) / 200 * 1000:.2f} ms/frame. Events: {len(reader.events())}")
@@ -0,0 +1,484 @@
+"""
+Runs a bot's main_loop against a recorded session (see recorder.py) to benchmark loop-level performance.
+
+While the harness runs:
+    - Captures are served from the session through capture.ReplayBackend.
+    - The bot's Mouse and pyautogui's mouse/keyboard functions are replaced by stubs that only log actions.
+    - time.sleep() advances a virtual clock instantly. time.time(), time.monotonic() and time.perf_counter()
+      read the virtual clock, so timers in the bot behave as they did during the recording.
+    - API snapshots recorded in the session are served back (StatusSocket, EventsAPIHandler, MorgHTTPSocket).
+    - random_util (through rd.seed()), random and np.random are seeded with the harness's seed, so runs are repeatable.
+
+The run ends when the virtual clock passes the end of the session. The report contains the number of decisions
+(input actions) made, decisions per real second, real time spent per decision (almost entirely perception,
+since inputs and sleeps are free), and a diff of the actions against the ones recorded in the session.
+
+Usage:
+    python replay_harness.py <session folder> <bot class> [--options '{"running_time": 5}'] [--seed 0]
+    E.g., python replay_harness.py ../sessions/mining_01 model.osrs.mining.OSRSMining
+
+    python replay_harness.py --check
+    Replays a synthetic session through a bot that clicks through bot.inputs (as the mining bot does) and exits
+    with a non-zero status if its clicks don't reach the harness.
+"""
+import concurrent.futures
+import difflib
+import importlib
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import utilities.capture as capture
+import utilities.random_util as rd
+import utilities.recorder as recorder
+from utilities.geometry import Point
+from utilities.mouse import Mouse
+
+# Real clocks, captured before the harness patches the time module
+_real_perf_counter = time.perf_counter
+
+
+class ReplayFinished(BaseException):
+    """
+    Raised inside the bot when the session runs out of frames. Derives from BaseException so the bots'
+    `except Exception` handlers don't swallow it.
+    """
+
+    pass
+
+
+class VirtualClock:
+    def __init__(self, start: float, end: float, wall_start: float = 0.0, read_cost: float = 0.001):
+        """
+        A clock that only advances when something sleeps on it.
+        Args:
+            start: The session timestamp to start at.
+            end: The session timestamp at which the run ends.
+            wall_start: The epoch time at which the session was recorded, returned by time() at `start`.
+            read_cost: Seconds added on every read, so loops that poll the time without sleeping still end.
+        """
+        self.now = start
+        self.end = end
+        self.wall_offset = wall_start - start
+        self.read_cost = read_cost
+        self.on_advance = None  # Called with the new time after every sleep
+
+    def __check(self) -> None:
+        if self.now > self.end:
+            raise ReplayFinished()
+
+    def sleep(self, seconds: float) -> None:
+        self.now += max(seconds, 0)
+        if self.on_advance:
+            self.on_advance(self.now)
+        self.__check()
+
+    def monotonic(self) -> float:
+        self.now += self.read_cost
+        self.__check()
+        return self.now
+
+    def time(self) -> float:
+        return self.monotonic() + self.wall_offset
+
+
+class ReplayMouse(Mouse):
+    def __init__(self, harness: "ReplayHarness"):
+        """
+        A Mouse that logs actions instead of moving the cursor. Movements happen instantly.
+        """
+        self.harness = harness
+
+    def move_to(self, destination: tuple, **kwargs):
+        self.harness.position = Point(int(destination[0]), int(destination[1]))
+        self.harness.action("move_to", {"x": self.harness.position.x, "y": self.harness.position.y})
+
+    def move_rel(self, x: int, y: int, x_var: int = 0, y_var: int = 0, **kwargs):
+        self.move_to((self.harness.position.x + x, self.harness.position.y + y))
+
+    def click(self, button="left", force_delay=False, check_red_click=False) -> tuple:
+        self.harness.action("click", {"button": button, "x": self.harness.position.x, "y": self.harness.position.y})
+        # Nothing reacts to clicks during a replay, so assume every click landed
+        return True if check_red_click else None
+
+    def click_checked(self, button="left", force_delay=False) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        future.set_result(self.click(button=button, force_delay=force_delay, check_red_click=True))
+        return future
+
+    def right_click(self, force_delay=False):
+        self.click(button="right", force_delay=force_delay)
+
+
+class _TimedReplayBackend(capture.ReplayBackend):
+    """
+    A ReplayBackend that keeps track of the real time spent capturing.
+    """
+
+    seconds = 0.0
+
+    def grab(self, rect, out=None):
+        start = _real_perf_counter()
+        image = super().grab(rect, out)
+        self.seconds += _real_perf_counter() - start
+        return image
+
+
+class _HarnessController:
+    """
+    Stands in for the BotController, collecting log messages instead of displaying them.
+    """
+
+    def __init__(self, model, verbose: bool = False):
+        self.model = model
+        self.verbose = verbose
+        self.logs: List[str] = []
+
+    def update_status(self):
+        pass
+
+    def update_progress(self):
+        pass
+
+    def update_log(self, msg: str, overwrite: bool = False):
+        self.logs.append(msg)
+        if self.verbose:
+            print(f"Log: {msg}")
+
+    def clear_log(self):
+        pass
+
+
+class _HarnessThread:
+    """
+    Stands in for the BotThread. Stopping the bot ends the run.
+    """
+
+    def is_alive(self) -> bool:
+        return True
+
+    def stop(self) -> None:
+        raise ReplayFinished()
+
+    def join(self, timeout=None) -> None:
+        pass
+
+
+class ReplayReport:
+    def __init__(
+        self,
+        decisions: int,
+        real_seconds: float,
+        virtual_seconds: float,
+        grabs: int,
+        capture_seconds: float,
+        misses: int,
+        diff: List[str],
+        actions: List[Tuple[float, str, Dict[str, Any]]],
+    ):
+        """
+        The results of a replay run.
+        Args:
+            decisions: The number of input actions the bot made.
+            real_seconds: The real time the run took.
+            virtual_seconds: The session time covered by the run.
+            grabs: The number of captures the bot made.
+            capture_seconds: The real time spent serving captures.
+            misses: Captures no recorded frame covered (served black).
+            diff: A unified diff of the recorded actions against the replayed ones.
+            actions: The replayed actions as (session time, name, data) tuples.
+        """
+        self.decisions = decisions
+        self.real_seconds = real_seconds
+        self.virtual_seconds = virtual_seconds
+        self.grabs = grabs
+        self.capture_seconds = capture_seconds
+        self.misses = misses
+        self.diff = diff
+        self.actions = actions
+
+    def decisions_per_second(self) -> float:
+        return self.decisions / self.real_seconds if self.real_seconds else 0.0
+
+    def ms_per_decision(self) -> float:
+        return self.real_seconds / self.decisions * 1000 if self.decisions else 0.0
+
+    def __str__(self):
+        changed = sum(1 for line in self.diff if line[:1] in "+-" and line[:3] not in ("+++", "---"))
+        return (
+            f"Replayed {self.virtual_seconds:.1f}s of session in {self.real_seconds:.2f}s.\n"
+            f"Decisions: {self.decisions} ({self.decisions_per_second():.1f}/sec, {self.ms_per_decision():.1f} ms each).\n"
+            f"Captures: {self.grabs} ({self.capture_seconds * 1000 / max(self.grabs, 1):.2f} ms each, {self.misses} uncovered).\n"
+            f"Action diff vs. recording: {changed} changed lines."
+        )
+
+
+class ReplayHarness:
+    def __init__(self, session: recorder.SessionReader, bot, seed: int = 0, grid: int = 25, verbose: bool = False):
+        """
+        Prepares a bot to run against a recorded session.
+        Args:
+            session: The recorded session.
+            bot: An instance of the bot to run. Its options should already be saved.
+            seed: Seed for the global random generators, so runs are repeatable.
+            grid: Cursor positions are snapped to a grid of this size when diffing actions, as targets are
+                  randomized within objects.
+            verbose: Whether to print the bot's log messages.
+        """
+        self.session = session
+        self.bot = bot
+        self.seed = seed
+        self.grid = grid
+        self.verbose = verbose
+        self.position = Point(0, 0)
+        self.actions: List[Tuple[float, str, Dict[str, Any]]] = []
+        wall_start = session.meta.get("started", 0.0)
+        self.clock = VirtualClock(session.start_time(), session.end_time(), wall_start)
+        self.backend = _TimedReplayBackend(session, clock=lambda: self.clock.now)
+        self.__api_events = session.events("api")
+        self.__api_index = 0
+        self.__morg: Dict[str, Any] = {}
+
+    def action(self, name: str, data: Dict[str, Any]) -> None:
+        """
+        Logs an input action made by the bot.
+        """
+        self.actions.append((self.clock.now, name, data))
+
+    def __apply_api_events(self, now: float) -> None:
+        """
+        Serves the API snapshots recorded up to `now`.
+        """
+        import utilities.api.status_socket as status_socket
+        from utilities.api.events_server import EventsAPIHandler
+
+        while self.__api_index < len(self.__api_events) and self.__api_events[self.__api_index]["t"] <= now:
+            event = self.__api_events[self.__api_index]
+            source, _, endpoint = event["name"].partition("/")
+            if source == "status":
+                status_socket.player_data = event["data"]
+            elif source == "events":
+                EventsAPIHandler.cache[endpoint] = event["data"]
+            elif source == "morg":
+                self.__morg[endpoint] = event["data"]
+            self.__api_index += 1
+
+    def __patch(self) -> List[Tuple[Any, str, Any]]:
+        """
+        Installs the stubs. Returns what is needed to undo them.
+        """
+        import pyautogui as pag
+
+        import utilities.input_backend as input_backend
+        from utilities.api.morg_http_client import MorgHTTPSocket
+
+        def key_stub(name):
+            return lambda *args, **kwargs: self.action(name, {"args": [str(a) for a in args]})
+
+        def click_stub(*args, button="left", **kwargs):
+            self.action("click", {"button": button, "x": self.position.x, "y": self.position.y})
+
+        def move_stub(x=None, y=None, *args, **kwargs):
+            if isinstance(x, (tuple, list)):
+                x, y = x[:2]
+            self.position = Point(int(x), int(y))
+
+        def morg_stub(socket, endpoint: str) -> dict:
+            return self.__morg.get(endpoint, {})
+
+        window = self.session.window_rect() or (0, 0, 1920, 1080)
+        pyautogui_backend = input_backend.PyAutoGUIBackend()
+        patches = [
+            (time, "sleep", self.clock.sleep),
+            (time, "time", self.clock.time),
+            (time, "monotonic", self.clock.monotonic),
+            (time, "perf_counter", self.clock.monotonic),
+            (pag, "position", lambda *args: self.position),
+            (pag, "size", lambda: (window[0] + window[2], window[1] + window[3])),
+            (pag, "moveTo", move_stub),
+            (pag, "click", click_stub),
+            (pag, "mouseDown", lambda *args, **kwargs: None),
+            (pag, "mouseUp", lambda *args, **kwargs: None),
+            (MorgHTTPSocket, "_MorgHTTPSocket__do_get", morg_stub),
+            # Route input through the pyautogui stubs above, whichever backend the bot was configured with
+            (input_backend, "get_backend", lambda: pyautogui_backend),
+        ]
+        patches += [(pag, name, key_stub(name)) for name in ("keyDown", "keyUp", "press", "hotkey", "write")]
+        undo = []
+        for owner, name, replacement in patches:
+            undo.append((owner, name, owner.__dict__.get(name, getattr(owner, name, None))))
+            setattr(owner, name, replacement)
+        return undo
+
+    def run(self) -> ReplayReport:
+        """
+        Runs the bot's main_loop until the session ends.
+        Returns:
+            A ReplayReport.
+        """
+        from model.bot import BotStatus
+
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        rd.seed(self.seed)
+        self.bot.set_controller(_HarnessController(self.bot, self.verbose))
+        self.bot.mouse = ReplayMouse(self)
+        self.bot.thread = _HarnessThread()
+        self.clock.on_advance = self.__apply_api_events
+        self.__apply_api_events(self.clock.now)
+        capture.set_backend_factory(lambda: self.backend)
+        undo = self.__patch()
+        start_virtual = self.clock.now
+        start = _real_perf_counter()
+        try:
+            self.bot.win.initialize()
+            self.bot.status = BotStatus.RUNNING
+            self.bot.main_loop()
+        except ReplayFinished:
+            pass
+        finally:
+            real_seconds = _real_perf_counter() - start
+            for owner, name, original in reversed(undo):
+                setattr(owner, name, original)
+            capture.set_backend_factory(capture.MSSBackend)
+            rd.seed(None)
+            self.bot.inputs.shutdown()
+        return ReplayReport(
+            decisions=len(self.actions),
+            real_seconds=real_seconds,
+            virtual_seconds=self.clock.now - start_virtual,
+            grabs=self.backend.grabs,
+            capture_seconds=self.backend.seconds,
+            misses=self.backend.misses,
+            diff=self.diff(),
+            actions=list(self.actions),
+        )
+
+    def __describe(self, name: str, data: Dict[str, Any]) -> str:
+        """
+        Formats an action for diffing.
+        """
+        if data and "x" in data:
+            x, y = data["x"] // self.grid * self.grid, data["y"] // self.grid * self.grid
+            return f"{name} {data.get('button', '')} ({x}, {y})".replace("  ", " ")
+        return f"{name} {' '.join((data or {}).get('args', []))}".strip()
+
+    def diff(self) -> List[str]:
+        """
+        Compares the replayed actions with the actions recorded in the session.
+        Returns:
+            The lines of a unified diff (empty if they match).
+        """
+        recorded = [self.__describe(e["name"], e["data"]) for e in self.session.events("input") if e["t"] <= self.clock.now]
+        replayed = [self.__describe(name, data) for _, name, data in self.actions]
+        return list(difflib.unified_diff(recorded, replayed, "recorded", "replayed", lineterm=""))
+
+
+def load_bot(class_path: str, options: Optional[Dict[str, Any]] = None):
+    """
+    Creates a bot from its import path and saves its options.
+    Args:
+        class_path: E.g., "model.osrs.mining.OSRSMining".
+        options: Options to pass to the bot's save_options(). If None, the bot's defaults are used.
+    Returns:
+        The bot instance.
+    """
+    module_name, class_name = class_path.rsplit(".", 1)
+    bot = getattr(importlib.import_module(module_name), class_name)()
+    bot.set_controller(_HarnessController(bot))
+    if options:
+        bot.save_options(options)
+    bot.options_set = True
+    return bot
+
+
+def self_check(seconds: float = 1.0) -> ReplayReport:
+    """
+    Replays a synthetic session through a bot that moves and clicks through bot.inputs, as the mining bot does,
+    and checks that every click reaches the harness rather than the real mouse.
+    Args:
+        seconds: The length of the session to record.
+    Returns:
+        The ReplayReport of the run.
+    Raises:
+        AssertionError: If the bot's clicks are missing from the report.
+    """
+    import shutil
+    import tempfile
+
+    from model.bot import Bot
+    from utilities.geometry import Rectangle
+    from utilities.window import MockWindow
+
+    class StillBackend(capture.CaptureBackend):
+        def grab(self, rect, out=None):
+            return np.zeros((rect.height, rect.width, 3), dtype=np.uint8) if out is None else out
+
+    class ClickingBot(Bot):
+        def __init__(self):
+            super().__init__("OSRS", "Replay check", "Clicks through bot.inputs.", MockWindow())
+
+        def create_options(self):
+            pass
+
+        def save_options(self, options: dict):
+            self.options_set = True
+
+        def main_loop(self):
+            while True:
+                self.inputs.move_click(Point(100, 100), verify=lambda: True, mouseSpeed="medium").result()
+                time.sleep(0.2)
+
+    folder = tempfile.mkdtemp(prefix="replay_check_")
+    try:
+        capture.set_backend_factory(StillBackend)
+        view = Rectangle(0, 0, 200, 200)
+        with recorder.SessionRecorder(folder, record_keyboard=False):
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                view.screenshot()
+                time.sleep(0.05)
+        capture.set_backend_factory(capture.MSSBackend)
+        bot = ClickingBot()
+        report = ReplayHarness(recorder.SessionReader(folder), bot).run()
+    finally:
+        capture.set_backend_factory(capture.MSSBackend)
+        shutil.rmtree(folder, ignore_errors=True)
+    clicks = [data for _, name, data in report.actions if name == "click"]
+    assert clicks, "No clicks made through bot.inputs reached the harness."
+    assert all((data["x"], data["y"]) == (100, 100) for data in clicks), f"Clicks landed in the wrong place: {clicks}"
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+    parser = argparse.ArgumentParser(description="Replay a recorded session through a bot's main loop.")
+    parser.add_argument("session", nargs="?", help="Path to a session folder written by SessionRecorder.")
+    parser.add_argument("bot", nargs="?", help='Import path of the bot class (E.g., "model.osrs.mining.OSRSMining").')
+    parser.add_argument("--options", default=None, help="JSON dict of options for the bot's save_options().")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="Print the bot's log messages.")
+    parser.add_argument("--show-diff", action="store_true", help="Print the full action diff.")
+    parser.add_argument("--check", action="store_true", help="Check that input queued through bot.inputs is replayed.")
+    args = parser.parse_args()
+
+    if args.check:
+        report = self_check()
+        print(f"OK: {sum(1 for _, name, _ in report.actions if name == 'click')} clicks made through bot.inputs were replayed.")
+        sys.exit(0)
+    if args.session is None or args.bot is None:
+        parser.error("the session and bot arguments are required unless --check is given")
+
+    bot = load_bot(args.bot, json.loads(args.options) if args.options else None)
+    report = ReplayHarness(recorder.SessionReader(args.session), bot, seed=args.seed, verbose=args.verbose).run()
+    print(report)
+    if args.show_diff:
+        print("\n".join(report.diff))
@@ -5,7 +5,7 @@ TODO: Similarly to OCR, should these functions accept the Rect as an argument an
 the screenshotting/color manipulation here? It would allow each RL Object to be created
 with its Rectangle reference property.
 """
-from typing import List
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -72,3 +72,135 @@ def is_point_obstructed(point: Point, im: cv2.Mat, span: int = 30) -> bool:
     except Exception as e:
         print(f"Error in is_point_obstructed(): {e}")
         return True
+
+
+class Segment(NamedTuple):
+    """
+    A single object found by Segmenter. Coordinates are relative to the segmented mask.
+    Attributes:
+        label: The watershed label of the object.
+        x, y, w, h: The bounding box of the object's first outer contour, as found by cv2.findContours. This is the
+                    bounding box of the whole object unless the watershed left it in several pieces.
+        pixels: The number of pixels in the object, across all of its pieces.
+        centroid: The (x, y) mean of the object's pixels, across all of its pieces.
+        contour_area: The area enclosed by the object's first outer contour. For outlines, this is the area inside
+                      the outline rather than the number of outline pixels.
+    """
+
+    label: int
+    x: int
+    y: int
+    w: int
+    h: int
+    pixels: int
+    centroid: Tuple[float, float]
+    contour_area: float
+
+
+class Segmenter:
+    def __init__(self, fg_ratio: float = 0.5, bg_iterations: int = 3):
+        """
+        Splits touching objects in a binary mask using a distance transform and watershed. The work is done on
+        the bounding box of the mask only, per-object statistics are computed in a single pass over the
+        labelled pixels, and scratch buffers are reused between calls. The cost of a call therefore scales
+        with the tagged area, not with the frame size or the number of objects.
+        Args:
+            fg_ratio: Pixels further from the background than this fraction of the maximum distance are
+                      considered certain foreground (the watershed seeds).
+            bg_iterations: How many times the mask is dilated (3x3) to find certain background.
+        """
+        self.fg_ratio = fg_ratio
+        self.bg_iterations = bg_iterations
+        self.markers: Optional[np.ndarray] = None  # Watershed markers of the last call, cropped to roi
+        self.roi: Tuple[int, int, int, int] = (0, 0, 0, 0)  # (x, y, w, h) of the last crop within the mask
+        self.__buffers: Dict[str, np.ndarray] = {}
+
+    def __scratch(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        Gets a view of a reusable buffer. Buffers only grow, so frames of a similar size never reallocate.
+        """
+        buffer = self.__buffers.get(name)
+        if buffer is None or any(b < s for b, s in zip(buffer.shape, shape)):
+            grown = shape if buffer is None else tuple(max(b, s) for b, s in zip(buffer.shape, shape))
+            buffer = self.__buffers[name] = np.empty(grown, dtype=dtype)
+        return buffer[tuple(slice(0, s) for s in shape)]
+
+    def segment(self, mask: cv2.Mat) -> List[Segment]:
+        """
+        Segments a binary mask into separate objects.
+        Args:
+            mask: A single channel uint8 mask where objects are non-zero.
+        Returns:
+            A list of Segments, in label order. Empty if the mask is blank.
+        """
+        x, y, w, h = cv2.boundingRect(mask)
+        if w == 0 or h == 0:
+            self.markers, self.roi = None, (0, 0, 0, 0)
+            return []
+        # Pad the crop so the dilation below doesn't run into its edges, leaving a ring of background seeds inside
+        # the crop's outermost ring (which cv2.watershed overwrites with boundary labels)
+        pad = self.bg_iterations + 2
+        img_h, img_w = mask.shape[:2]
+        # cv2.connectedComponents scans 2x2 blocks, so an even origin numbers the objects as on the full frame
+        x0, y0 = max(x - pad, 0) & ~1, max(y - pad, 0) & ~1
+        x1, y1 = min(x + w + pad, img_w), min(y + h + pad, img_h)
+        crop = mask[y0:y1, x0:x1]
+        shape = crop.shape[:2]
+
+        dist = cv2.distanceTransform(crop, cv2.DIST_L2, 5, dst=self.__scratch("dist", shape, np.float32))
+        # The crop always contains background (distance 0), so this normalizes exactly as the full frame would
+        cv2.normalize(dist, dist, 0, 1.0, cv2.NORM_MINMAX)
+        sure_fg = cv2.compare(dist, self.fg_ratio, cv2.CMP_GT, dst=self.__scratch("fg", shape, np.uint8))
+        sure_bg = cv2.dilate(crop, np.ones((3, 3), np.uint8), dst=self.__scratch("bg", shape, np.uint8), iterations=self.bg_iterations)
+        unknown = cv2.subtract(sure_bg, sure_fg, dst=self.__scratch("unknown", shape, np.uint8))
+
+        _, markers = cv2.connectedComponents(sure_fg)
+        markers += 1
+        markers[unknown == 255] = 0
+        markers = cv2.watershed(cv2.cvtColor(crop, cv2.COLOR_GRAY2BGR, dst=self.__scratch("bgr", (*shape, 3), np.uint8)), markers)
+        self.markers, self.roi = markers, (x0, y0, x1 - x0, y1 - y0)
+
+        # Background is label 1 and boundaries are -1, objects are 2 and up
+        ys, xs = np.nonzero(markers > 1)
+        if not len(xs):
+            return []
+        labels = markers[ys, xs]
+        order = np.argsort(labels, kind="stable")
+        labels, xs, ys = labels[order], xs[order], ys[order]
+        starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+        counts = np.diff(np.r_[starts, len(labels)])
+        x_min, x_max = np.minimum.reduceat(xs, starts), np.maximum.reduceat(xs, starts)
+        y_min, y_max = np.minimum.reduceat(ys, starts), np.maximum.reduceat(ys, starts)
+        x_sum, y_sum = np.add.reduceat(xs, starts), np.add.reduceat(ys, starts)
+
+        segments: List[Segment] = []
+        for i, start in enumerate(starts):
+            label = int(labels[start])
+            bx, by = int(x_min[i]), int(y_min[i])
+            bw, bh = int(x_max[i]) - bx + 1, int(y_max[i]) - by + 1
+            # Contours only need the object's own bounding box. Cropping keeps the contours in the same order as
+            # on the full frame, so an object in pieces is described by the same first contour as before.
+            obj = np.uint8(markers[by : by + bh, bx : bx + bw] == label)
+            contours, _ = cv2.findContours(obj, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            if len(contours) > 1:
+                cx, cy, bw, bh = cv2.boundingRect(contours[0])
+                bx, by = bx + cx, by + cy
+            contour_area = cv2.contourArea(contours[0])
+            n = int(counts[i])
+            centroid = (x0 + x_sum[i] / n, y0 + y_sum[i] / n)
+            segments.append(Segment(label, x0 + bx, y0 + by, bw, bh, n, centroid, contour_area))
+        return segments
+
+    def full_markers(self, shape: Tuple[int, int]) -> np.ndarray:
+        """
+        Expands the markers of the last call to the size of the segmented mask, for debug visualizations.
+        Args:
+            shape: The (height, width) of the mask passed to segment().
+        Returns:
+            An int32 array where background is 1, boundaries are -1 and objects are 2 and up.
+        """
+        full = np.ones(shape[:2], dtype=np.int32)
+        if self.markers is not None:
+            x, y, w, h = self.roi
+            full[y : y + h, x : x + w] = self.markers
+        return full
@@ -0,0 +1,121 @@
+"""
+Names of the fixed slots in the control panel's interfaces, in slot order (left to right, top to bottom).
+
+These map a name to the index of its Rectangle in the matching Window list, E.g.:
+    win.spellbook_normal[SPELLBOOK_NORMAL.index("Camelot Teleport")]
+Use Window.spell() and Window.prayer() instead of indexing by hand.
+
+Names are spelled as in game (and on the wiki), so a slot's sprite scraped with SpriteScraper is saved as the
+name with underscores for spaces (E.g., "Camelot_Teleport.png"). Window.verify_slots() checks slots against
+sprites saved in images/bot/spellbooks/<spellbook> and images/bot/prayers; fetch them by running this module with
+`fetch` (E.g., `python src/utilities/slot_tables.py fetch normal`).
+"""
+from typing import Dict, Tuple
+
+# https://i.imgur.com/vkKAfV5.png
+# fmt: off
+SPELLBOOK_NORMAL = (
+    "Lumbridge Home Teleport", "Wind Strike", "Confuse", "Enchant Crossbow Bolt", "Water Strike", "Lvl-1 Enchant", "Earth Strike",
+    "Weaken", "Fire Strike", "Bones to Bananas", "Wind Bolt", "Curse", "Bind", "Low Level Alchemy",
+    "Water Bolt", "Varrock Teleport", "Lvl-2 Enchant", "Earth Bolt", "Lumbridge Teleport", "Telekinetic Grab", "Fire Bolt",
+    "Falador Teleport", "Crumble Undead", "Teleport to House", "Wind Blast", "Superheat Item", "Camelot Teleport", "Water Blast",
+    "Lvl-3 Enchant", "Iban Blast", "Snare", "Magic Dart", "Ardougne Teleport", "Earth Blast", "High Level Alchemy",
+    "Charge Water Orb", "Lvl-4 Enchant", "Watchtower Teleport", "Fire Blast", "Charge Earth Orb", "Bones to Peaches", "Saradomin Strike",
+    "Claws of Guthix", "Flames of Zamorak", "Trollheim Teleport", "Wind Wave", "Charge Fire Orb", "Ape Atoll Teleport", "Water Wave",
+    "Charge Air Orb", "Vulnerability", "Lvl-5 Enchant", "Kourend Castle Teleport", "Earth Wave", "Enfeeble", "Teleother Lumbridge",
+    "Fire Wave", "Entangle", "Stun", "Charge", "Wind Surge", "Teleother Falador", "Water Surge",
+    "Tele Block", "Teleport to Target", "Lvl-6 Enchant", "Teleother Camelot", "Earth Surge", "Lvl-7 Enchant", "Fire Surge",
+)
+
+SPELLBOOK_ANCIENT = (
+    "Edgeville Home Teleport", "Smoke Rush", "Shadow Rush", "Paddewwa Teleport", "Blood Rush", "Ice Rush", "Senntisten Teleport",
+    "Smoke Burst", "Shadow Burst", "Kharyrll Teleport", "Blood Burst", "Ice Burst", "Lassar Teleport", "Smoke Blitz",
+    "Shadow Blitz", "Dareeyak Teleport", "Blood Blitz", "Ice Blitz", "Carrallangar Teleport", "Teleport to Target", "Smoke Barrage",
+    "Shadow Barrage", "Annakarl Teleport", "Blood Barrage", "Ice Barrage", "Ghorrock Teleport",
+)
+
+SPELLBOOK_LUNAR = (
+    "Lunar Home Teleport", "Bake Pie", "Geomancy", "Cure Plant", "Monster Examine", "NPC Contact", "Cure Other",
+    "Humidify", "Moonclan Teleport", "Tele Group Moonclan", "Cure Me", "Ourania Teleport", "Hunter Kit", "Waterbirth Teleport",
+    "Tele Group Waterbirth", "Cure Group", "Stat Spy", "Barbarian Teleport", "Tele Group Barbarian", "Spin Flax", "Superglass Make",
+    "Tan Leather", "Khazard Teleport", "Tele Group Khazard", "Dream", "String Jewellery", "Stat Restore Pot Share", "Magic Imbue",
+    "Fertile Soil", "Boost Potion Share", "Fishing Guild Teleport", "Tele Group Fishing Guild", "Plank Make", "Catherby Teleport", "Tele Group Catherby",
+    "Recharge Dragonstone", "Ice Plateau Teleport", "Tele Group Ice Plateau", "Energy Transfer", "Heal Other", "Vengeance Other", "Vengeance",
+    "Heal Group", "Spellbook Swap",
+)
+
+SPELLBOOK_ARCEUUS = (
+    "Arceuus Home Teleport", "Arceuus Library Teleport", "Basic Reanimation", "Draynor Manor Teleport", "Battlefront Teleport", "Mind Altar Teleport",
+    "Respawn Teleport", "Ghostly Grasp", "Resurrect Lesser Ghost", "Resurrect Lesser Skeleton", "Resurrect Lesser Zombie", "Salve Graveyard Teleport",
+    "Adept Reanimation", "Inferior Demonbane", "Shadow Veil", "Fenkenstrain's Castle Teleport", "Dark Lure", "Skeletal Grasp",
+    "Resurrect Superior Ghost", "Resurrect Superior Skeleton", "Resurrect Superior Zombie", "Mark of Darkness", "West Ardougne Teleport", "Superior Demonbane",
+    "Lesser Corruption", "Harmony Island Teleport", "Vile Vigour", "Degrime", "Cemetery Teleport", "Expert Reanimation",
+    "Ward of Arceuus", "Resurrect Greater Ghost", "Resurrect Greater Skeleton", "Resurrect Greater Zombie", "Resurrect Crops", "Undead Grasp",
+    "Death Charge", "Dark Demonbane", "Barrows Teleport", "Demonic Offering", "Greater Corruption", "Master Reanimation",
+    "Ape Atoll Teleport", "Sinister Offering",
+)
+
+# https://i.imgur.com/KRmC3YB.png
+PRAYERS = (
+    "Thick Skin", "Burst of Strength", "Clarity of Thought", "Sharp Eye", "Mystic Will",
+    "Rock Skin", "Superhuman Strength", "Improved Reflexes", "Rapid Restore", "Rapid Heal",
+    "Protect Item", "Hawk Eye", "Mystic Lore", "Steel Skin", "Ultimate Strength",
+    "Incredible Reflexes", "Protect from Magic", "Protect from Missiles", "Protect from Melee", "Eagle Eye",
+    "Mystic Might", "Retribution", "Redemption", "Smite", "Preserve",
+    "Chivalry", "Piety", "Rigour", "Augury",
+)
+# fmt: on
+
+SPELLBOOKS: Dict[str, Tuple[str, ...]] = {
+    "normal": SPELLBOOK_NORMAL,
+    "ancient": SPELLBOOK_ANCIENT,
+    "lunar": SPELLBOOK_LUNAR,
+    "arceuus": SPELLBOOK_ARCEUUS,
+}
+
+__slots = {(book, name): i for book, names in SPELLBOOKS.items() for i, name in enumerate(names)}
+__slots.update({("prayers", name): i for i, name in enumerate(PRAYERS)})
+
+
+def slot_of(table: str, name: str) -> int:
+    """
+    Returns the slot index of a spell or prayer.
+    Args:
+        table: A spellbook ("normal", "ancient", "lunar" or "arceuus") or "prayers".
+        name: The spell or prayer name as shown in game (E.g., "Camelot Teleport", "Protect from Melee").
+    Raises:
+        KeyError: If there is no such spell or prayer.
+    """
+    try:
+        return __slots[(table, name)]
+    except KeyError:
+        raise KeyError(f"No '{name}' in the {table} slot table.") from None
+
+
+def sprite_name(name: str) -> str:
+    """
+    Returns the file name of a slot's sprite as saved by SpriteScraper (E.g., "Camelot_Teleport.png").
+    """
+    return f"{name.replace(' ', '_')}.png"
+
+
+if __name__ == "__main__":
+    # Fetches the sprites Window.verify_slots() checks against: python src/utilities/slot_tables.py fetch [table ...]
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+    import utilities.imagesearch as imsearch
+    from utilities.sprite_scraper import SpriteScraper
+
+    assert slot_of("normal", "Camelot Teleport") == 26
+    assert slot_of("prayers", "Protect from Melee") == 18
+    assert sprite_name("Protect from Melee") == "Protect_from_Melee.png"
+
+    if sys.argv[1:2] == ["fetch"]:
+        tables = sys.argv[2:] or ["normal", "prayers"]
+        for table in tables:
+            names = PRAYERS if table == "prayers" else SPELLBOOKS[table]
+            folder = imsearch.BOT_IMAGES.joinpath("prayers") if table == "prayers" else imsearch.BOT_IMAGES.joinpath("spellbooks", table)
+            SpriteScraper().search_and_download(", ".join(names), destination=folder)
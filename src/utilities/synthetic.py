@@ -0,0 +1,305 @@
+"""
+Renders synthetic game views for load testing the perception code without a live client.
+
+Frames contain a noisy terrain background, tagged outlines in the colors RuneLite's highlight plugins use,
+NPC HP bars and ground item text drawn with the bundled fonts. Resizable-mode frames also contain the minimap,
+chat and control panel overlays so that Rectangle.subtract_list is exercised.
+
+Serve frames to bots through SyntheticSource and capture.ReplayBackend:
+    source = SyntheticSource(generate_frame(tags={"pink": 10}))
+    capture.set_backend_factory(lambda: capture.ReplayBackend(source, clock=lambda: 0))
+
+Run this module to benchmark the detectors against increasing object counts and frame sizes.
+"""
+import random
+from typing import Dict, List, NamedTuple, Tuple
+
+import cv2
+import numpy as np
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+import utilities.capture as capture
+import utilities.color as clr
+import utilities.context_menu as menu
+import utilities.imagesearch as imsearch
+import utilities.ocr as ocr
+
+FIXED_GAME_VIEW = (517, 337)
+RESIZABLE_GAME_VIEWS = [(1000, 650), (1600, 900)]
+
+# Outline color and (min, max) object size in pixels for each tag type
+TAG_STYLES: Dict[str, Tuple[clr.Color, Tuple[int, int]]] = {
+    "cyan": (clr.CYAN, (25, 60)),  # NPCs
+    "pink": (clr.PINK, (45, 110)),  # Rocks, trees
+    "green": (clr.GREEN, (60, 180)),  # Agility obstacles
+    "purple": (clr.PURPLE, (20, 45)),  # Marks of grace, misc. objects
+}
+
+GROUND_ITEMS = ["Coins (25)", "Bones", "Iron ore", "Logs", "Raw shrimps", "Feather (5)", "Mark of grace"]
+
+
+class SyntheticFrame(NamedTuple):
+    """
+    A rendered game view.
+    Attributes:
+        image: The BGR image.
+        objects: The bounding boxes (x, y, w, h) of the rendered outlines for each tag type.
+        subtract_list: The UI overlays to exclude from the game view, in Rectangle.subtract_list format.
+    """
+
+    image: np.ndarray
+    objects: Dict[str, List[Tuple[int, int, int, int]]]
+    subtract_list: List[dict]
+
+
+def __terrain(rng: np.random.Generator, width: int, height: int, noise: float) -> np.ndarray:
+    """
+    Renders a smooth, muted background with per-pixel noise. Channel values stay below 170, so no background
+    pixel can match a tag color.
+    """
+    coarse = rng.integers(40, 140, size=(max(height // 40, 2), max(width // 40, 2), 3), dtype=np.uint8)
+    image = cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC).astype(np.int16)
+    if noise:
+        image += rng.normal(0, noise, size=image.shape).astype(np.int16)
+    return np.clip(image, 20, 170).astype(np.uint8)
+
+
+def __outline(rng: np.random.Generator, cx: int, cy: int, w: int, h: int) -> np.ndarray:
+    """
+    Creates an irregular closed polygon roughly filling a w x h box centered on (cx, cy).
+    """
+    n = int(rng.integers(8, 16))
+    angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+    radii = rng.uniform(0.75, 1.0, n)
+    xs = cx + np.cos(angles) * radii * w / 2
+    ys = cy + np.sin(angles) * radii * h / 2
+    return np.column_stack((xs, ys)).astype(np.int32)
+
+
+def __overlaps(box: Tuple[int, int, int, int], boxes: List[Tuple[int, int, int, int]], gap: int) -> bool:
+    x, y, w, h = box
+    return any(x < bx + bw + gap and bx < x + w + gap and y < by + bh + gap and by < y + h + gap for bx, by, bw, bh in boxes)
+
+
+def __draw_text(image: np.ndarray, text: str, x: int, y: int, font: dict, color: clr.Color) -> None:
+    """
+    Stamps text onto an image using the glyph masks of a bundled font.
+    """
+    bgr = color.lower.astype(np.uint8)
+    for char in text:
+        if char not in font:
+            continue
+        glyph = font[char]
+        h, w = glyph.shape[:2]
+        region = image[y : y + h, x : x + w]
+        if region.shape[:2] != (h, w):
+            return
+        region[glyph > 0] = bgr
+        x += w
+
+
+def __ui_overlays(image: np.ndarray) -> List[dict]:
+    """
+    Pastes the minimap, chat and control panel templates into the corners of a resizable game view.
+    Returns:
+        The pasted areas in Rectangle.subtract_list format.
+    """
+    height, width = image.shape[:2]
+    areas = []
+    templates = ["minimap.png", "chat.png", "inv.png"]
+    anchors = [("right", "top"), ("left", "bottom"), ("right", "bottom")]
+    for name, (h_anchor, v_anchor) in zip(templates, anchors):
+        template = cv2.imread(str(imsearch.BOT_IMAGES.joinpath("ui_templates", name)))
+        if template is None:
+            continue
+        th, tw = template.shape[:2]
+        left = width - tw if h_anchor == "right" else 0
+        top = height - th if v_anchor == "bottom" else 0
+        image[top : top + th, left : left + tw] = template
+        areas.append({"left": left, "top": top, "width": tw, "height": th})
+    return areas
+
+
+def generate_frame(
+    width: int = FIXED_GAME_VIEW[0],
+    height: int = FIXED_GAME_VIEW[1],
+    tags: Dict[str, int] = None,
+    hp_bars: int = 0,
+    ground_items: int = 0,
+    noise: float = 12.0,
+    resizable: bool = False,
+    seed: int = None,
+) -> SyntheticFrame:
+    """
+    Renders a synthetic game view.
+    Args:
+        width: The width of the game view.
+        height: The height of the game view.
+        tags: The number of outlines to draw for each tag type in TAG_STYLES (E.g., {"cyan": 5, "pink": 3}).
+        hp_bars: The number of cyan outlines (NPCs) to draw an HP bar above.
+        ground_items: The number of ground item labels to draw.
+        noise: The standard deviation of the per-pixel background noise.
+        resizable: Whether to draw the resizable-mode UI overlays (minimap, chat, control panel).
+        seed: Seed for repeatable frames.
+    Returns:
+        A SyntheticFrame. Objects that did not fit without overlapping are left out of the frame and its
+        objects list.
+    """
+    rng = np.random.default_rng(seed)
+    image = __terrain(rng, width, height, noise)
+    subtract_list = __ui_overlays(image) if resizable else []
+    # Keep objects clear of the overlays, just like the game world hides behind them
+    taken = [(a["left"], a["top"], a["width"], a["height"]) for a in subtract_list]
+    objects: Dict[str, List[Tuple[int, int, int, int]]] = {name: [] for name in TAG_STYLES}
+    for name, count in (tags or {}).items():
+        color, (min_size, max_size) = TAG_STYLES[name]
+        bgr = tuple(int(c) for c in color.lower)
+        for _ in range(count):
+            for _ in range(50):  # Placement attempts
+                w, h = (int(v) for v in rng.integers(min_size, max_size + 1, 2))
+                if w + 4 >= width or h + 16 >= height:
+                    break
+                x, y = int(rng.integers(2, width - w - 2)), int(rng.integers(12, height - h - 2))
+                if not __overlaps((x, y - 10, w, h + 10), taken, gap=6):
+                    cv2.polylines(image, [__outline(rng, x + w // 2, y + h // 2, w, h)], True, bgr, 2)
+                    taken.append((x, y - 10, w, h + 10))
+                    objects[name].append((x, y, w, h))
+                    break
+    for x, y, w, _ in objects["cyan"][:hp_bars]:
+        # HP bars are drawn in the 10px reserved above each object
+        bar_w = 30
+        bar_x = x + w // 2 - bar_w // 2
+        health = int(rng.integers(1, bar_w + 1))
+        image[y - 8 : y - 3, max(bar_x, 0) : bar_x + health] = clr.GREEN.lower
+        image[y - 8 : y - 3, max(bar_x + health, 0) : bar_x + bar_w] = clr.RED.lower
+    for _ in range(ground_items):
+        text = GROUND_ITEMS[int(rng.integers(len(GROUND_ITEMS)))]
+        text_w = sum(ocr.PLAIN_11[c].shape[1] for c in text if c in ocr.PLAIN_11)
+        for _ in range(50):
+            x, y = int(rng.integers(0, max(width - text_w, 1))), int(rng.integers(0, height - 14))
+            if not __overlaps((x, y, text_w, 14), taken, gap=2):
+                __draw_text(image, text, x, y, ocr.PLAIN_11, clr.WHITE)
+                taken.append((x, y, text_w, 14))
+                break
+    return SyntheticFrame(image, objects, subtract_list)
+
+
+def draw_context_menu(image: np.ndarray, x: int, y: int, entries: List[Tuple[str, str, clr.Color]]) -> Tuple[int, int, int, int]:
+    """
+    Draws a right-click menu the way the client does: a box filled with the menu color, a black header holding
+    "Choose Option" in the menu color, and a 1px black outline around the entries.
+    Args:
+        image: The BGR image to draw on.
+        x, y: The top-left corner of the menu.
+        entries: The (action, target, target color) of each row, top to bottom (E.g., ("Take", "Coins", clr.ORANGE)).
+    Returns:
+        The (x, y, w, h) of the menu.
+    """
+
+    def text_width(text: str) -> int:
+        return sum(ocr.BOLD_12[c].shape[1] for c in text if c in ocr.BOLD_12)
+
+    widths = [text_width(action + " " + target) for action, target, _ in entries] + [text_width("Choose Option")]
+    w = max(max(widths) + 8, menu.MIN_WIDTH)
+    h = menu.HEADER_HEIGHT + menu.ROW_HEIGHT * len(entries) + 3
+    bg, black = menu.MENU_BG.lower.astype(np.uint8), (0, 0, 0)
+    image[y : y + h, x : x + w] = bg
+    image[y + 1 : y + 17, x + 1 : x + w - 1] = black
+    cv2.rectangle(image, (x + 1, y + 18), (x + w - 2, y + h - 2), black, 1)
+    __draw_text(image, "Choose Option", x + 3, y + 2, ocr.BOLD_12, menu.MENU_BG)
+    for i, (action, target, color) in enumerate(entries):
+        top = y + menu.HEADER_HEIGHT + i * menu.ROW_HEIGHT + 1
+        __draw_text(image, action, x + 3, top, ocr.BOLD_12, clr.WHITE)
+        __draw_text(image, target, x + 3 + text_width(action + " "), top, ocr.BOLD_12, color)
+    return x, y, w, h
+
+
+class SyntheticSource(capture.FrameSource):
+    def __init__(self, frame: SyntheticFrame, left: int = 0, top: int = 0):
+        """
+        Serves a synthetic frame as if it were on screen at (left, top). Swap frames with set_frame().
+        """
+        self.left, self.top = left, top
+        self.set_frame(frame)
+
+    def set_frame(self, frame: SyntheticFrame) -> None:
+        self.frame = frame
+        h, w = frame.image.shape[:2]
+        self._regions = [(0.0, self.left, self.top, w, h)]
+
+    def regions(self) -> List[Tuple[float, int, int, int, int]]:
+        return self._regions
+
+    def image(self, index: int) -> np.ndarray:
+        return self.frame.image
+
+
+if __name__ == "__main__":
+    import statistics
+    import tempfile
+    import time
+
+    from model.osrs.agility import AgilityBot
+    from model.osrs.mining import OSRSMining
+    from model.runelite_bot import RuneLiteBot
+    import utilities.runelite_cv as rcv
+    from utilities.geometry import Rectangle
+
+    class _QuietController:
+        def update_log(self, msg, overwrite=False):
+            pass
+
+        def update_status(self):
+            pass
+
+        def update_progress(self):
+            pass
+
+        def clear_log(self):
+            pass
+
+    # Some detectors write debug images to the working directory
+    os.chdir(tempfile.mkdtemp(prefix="synthetic_"))
+    random.seed(0)
+
+    mining, agility = OSRSMining(), AgilityBot()
+    for bot in (mining, agility):
+        bot.set_controller(_QuietController())
+
+    source = SyntheticSource(generate_frame())
+    capture.set_backend_factory(lambda: capture.ReplayBackend(source, clock=lambda: 0.0))
+
+    detectors = {
+        "extract_objects": lambda gv: rcv.extract_objects(clr.isolate_colors(gv.screenshot(), clr.CYAN)),
+        "get_nearest_tagged_NPC": lambda gv: RuneLiteBot.get_nearest_tagged_NPC(mining),
+        "find_nearest_rock": lambda gv: mining.find_nearest_rock(),
+        "find_next_obstacle": lambda gv: agility.find_next_obstacle(),
+    }
+    sizes = [(*FIXED_GAME_VIEW, False)] + [(w, h, True) for w, h in RESIZABLE_GAME_VIEWS]
+    counts = [1, 5, 20, 50]
+    repeats = 10
+
+    print(f"{'frame':>16} {'objects':>8} " + " ".join(f"{name:>24}" for name in detectors))
+    for width, height, resizable in sizes:
+        for count in counts:
+            frame = generate_frame(width, height, {name: count for name in TAG_STYLES}, hp_bars=count // 2, ground_items=count, resizable=resizable, seed=count)
+            source.set_frame(frame)
+            game_view = Rectangle(0, 0, width, height)
+            game_view.subtract_list = frame.subtract_list
+            for bot in (mining, agility):
+                bot.win.game_view = game_view
+            row = []
+            for detect in detectors.values():
+                times = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    detect(game_view)
+                    times.append(time.perf_counter() - start)
+                row.append(statistics.median(times) * 1000)
+            found = sum(len(v) for v in frame.objects.values())
+            print(f"{f'{width}x{height}':>16} {found:>8} " + " ".join(f"{ms:>21.2f} ms" for ms in row))
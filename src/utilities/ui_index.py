@@ -0,0 +1,214 @@
+"""
+A spatial index of the client's UI elements, answering "what is at this point?" in constant time.
+
+Elements are named Rectangles (E.g., "inventory:3", "spell:Camelot Teleport", "run_orb"). The part of a name
+before the colon is its group. The index buckets every element into the cells of a coarse grid, so a lookup only
+tests the handful of elements overlapping the point's cell instead of every Rectangle on screen. Buckets are
+sorted by area, so the most specific element at a point wins (an inventory slot over the control panel over the
+game view).
+
+The Window builds an index when it is initialized and makes it the active one, so clicks can be labelled with
+the elements they landed on (see labels()) without a reference to the Window.
+"""
+import collections
+from typing import Dict, Iterable, List, Optional, Tuple
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path[0] = os.path.dirname(sys.path[0])
+
+from utilities.geometry import Point, Rectangle
+
+CELL_SIZE = 32  # Pixels
+
+__active: Optional["UIIndex"] = None
+
+
+def active() -> Optional["UIIndex"]:
+    """
+    Returns the index of the most recently initialized Window, or None.
+    """
+    return __active
+
+
+def set_active(index: Optional["UIIndex"]) -> None:
+    """
+    Makes an index the one used by labels().
+    """
+    global __active
+    __active = index
+
+
+def labels(point: Tuple[int, int]) -> List[str]:
+    """
+    Names every UI element at a point using the active index, smallest first. Elements of the control panel's
+    tabs overlap, so a point there is labelled with the inventory slot, prayer and spell under it alike.
+    Returns an empty list if there is no active index.
+    """
+    return __active.all_at(point) if __active is not None else []
+
+
+def group_of(name: str) -> str:
+    """
+    Returns the group of an element name (E.g., "inventory" for "inventory:3").
+    """
+    return name.partition(":")[0]
+
+
+class UIIndex:
+    def __init__(self, cell_size: int = CELL_SIZE):
+        """
+        Creates an empty index.
+        Args:
+            cell_size: The side length of the grid cells in pixels. Cells smaller than the smallest elements
+                       gain nothing; much larger cells put more elements in each bucket.
+        """
+        self.cell_size = cell_size
+        self.__rects: Dict[str, Rectangle] = {}
+        self.__cells: Dict[Tuple[int, int], List[Tuple[int, str, Rectangle]]] = collections.defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.__rects)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__rects
+
+    def add(self, name: str, rect: Rectangle) -> None:
+        """
+        Adds a UI element. Adding a name again replaces the element.
+        Args:
+            name: The element name, optionally prefixed by its group and a colon (E.g., "prayer:Piety").
+            rect: The element's Rectangle on screen.
+        """
+        if rect is None:
+            return
+        if name in self.__rects:
+            self.remove(name)
+        self.__rects[name] = rect
+        entry = (rect.width * rect.height, name, rect)
+        for cell in self.__cells_of(rect):
+            bucket = self.__cells[cell]
+            bucket.append(entry)
+            bucket.sort(key=lambda e: e[0])
+
+    def add_all(self, group: str, rects: Iterable[Rectangle], names: Iterable[str] = None) -> None:
+        """
+        Adds a list of UI elements as "group:name".
+        Args:
+            group: The group of the elements.
+            rects: The elements' Rectangles.
+            names: A name for each Rectangle. Elements are named by their index if omitted (or if a name is
+                   missing).
+        """
+        names = list(names or [])
+        for i, rect in enumerate(rects):
+            self.add(f"{group}:{names[i] if i < len(names) else i}", rect)
+
+    def remove(self, name: str) -> None:
+        """
+        Removes a UI element, if present.
+        """
+        rect = self.__rects.pop(name, None)
+        if rect is None:
+            return
+        for cell in self.__cells_of(rect):
+            self.__cells[cell] = [e for e in self.__cells[cell] if e[1] != name]
+
+    def clear(self) -> None:
+        """
+        Removes all UI elements.
+        """
+        self.__rects.clear()
+        self.__cells.clear()
+
+    def rect(self, name: str) -> Optional[Rectangle]:
+        """
+        Returns the Rectangle of a UI element by name, or None if there is no such element.
+        """
+        return self.__rects.get(name)
+
+    def names(self, group: str = None) -> List[str]:
+        """
+        Returns the names of all UI elements, or only those in a group.
+        """
+        return [name for name in self.__rects if group is None or group_of(name) == group]
+
+    def at(self, point: Tuple[int, int], skip: Iterable[str] = ()) -> Optional[str]:
+        """
+        Names the smallest UI element at a point.
+        Args:
+            point: The screen position.
+            skip: Groups to ignore (E.g., the contents of control panel tabs that are not open).
+        Returns:
+            The element name, or None if nothing is at the point.
+        """
+        for name in self.__hits(point, skip):
+            return name
+        return None
+
+    def all_at(self, point: Tuple[int, int], skip: Iterable[str] = ()) -> List[str]:
+        """
+        Names every UI element at a point, smallest first.
+        """
+        return list(self.__hits(point, skip))
+
+    def __hits(self, point: Tuple[int, int], skip: Iterable[str]):
+        x, y = point[0], point[1]
+        bucket = self.__cells.get((x // self.cell_size, y // self.cell_size))
+        if not bucket:
+            return
+        skip = set(skip)
+        for _, name, rect in bucket:
+            if skip and group_of(name) in skip:
+                continue
+            if _contains(rect, x, y):
+                yield name
+
+    def __cells_of(self, rect: Rectangle):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.left + rect.width - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.top + rect.height - 1) // size + 1):
+                yield cx, cy
+
+
+def _contains(rect: Rectangle, x: int, y: int) -> bool:
+    """
+    Checks whether a point is inside a Rectangle and outside all of its subtracted areas.
+    """
+    left, top = rect.left, rect.top
+    if not (left <= x < left + rect.width and top <= y < top + rect.height):
+        return False
+    for area in rect.subtract_list:
+        if area["left"] <= x - left < area["left"] + area["width"] and area["top"] <= y - top < area["top"] + area["height"]:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    # Compare lookups against scanning the Window lists on a typical fixed-mode layout
+    import random
+    import time
+
+    index = UIIndex()
+    index.add("game_view", Rectangle(4, 4, 517, 337))
+    index.add("control_panel", Rectangle(528, 168, 241, 334))
+    inventory = Rectangle.grid(568, 212, 36, 32, columns=4, rows=7, gap_x=6, gap_y=4)
+    prayers = Rectangle.grid(558, 214, 34, 34, columns=5, rows=6, gap_x=3, gap_y=3, count=29)
+    spells = Rectangle.grid(558, 205, 22, 22, columns=7, rows=10, gap_x=4, gap_y=2)
+    index.add_all("inventory", inventory)
+    index.add_all("prayer", prayers)
+    index.add_all("spell", spells)
+    points = [Point(random.randint(0, 780), random.randint(0, 510)) for _ in range(20000)]
+
+    start = time.perf_counter()
+    for p in points:
+        index.at(p, skip=("prayer", "spell"))
+    indexed = time.perf_counter() - start
+    start = time.perf_counter()
+    for p in points:
+        next((i for rects in (inventory, prayers, spells) for i, r in enumerate(rects) if _contains(r, *p)), None)
+    scanned = time.perf_counter() - start
+    print(f"{len(index)} elements, {len(points)} lookups")
+    print(f"Index: {indexed / len(points) * 1e6:.2f} us/lookup. Scan: {scanned / len(points) * 1e6:.2f} us/lookup.")
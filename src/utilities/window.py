@@ -8,13 +8,16 @@ At the moment, it only works for 2007-style interfaces. In the future, to accomo
 styles, this class should be abstracted, then extended for each interface style.
 """
 import time
-from typing import List
+from typing import Dict, List
 
 import pywinctl
 from deprecated import deprecated
 
+import utilities.capture as capture
 import utilities.debug as debug
 import utilities.imagesearch as imsearch
+import utilities.slot_tables as slot_tables
+import utilities.ui_index as ui_index
 from utilities.geometry import Point, Rectangle
 
 
@@ -63,6 +66,16 @@ class Window:
     mouseover: Rectangle = None
     total_xp: Rectangle = None
 
+    # Every Rectangle above, by name and by position. Built by initialize().
+    ui_elements: ui_index.UIIndex = None
+    CP_CONTENTS = ("inventory", "prayer", "spell")  # Index groups that share the control panel
+
+    # Slot groups that verify_slots() can check: (Window list, slot table, sprite folder within images/bot)
+    SLOT_GROUPS = {
+        "spell": ("spellbook_normal", slot_tables.SPELLBOOK_NORMAL, ("spellbooks", "normal")),
+        "prayer": ("prayers", slot_tables.PRAYERS, ("prayers",)),
+    }
+
     def __init__(self, window_title: str, padding_top: int, padding_left: int) -> None:
         """
         Creates a Window object with various methods for interacting with the client window.
@@ -74,8 +87,12 @@ class Window:
         self.window_title = window_title
         self.padding_top = padding_top
         self.padding_left = padding_left
+        self.__misplaced_slots: Dict[str, List[str]] = {}
 
     def _get_window(self):
+        # Backends that replay recorded sessions provide the recorded client instead of a desktop window
+        if client := capture.get_backend().find_window(self.window_title):
+            return client
         self._client = pywinctl.getWindowsWithTitle(self.window_title)
         if self._client:
             return self._client[0]
@@ -129,16 +146,141 @@ class Window:
             True if successful, False otherwise along with an error message.
         """
         start_time = time.time()
+        self.__misplaced_slots = {}
         client_rect = self.rectangle()
         a = self.__locate_minimap(client_rect)
         b = self.__locate_chat(client_rect)
         c = self.__locate_control_panel(client_rect)
         d = self.__locate_game_view(client_rect)
         if all([a, b, c, d]):  # if all templates found
+            self.__build_ui_index()
             print(f"Window.initialize() took {time.time() - start_time} seconds.")
             return True
         raise WindowInitializationError()
 
+    def __build_ui_index(self) -> None:
+        """
+        Indexes the located UI regions by name and position, and makes the index the active one for labelling clicks.
+        """
+        index = ui_index.UIIndex()
+        for name in ("game_view", "control_panel", "chat", "minimap_area", "minimap", "mouseover", "total_xp", "compass_orb"):
+            index.add(name, getattr(self, name))
+        for orb in ("hp", "prayer", "run", "spec"):
+            index.add(f"{orb}_orb_text", getattr(self, f"{orb}_orb_text"))
+            if orb != "hp":
+                index.add(f"{orb}_orb", getattr(self, f"{orb}_orb"))
+        index.add_all("cp_tab", self.cp_tabs)
+        index.add_all("chat_tab", self.chat_tabs)
+        index.add_all("inventory", self.inventory_slots)
+        index.add_all("prayer", self.prayers, slot_tables.PRAYERS)
+        index.add_all("spell", self.spellbook_normal, slot_tables.SPELLBOOK_NORMAL)
+        self.ui_elements = index
+        ui_index.set_active(index)
+
+    def element_at(self, point: Point, tab: str = "inventory") -> str:
+        """
+        Names the UI element at a point (E.g., "inventory:3", "spell:Camelot Teleport", "run_orb", "game_view").
+        Args:
+            point: The screen position.
+            tab: Which of the control panel's contents to consider open: "inventory", "prayer" or "spell".
+        Returns:
+            The element name, or None if the point is not on a located UI element.
+        """
+        return self.ui_elements.at(point, skip=[group for group in self.CP_CONTENTS if group != tab])
+
+    def element(self, name: str) -> Rectangle:
+        """
+        Returns the Rectangle of a UI element by the name element_at() gives it, or None if there is no such element.
+        """
+        return self.ui_elements.rect(name)
+
+    def spell(self, name: str) -> Rectangle:
+        """
+        Returns the Rectangle of a spell in the normal spellbook.
+        Args:
+            name: The spell name as shown in game (E.g., "Camelot Teleport"). See slot_tables.SPELLBOOK_NORMAL.
+        """
+        return self.spellbook_normal[slot_tables.slot_of("normal", name)]
+
+    def prayer(self, name: str) -> Rectangle:
+        """
+        Returns the Rectangle of a prayer in the prayer book.
+        Args:
+            name: The prayer name as shown in game (E.g., "Protect from Melee"). See slot_tables.PRAYERS.
+        """
+        return self.prayers[slot_tables.slot_of("prayers", name)]
+
+    def verify_slots(self, group: str = "spell") -> List[str]:
+        """
+        Checks that the named slots of an interface hold what the slot tables say they do, by searching for each
+        slot's sprite (E.g., images/bot/spellbooks/normal/Camelot_Teleport.png) around its Rectangle. The interface
+        must be open. Sprites are fetched with `python src/utilities/slot_tables.py fetch`.
+        Once at least one sprite is found, the result is kept until the next initialize() and later calls return it.
+        If none is found (no sprites are saved, or the interface was closed), nothing is kept and the next call checks
+        again.
+        Args:
+            group: "spell" (the normal spellbook) or "prayer".
+        Returns:
+            The names of the slots that could not be verified, either because their sprite is not saved or because it
+            was not found in the slot. Until a sprite is saved, every slot is returned.
+        """
+        if group in self.__misplaced_slots:
+            return self.__misplaced_slots[group]
+        attr, names, _ = self.SLOT_GROUPS[group]
+        cp_img = self.control_panel.screenshot()
+        found, unverified = 0, []
+        for name, rect in zip(names, getattr(self, attr)):
+            if self.__find_in_slot(group, name, rect, cp_img) is None:
+                unverified.append(name)
+            else:
+                found += 1
+        print(f"Window.verify_slots(): Verified {found} of {len(names)} {group} slots.")
+        if found:
+            self.__misplaced_slots[group] = unverified
+        return unverified
+
+    def locate_slot(self, group: str, name: str) -> Rectangle:
+        """
+        Finds a named slot by its sprite, first in the slot the slot tables give it, then anywhere in the control
+        panel (E.g., when the spellbook is filtered and spells have moved). The interface must be open.
+        Args:
+            group: "spell" (the normal spellbook) or "prayer".
+            name: The slot name as shown in game (E.g., "Camelot Teleport").
+        Returns:
+            The Rectangle of the sprite on screen, or None if its sprite is not saved or it was not found.
+        """
+        attr, names, folder = self.SLOT_GROUPS[group]
+        sprite = imsearch.BOT_IMAGES.joinpath(*folder, slot_tables.sprite_name(name))
+        if not sprite.exists():
+            return None
+        cp_img = self.control_panel.screenshot()
+        rect = self.__find_in_slot(group, name, getattr(self, attr)[names.index(name)], cp_img)
+        if rect is None:
+            rect = imsearch.search_img_in_rect(sprite, self.control_panel)
+        return rect
+
+    def __find_in_slot(self, group: str, name: str, rect: Rectangle, cp_img) -> Rectangle:
+        """
+        Searches for a slot's sprite a few pixels around the slot's Rectangle, since sprites are not always centered.
+        Args:
+            group: "spell" (the normal spellbook) or "prayer".
+            name: The slot name.
+            rect: The slot's Rectangle.
+            cp_img: A screenshot of the control panel.
+        Returns:
+            The Rectangle of the sprite on screen, or None if its sprite is not saved or it was not found.
+        """
+        sprite = imsearch.BOT_IMAGES.joinpath(*self.SLOT_GROUPS[group][2], slot_tables.sprite_name(name))
+        if not sprite.exists():
+            return None
+        left, top = max(rect.left - self.control_panel.left - 8, 0), max(rect.top - self.control_panel.top - 8, 0)
+        slot_img = cp_img[top : top + rect.height + 16, left : left + rect.width + 16]
+        found = imsearch.search_img_in_rect(sprite, slot_img)
+        if found is None:
+            return None
+        left, top = self.control_panel.left + left + found.left, self.control_panel.top + top + found.top
+        return Rectangle(left=left, top=top, width=found.width, height=found.height)
+
     def __locate_chat(self, client_rect: Rectangle) -> bool:
         """
         Locates the chat area on the client.
@@ -197,48 +339,23 @@ class Window:
         """
         Creates Rectangles for each inventory slot relative to the control panel, storing it in the class property.
         """
-        self.inventory_slots = []
-        slot_w, slot_h = 36, 32  # dimensions of a slot
-        gap_x, gap_y = 6, 4  # pixel gap between slots
-        y = 44 + cp.top  # start y relative to cp template
-        for _ in range(7):
-            x = 40 + cp.left  # start x relative to cp template
-            for _ in range(4):
-                self.inventory_slots.append(Rectangle(left=x, top=y, width=slot_w, height=slot_h))
-                x += slot_w + gap_x
-            y += slot_h + gap_y
+        # 36x32 slots with a 6x4 pixel gap, starting at (40, 44) relative to the cp template
+        self.inventory_slots = Rectangle.grid(cp.left + 40, cp.top + 44, 36, 32, columns=4, rows=7, gap_x=6, gap_y=4)
 
     def __locate_prayers(self, cp: Rectangle) -> None:
         """
         Creates Rectangles for each prayer in the prayer book menu relative to the control panel, storing it in the class property.
         """
-        self.prayers = []
-        slot_w, slot_h = 34, 34  # dimensions of the prayers
-        gap_x, gap_y = 3, 3  # pixel gap between prayers
-        y = 46 + cp.top  # start y relative to cp template
-        for _ in range(6):
-            x = 30 + cp.left  # start x relative to cp template
-            for _ in range(5):
-                self.prayers.append(Rectangle(left=x, top=y, width=slot_w, height=slot_h))
-                x += slot_w + gap_x
-            y += slot_h + gap_y
-        del self.prayers[29]  # remove the last prayer (unused)
+        # 34x34 prayers with a 3x3 pixel gap, starting at (30, 46) relative to the cp template. The last cell is unused.
+        self.prayers = Rectangle.grid(cp.left + 30, cp.top + 46, 34, 34, columns=5, rows=6, gap_x=3, gap_y=3, count=29)
 
     def __locate_spells(self, cp: Rectangle) -> None:
         """
         Creates Rectangles for each magic spell relative to the control panel, storing it in the class property.
         Currently only populates the normal spellbook spells.
         """
-        self.spellbook_normal = []
-        slot_w, slot_h = 22, 22  # dimensions of a spell
-        gap_x, gap_y = 4, 2  # pixel gap between spells
-        y = 37 + cp.top  # start y relative to cp template
-        for _ in range(10):
-            x = 30 + cp.left  # start x relative to cp template
-            for _ in range(7):
-                self.spellbook_normal.append(Rectangle(left=x, top=y, width=slot_w, height=slot_h))
-                x += slot_w + gap_x
-            y += slot_h + gap_y
+        # 22x22 spells with a 4x2 pixel gap, starting at (30, 37) relative to the cp template
+        self.spellbook_normal = Rectangle.grid(cp.left + 30, cp.top + 37, 22, 22, columns=7, rows=10, gap_x=4, gap_y=2)
 
     def __locate_game_view(self, client_rect: Rectangle) -> bool:
         """
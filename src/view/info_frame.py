@@ -119,6 +119,17 @@ class InfoFrame(customtkinter.CTkFrame):
         self.btn_stop.bind("<Enter>", lambda event: self.btn_stop.configure(text=f"{settings.keybind_to_text(self.combination_keys)}"))
         self.btn_stop.bind("<Leave>", lambda event: self.btn_stop.configure(text="Stop"))
 
+        # Takes the options button's place while the bot is running or paused
+        self.btn_pause = customtkinter.CTkButton(
+            master=self.btn_frame,
+            text="Pause",
+            font=button_med_font(),
+            text_color="white",
+            fg_color="#616161",
+            hover_color="#4f4f4f",
+            command=self.pause_btn_clicked,
+        )
+
         self.btn_options = customtkinter.CTkButton(
             master=self.btn_frame,
             text="Options",
@@ -182,6 +193,12 @@ class InfoFrame(customtkinter.CTkFrame):
     def stop_btn_clicked(self):
         self.controller.stop()
 
+    def pause_btn_clicked(self):
+        if self.status == "paused":
+            self.controller.resume()
+        else:
+            self.controller.pause()
+
     def options_btn_clicked(self):
         """
         Creates a new TopLevel view to display bot options.
@@ -224,7 +241,7 @@ class InfoFrame(customtkinter.CTkFrame):
         self.current_keys.add(key)
         if all(k in self.current_keys for k in self.combination_keys) and not self.pressed:
             self.pressed = True
-            if self.status == "running":
+            if self.status in ("running", "paused"):
                 self.controller.stop()
             elif self.status == "stopped":
                 self.controller.play()
@@ -242,12 +259,22 @@ class InfoFrame(customtkinter.CTkFrame):
         self.btn_options.configure(state=tkinter.DISABLED)
         self.btn_play.grid_forget()
         self.btn_stop.grid(row=1, column=0, pady=(0, 15), sticky="nsew")
+        self.btn_options.grid_forget()
+        self.btn_pause.configure(text="Pause")
+        self.btn_pause.grid(row=2, column=0, pady=0, sticky="nsew")
         self.lbl_status.configure(text="Status: Running")
         self.status = "running"
 
+    def update_status_paused(self):
+        self.btn_pause.configure(text="Resume")
+        self.lbl_status.configure(text="Status: Paused")
+        self.status = "paused"
+
     def update_status_stopped(self):
         self.__toggle_buttons(True)
         self.btn_stop.grid_forget()
+        self.btn_pause.grid_forget()
+        self.btn_options.grid(row=2, column=0, pady=0, sticky="nsew")
         self.btn_play.grid(row=1, column=0, pady=(0, 15), sticky="nsew")
         self.lbl_status.configure(text="Status: Stopped")
         self.status = "stopped"
@@ -1,3 +1,4 @@
+import queue
 import tkinter
 
 import customtkinter
@@ -6,11 +7,18 @@ from view.fonts.fonts import *
 
 
 class OutputLogFrame(customtkinter.CTkFrame):
+    FLUSH_INTERVAL_MS = 100
+    MAX_LINES = 1000
+    __CLEAR = object()
+
     def __init__(self, parent):
         """
-        Creates a 2x1 frame with a text box for outputting log messages.
+        Creates a 2x1 frame with a text box for outputting log messages. Messages may be posted from any thread;
+        they are queued and written to the text box in batches from the Tk event loop, keeping the last
+        MAX_LINES lines.
         """
         super().__init__(parent)
+        self.__pending = queue.SimpleQueue()
 
         # configure grid layout (1x1)
         self.rowconfigure(0, weight=0)
@@ -50,27 +58,65 @@ class OutputLogFrame(customtkinter.CTkFrame):
         self.txt_log.configure(yscrollcommand=self.scrollbar.set)
 
         self.controller = None
+        self.after(self.FLUSH_INTERVAL_MS, self.__flush)
 
     def set_controller(self, controller):
         self.controller = controller
 
     def update_log(self, msg, overwrite=False):
         """
-        Called from controller. Updates the log with given message. If overwrite is True,
-        the last line will be cleared before the message is added.
+        Called from controller. Queues the message to be added to the log. If overwrite is True,
+        the last line will be cleared before the message is added. Never blocks.
         """
-        self.txt_log.configure(state=tkinter.NORMAL)
-        if overwrite:
-            self.txt_log.delete("end-1c linestart", "end")
-        self.txt_log.insert(tkinter.END, "\n" + msg)
-        self.txt_log.configure(state=tkinter.DISABLED)
-        self.txt_log.see(tkinter.END)
+        self.__pending.put((msg, overwrite))
 
     def clear_log(self):
         """
-        Called from controller. Clears the log.
+        Called from controller. Queues a request to clear the log.
         """
-        self.txt_log.configure(state=tkinter.NORMAL)
-        self.txt_log.delete(1.0, tkinter.END)
-        self.txt_log.configure(state=tkinter.DISABLED)
-        self.txt_log.see(tkinter.END)
+        self.__pending.put(self.__CLEAR)
+
+    def __flush(self):
+        """
+        Writes all queued messages to the text box in a single edit, then reschedules itself.
+        """
+        try:
+            lines, clear = self.__drain()
+            if lines or clear:
+                self.txt_log.configure(state=tkinter.NORMAL)
+                if clear:
+                    self.txt_log.delete(1.0, tkinter.END)
+                elif lines[0][1]:
+                    self.txt_log.delete("end-1c linestart", "end")
+                self.txt_log.insert(tkinter.END, "".join("\n" + msg for msg, _ in lines))
+                excess = int(self.txt_log.index("end-1c").split(".")[0]) - self.MAX_LINES
+                if excess > 0:
+                    self.txt_log.delete(1.0, f"{excess + 1}.0")
+                self.txt_log.configure(state=tkinter.DISABLED)
+                self.txt_log.see(tkinter.END)
+        finally:
+            self.after(self.FLUSH_INTERVAL_MS, self.__flush)
+
+    def __drain(self):
+        """
+        Empties the queue, applying overwrites and clears so that only the lines that would remain are returned.
+        Returns:
+            A list of (msg, overwrite) tuples and whether the log must be cleared first. Only the first tuple's
+            overwrite flag still needs to be applied to the text box.
+        """
+        lines, clear = [], False
+        while True:
+            try:
+                item = self.__pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is self.__CLEAR:
+                lines, clear = [], True
+            elif item[1] and lines:
+                lines[-1] = (item[0], lines[-1][1])
+            else:
+                lines.append(item)
+        if len(lines) > self.MAX_LINES:
+            # Lines that would be trimmed right away are never inserted
+            lines = [(msg, False) for msg, _ in lines[-self.MAX_LINES :]]
+        return lines, clear